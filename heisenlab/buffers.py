@@ -0,0 +1,228 @@
+"""
+Projeto de tampões: quantidades de ácido e base conjugada para atingir um
+pH alvo com concentração total ou capacidade tamponante especificada.
+
+Henderson-Hasselbalch dá o chute inicial; o refinamento resolve o equilíbrio
+completo (todas as etapas de protonação, Kw e força iônica) para todo o
+catálogo de uma vez, como linhas de um único sistema em lote.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+
+from .calculations import (
+    ACID_THERMODYNAMICS,
+    calculate_molar_mass,
+    calculate_pka_from_ka,
+    dilution_c1v1_c2v2,
+    kw_at_temperature,
+    pka_at_temperature,
+)
+from .equilibrium import acid_base_system, solve_equilibrium
+
+LN10 = math.log(10)
+
+
+@dataclass(frozen=True)
+class BufferSystem:
+    """
+    Par ácido/base conjugada de um sistema (poli)prótico.
+
+    step: índice do pKa do par (0 = primeira desprotonação).
+    top_charge: carga da forma totalmente protonada (0 para HₙA, +1 para
+        aminas como Tris-H⁺). Contraíons (Na⁺/Cl⁻) completam os sais.
+    pkas: pKa a 25 °C de todas as etapas; None usa ACID_THERMODYNAMICS[name]
+        (com dependência de temperatura).
+    """
+    name: str
+    acid_formula: str
+    base_formula: str
+    step: int = 0
+    top_charge: int = 0
+    pkas: Tuple[float, ...] | None = None
+
+    def pkas_at(self, temperature: float) -> np.ndarray:
+        if self.pkas is not None:
+            return np.asarray(self.pkas, dtype=float)
+        return np.atleast_1d(pka_at_temperature(self.name, temperature))
+
+    @property
+    def acid_charge(self) -> int:
+        return self.top_charge - self.step
+
+
+BUFFER_CATALOGUE: Dict[str, BufferSystem] = {}
+
+
+def register_buffer(name: str, acid_formula: str, base_formula: str, step: int = 0,
+                    top_charge: int = 0, pkas: Sequence[float] | None = None,
+                    kas: Sequence[float] | None = None) -> BufferSystem:
+    """
+    Adiciona um par ao catálogo. Informe pkas ou kas (convertidos com
+    calculate_pka_from_ka); sem nenhum dos dois, o nome deve existir em
+    ACID_THERMODYNAMICS.
+    """
+    if kas is not None:
+        pkas = [calculate_pka_from_ka(ka) for ka in kas]
+    if pkas is None and name not in ACID_THERMODYNAMICS:
+        raise ValueError(f"Informe os pKa de {name}")
+    n_steps = len(pkas) if pkas is not None else len(ACID_THERMODYNAMICS[name])
+    if not 0 <= step < n_steps:
+        raise ValueError("Etapa fora do número de pKa do sistema")
+    # As massas molares são validadas já no cadastro
+    calculate_molar_mass(acid_formula)
+    calculate_molar_mass(base_formula)
+    system = BufferSystem(name, acid_formula, base_formula, step, top_charge,
+                          tuple(float(p) for p in pkas) if pkas is not None else None)
+    BUFFER_CATALOGUE[name] = system
+    return system
+
+
+register_buffer("formiato", "HCOOH", "HCOONa")
+register_buffer("acetato", "CH3COOH", "CH3COONa")
+register_buffer("citrato", "Na2C6H6O7", "Na3C6H5O7", step=2)
+register_buffer("MES", "C6H13NO4S", "C6H12NNaO4S")
+register_buffer("fosfato", "NaH2PO4", "Na2HPO4", step=1)
+register_buffer("MOPS", "C7H15NO4S", "C7H14NNaO4S")
+register_buffer("HEPES", "C8H18N2O4S", "C8H17N2NaO4S")
+register_buffer("Tris", "C4H11NO3·HCl", "C4H11NO3", top_charge=1)
+register_buffer("borato", "H3BO3", "NaB(OH)4")
+register_buffer("amônio", "NH4Cl", "NH3", top_charge=1)
+register_buffer("glicina", "C2H5NO2", "C2H4NNaO2", step=1, top_charge=1)
+register_buffer("carbonato", "NaHCO3", "Na2CO3", step=1)
+
+
+def design_buffer(target_ph: float, final_volume: float, total_concentration: float | None = None,
+                  buffer_capacity: float | None = None, systems: Iterable[str] | None = None,
+                  stock_concentration: float | Tuple[float, float] | None = None,
+                  temperature: float = 25.0, activity_model: str = "davies",
+                  background_ionic_strength: float = 0.0, tolerance: float = 1e-6,
+                  max_iterations: int = 50) -> dict:
+    """
+    Calcula quanto de cada forma (ácida/básica) usar para um pH alvo.
+
+    Informe total_concentration (mol/L do par) OU buffer_capacity (β alvo,
+    mol·L⁻¹·pH⁻¹). final_volume em L. systems restringe a busca a nomes de
+    BUFFER_CATALOGUE (padrão: todos). stock_concentration (mol/L, único ou
+    (ácido, base)) acrescenta os volumes de solução estoque via C1V1 = C2V2.
+
+    Retorna os sistemas ordenados (viáveis primeiro, maior β por mol/L do
+    par), com pKa na temperatura, razão base/ácido de Henderson-Hasselbalch
+    e refinada, concentrações, mols, massas (g), β, força iônica e pH obtido.
+    """
+    if (total_concentration is None) == (buffer_capacity is None):
+        raise ValueError("Informe a concentração total OU a capacidade tamponante")
+    if final_volume <= 0:
+        raise ValueError("Volume final deve ser positivo")
+    if (total_concentration or buffer_capacity) <= 0:
+        raise ValueError("Concentração/capacidade deve ser positiva")
+    names = list(systems) if systems is not None else list(BUFFER_CATALOGUE)
+    unknown = [name for name in names if name not in BUFFER_CATALOGUE]
+    if unknown:
+        raise ValueError(f"Sistema tampão desconhecido: {unknown[0]}")
+    if not names:
+        raise ValueError("Nenhum sistema tampão selecionado")
+    buffers = [BUFFER_CATALOGUE[name] for name in names]
+
+    # Todo o catálogo em um único sistema: cada linha só tem total no seu tampão
+    pkas = {b.name: b.pkas_at(temperature) for b in buffers}
+    equilibrium = acid_base_system(pkas, kw_at_temperature(temperature),
+                                   {b.name: b.top_charge - len(pkas[b.name]) for b in buffers})
+    rows = np.arange(len(buffers))
+    member = np.stack([equilibrium.stoichiometry[:, equilibrium.component_index(b.name)] for b in buffers])
+    protons = equilibrium.stoichiometry[:, equilibrium.component_index("H+")]
+    h_index = equilibrium.species_index("H+")
+    oh_index = equilibrium.species_index("OH-")
+
+    pka_pair = np.array([pkas[b.name][b.step] for b in buffers])
+    acid_protons = np.array([len(pkas[b.name]) - b.step for b in buffers], dtype=float)
+    acid_charge = np.abs([b.acid_charge for b in buffers]).astype(float)
+    base_charge = np.abs([b.acid_charge - 1 for b in buffers]).astype(float)
+
+    # Henderson-Hasselbalch: fração da forma básica
+    hh_ratio = 10.0 ** (target_ph - pka_pair)
+    fraction = hh_ratio / (1 + hh_ratio)
+    concentration = np.full(len(buffers), float(total_concentration or buffer_capacity / (LN10 * 0.25)))
+
+    for iteration in range(max_iterations):
+        totals = {b.name: np.where(rows == i, concentration, 0.0) for i, b in enumerate(buffers)}
+        totals["H+"] = concentration * (acid_protons - fraction)
+        spectators = 0.5 * concentration * ((1 - fraction) * acid_charge + fraction * base_charge)
+        result = solve_equilibrium(equilibrium, totals, activity_model=activity_model,
+                                   background_ionic_strength=spectators + background_ionic_strength,
+                                   temperature=temperature)
+        c = result["concentrations"]
+        # β = ln10·([H+] + [OH-] + C·var(n)), n = prótons ligados ao tampão
+        bound = c * member
+        mean_n = bound @ protons / concentration
+        variance = bound @ protons ** 2 / concentration - mean_n ** 2
+        water = LN10 * (c[:, h_index] + c[:, oh_index])
+        capacity = water + LN10 * concentration * variance
+        ph = result["ph"]
+
+        ph_error = target_ph - ph
+        capacity_error = 0.0 if buffer_capacity is None else (buffer_capacity - capacity) / buffer_capacity
+        # Linhas presas em f = 0 ou 1 não alcançam o pH alvo (inviáveis)
+        pinned = ((fraction <= 0) & (ph_error < 0)) | ((fraction >= 1) & (ph_error > 0))
+        done = pinned | ((np.abs(ph_error) <= tolerance) & (np.abs(capacity_error) <= tolerance))
+        if np.all(done):
+            break
+        # dpH/df = C/β (adicionar forma básica equivale a adicionar base forte)
+        fraction = np.clip(fraction + ph_error * capacity / concentration, 0.0, 1.0)
+        if buffer_capacity is not None:
+            concentration = concentration * np.maximum(buffer_capacity - water, 1e-12) / np.maximum(capacity - water, 1e-12)
+
+    feasible = (fraction > 0) & (fraction < 1) & (np.abs(target_ph - ph) <= 1e-3) & result["converged"]
+    if buffer_capacity is not None:
+        feasible &= np.abs(capacity - buffer_capacity) <= 1e-3 * buffer_capacity
+
+    if stock_concentration is not None:
+        acid_stock, base_stock = (stock_concentration if isinstance(stock_concentration, tuple)
+                                  else (stock_concentration, stock_concentration))
+
+    ranking: List[dict] = []
+    for i, b in enumerate(buffers):
+        acid_c = concentration[i] * (1 - fraction[i])
+        base_c = concentration[i] * fraction[i]
+        entry = {
+            "system": b.name,
+            "acid_formula": b.acid_formula,
+            "base_formula": b.base_formula,
+            "pka": float(pka_pair[i]),
+            "hh_ratio": float(hh_ratio[i]),
+            "ratio": float(base_c / acid_c) if acid_c > 0 else float("inf"),
+            "total_concentration": float(concentration[i]),
+            "acid_concentration": float(acid_c),
+            "base_concentration": float(base_c),
+            "acid_moles": float(acid_c * final_volume),
+            "base_moles": float(base_c * final_volume),
+            "acid_mass": float(acid_c * final_volume * calculate_molar_mass(b.acid_formula)),
+            "base_mass": float(base_c * final_volume * calculate_molar_mass(b.base_formula)),
+            "buffer_capacity": float(capacity[i]),
+            "ionic_strength": float(result["ionic_strength"][i]),
+            "ph": float(ph[i]),
+            "feasible": bool(feasible[i]),
+        }
+        if stock_concentration is not None:
+            for form, conc, stock in (("acid", acid_c, acid_stock), ("base", base_c, base_stock)):
+                if conc > stock:
+                    entry[f"{form}_volume"] = float("nan")
+                    entry["feasible"] = False
+                elif conc > 0:
+                    entry[f"{form}_volume"] = dilution_c1v1_c2v2(stock, None, float(conc), final_volume)["v1"]
+                else:
+                    entry[f"{form}_volume"] = 0.0
+        ranking.append(entry)
+
+    ranking.sort(key=lambda e: (not e["feasible"], -e["buffer_capacity"] / e["total_concentration"]))
+    return {
+        "target_ph": target_ph,
+        "final_volume": final_volume,
+        "temperature": temperature,
+        "iterations": iteration + 1,
+        "systems": ranking,
+    }
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import math
 import re
+from collections import Counter
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Iterable, Tuple, List, Union
 
 import numpy as np
 from numpy.typing import ArrayLike
-from scipy import stats
+from scipy import sparse, stats
 
 
 # --- Core analytical calculations ---
@@ -18,54 +20,204 @@ def dilution_c1v1_c2v2(c1: float | None, v1: float | None, c2: float | None, v2:
     Retorna um dicionário com todas as quatro chaves preenchidas.
     Unidades consistentes são responsabilidade do usuário.
     """
-    known = {k: v for k, v in {"c1": c1, "v1": v1, "c2": c2, "v2": v2}.items() if v is not None}
-    if len(known) != 3:
-        raise ValueError("Informe exatamente 3 variáveis e deixe 1 como None.")
-    if c1 is None:
-        c1 = (c2 * v2) / v1  # type: ignore[arg-type]
-    elif v1 is None:
-        v1 = (c2 * v2) / c1
-    elif c2 is None:
-        c2 = (c1 * v1) / v2
-    elif v2 is None:
-        v2 = (c1 * v1) / c2
-    return {"c1": float(c1), "v1": float(v1), "c2": float(c2), "v2": float(v2)}  # type: ignore[return-value]
-
-
-def ph_strong_acid(acid_molar: float) -> float:
-    """pH para ácido forte monoprótico (25 °C)."""
-    if acid_molar <= 0:
-        raise ValueError("Concentração deve ser > 0")
-    return -math.log10(acid_molar)
+    return solve_equation("dilution", c1=c1, v1=v1, c2=c2, v2=v2)
+
 
+KW_25C = 1.0e-14
 
-def poh_strong_base(base_molar: float) -> float:
-    """pOH para base forte monoprótica (25 °C)."""
-    if base_molar <= 0:
+
+def _strong_electrolyte_p(concentration: ArrayLike, temperature, activity_model: str,
+                          background_ionic_strength) -> float | np.ndarray:
+    """
+    −log₁₀ da atividade do íon liberado (H+ ou OH-) por ácido/base forte
+    monoprótico: [X] = (C + √(C² + 4Kw')) / 2 com Kw' = Kw/γ², e a força
+    iônica (X, contraíon, íon da água e eletrólito de fundo) iterada até a
+    autoconsistência.
+    """
+    c = np.asarray(concentration, dtype=float)
+    if np.any(c <= 0):
         raise ValueError("Concentração deve ser > 0")
-    return -math.log10(base_molar)
+    kw = kw_at_temperature(temperature)
+    background = np.asarray(background_ionic_strength, dtype=float)
 
+    def update(ionic):
+        gamma = activity_coefficient(1, ionic, activity_model, temperature=temperature)
+        kw_c = kw / gamma ** 2
+        x = (c + np.sqrt(c ** 2 + 4 * kw_c)) / 2
+        return 0.5 * (x + c + kw_c / x) + background, gamma * x
 
-def ph_from_poh(poh: float) -> float:
-    return 14.0 - poh
+    activity = _iterate_ionic_strength(update, c + background, activity_model)
+    return _scalar_or_array(-np.log10(activity))
 
 
-def calculate_ka_from_ph(ph: float, initial_concentration: float) -> float:
+def ph_strong_acid(acid_molar: float | ArrayLike, temperature: float | ArrayLike = 25.0,
+                   activity_model: str = "ideal",
+                   background_ionic_strength: float | ArrayLike = 0.0) -> float | np.ndarray:
     """
-    Calcula Ka de um ácido fraco a partir do pH e concentração inicial.
-    Ka = [H+]² / (C₀ - [H+])
+    pH para ácido forte monoprótico, incluindo a autoionização da água:
+    [H+] = (C + √(C² + 4Kw)) / 2, com Kw na temperatura dada (°C).
+    Com activity_model ≠ "ideal" o pH é −log a(H+), com a força iônica
+    (incluindo background_ionic_strength, ex. sal do meio) autoconsistente.
+    """
+    return _strong_electrolyte_p(acid_molar, temperature, activity_model, background_ionic_strength)
+
+
+def poh_strong_base(base_molar: float | ArrayLike, temperature: float | ArrayLike = 25.0,
+                    activity_model: str = "ideal",
+                    background_ionic_strength: float | ArrayLike = 0.0) -> float | np.ndarray:
+    """
+    pOH para base forte monoprótica, incluindo a autoionização da água:
+    [OH-] = (C + √(C² + 4Kw)) / 2, com Kw na temperatura dada (°C).
+    Correções de atividade como em ph_strong_acid.
+    """
+    return _strong_electrolyte_p(base_molar, temperature, activity_model, background_ionic_strength)
+
+
+def _weak_monoprotic_root(concentration: np.ndarray, k: np.ndarray, kw: np.ndarray) -> np.ndarray:
+    """
+    Raiz positiva de x³ + K·x² − (Kw + K·C)·x − K·Kw = 0 (balanço de carga
+    completo de um ácido/base fraco monoprótico; x = [H+] ou [OH-]).
+
+    Parte da solução quadrática sem Kw somada a √Kw, que é sempre um limite
+    superior da raiz e está a menos de um fator 2 dela; como o polinômio é
+    convexo para x > 0, Newton converge de forma monotônica em poucas iterações.
+    """
+    x_quadratic = 2 * k * concentration / (k + np.sqrt(k * k + 4 * k * concentration))
+    x = x_quadratic + np.sqrt(kw)
+    for _ in range(50):
+        f = ((x + k) * x - (kw + k * concentration)) * x - k * kw
+        df = (3 * x + 2 * k) * x - (kw + k * concentration)
+        step = f / df
+        x = x - step
+        if np.all(np.abs(step) <= 1e-14 * x):
+            break
+    return x
+
+
+def _weak_electrolyte_ph(concentration: ArrayLike, k: ArrayLike, kw: ArrayLike, base: bool,
+                         activity_model: str = "ideal", background_ionic_strength: ArrayLike = 0.0,
+                         temperature: float | ArrayLike = 25.0) -> dict:
+    c = np.asarray(concentration, dtype=float)
+    k = np.asarray(k, dtype=float)
+    kw = np.asarray(kw, dtype=float)
+    background = np.asarray(background_ionic_strength, dtype=float)
+    c, k, kw, background = np.broadcast_arrays(c, k, kw, background)
+    error = (~(np.isfinite(c) & np.isfinite(k) & np.isfinite(kw) & np.isfinite(background))
+             | (c < 0) | (k <= 0) | (kw <= 0) | (background < 0))
+    # Valores neutros nas linhas inválidas evitam avisos; o resultado é NaN
+    c_ok = np.where(error, 0.0, c)
+    k_ok = np.where(error, 1.0, k)
+    kw_ok = np.where(error, KW_25C, kw)
+    background_ok = np.where(error, 0.0, background)
+
+    def update(ionic):
+        # Constantes condicionais (em concentração): K' = K/γ², Kw' = Kw/γ²
+        gamma = activity_coefficient(1, ionic, activity_model, temperature=temperature)
+        k_c = k_ok / gamma ** 2
+        kw_c = kw_ok / gamma ** 2
+        x = _weak_monoprotic_root(c_ok, k_c, kw_c)
+        dissociation = np.where(c_ok > 0, k_c / (k_c + x), 0.0)
+        new_ionic = 0.5 * (x + kw_c / x + c_ok * dissociation) + background_ok
+        return new_ionic, (x, kw_c / x, dissociation, gamma, new_ionic)
+
+    with np.errstate(all='ignore'):
+        x, other, dissociation, gamma, ionic = _iterate_ionic_strength(
+            update, background_ok + np.sqrt(k_ok * c_ok), activity_model)
+        h, oh = (other, x) if base else (x, other)
+    nan = np.where(error, np.nan, 1.0)
+    pkw = -np.log10(kw_ok)
+    ph = -np.log10(gamma * h) * nan
+    return {
+        "ph": ph,
+        "poh": (pkw - ph),
+        "h": h * nan,
+        "oh": oh * nan,
+        "degree_of_dissociation": dissociation * nan,
+        "ionic_strength": ionic * nan,
+        "activity_coefficient": gamma * nan,
+        "error": error,
+    }
+
+
+def ph_weak_acid(concentration: ArrayLike, ka: ArrayLike, kw: ArrayLike | None = None,
+                 temperature: float | ArrayLike = 25.0, activity_model: str = "ideal",
+                 background_ionic_strength: ArrayLike = 0.0) -> dict:
+    """
+    pH exato de ácido fraco monoprótico HA resolvendo o balanço de carga
+    [H+] = [A-] + [OH-] (cúbica com Kw), sem a aproximação [H+] ≪ C.
+    Aceita arrays de concentrações, Ka e temperaturas (com broadcasting).
+    Kw vem de kw_at_temperature se não for informado. Linhas com entradas
+    inválidas ficam NaN e marcadas em "error" em vez de levantar exceção.
+
+    Ka e Kw são constantes termodinâmicas; com activity_model ≠ "ideal" a
+    força iônica de cada linha é iterada até a autoconsistência e o pH
+    retornado é −log a(H+).
+    """
+    if kw is None:
+        kw = kw_at_temperature(temperature)
+    return _weak_electrolyte_ph(concentration, ka, kw, False, activity_model,
+                                background_ionic_strength, temperature)
+
+
+def ph_weak_base(concentration: ArrayLike, kb: ArrayLike, kw: ArrayLike | None = None,
+                 temperature: float | ArrayLike = 25.0, activity_model: str = "ideal",
+                 background_ionic_strength: ArrayLike = 0.0) -> dict:
+    """
+    pH exato de base fraca monoprótica B resolvendo o balanço de carga
+    [OH-] = [BH+] + [H+] (cúbica com Kw). Mesmo formato de ph_weak_acid.
+    """
+    if kw is None:
+        kw = kw_at_temperature(temperature)
+    return _weak_electrolyte_ph(concentration, kb, kw, True, activity_model,
+                                background_ionic_strength, temperature)
+
+
+def ph_from_poh(poh: float | ArrayLike, temperature: float | ArrayLike = 25.0) -> float | np.ndarray:
+    """pH = pKw(T) − pOH."""
+    return _scalar_or_array(pkw_at_temperature(temperature) - np.asarray(poh, dtype=float))
+
+
+def _k_from_p(p: ArrayLike, initial_concentration: ArrayLike, temperature, activity_model: str,
+              background_ionic_strength, ion: str) -> float | np.ndarray:
     """
-    if ph < 0 or ph > 14:
-        raise ValueError("pH deve estar entre 0 e 14")
-    if initial_concentration <= 0:
+    K = a(X)² / (C₀ − [X]) a partir de p = −log a(X) medido (X = H+ ou OH-).
+    O contraíon tem a mesma atividade de X; a espécie neutra tem γ = 1 e
+    [X] = a(X)/γ, com I = [X] + fundo iterada até a autoconsistência.
+    """
+    p = np.asarray(p, dtype=float)
+    initial_concentration = np.asarray(initial_concentration, dtype=float)
+    pkw = pkw_at_temperature(temperature)
+    if np.any((p < 0) | (p > pkw)):
+        raise ValueError(f"{ion} deve estar entre 0 e {np.max(pkw):.2f}")
+    if np.any(initial_concentration <= 0):
         raise ValueError("Concentração inicial deve ser positiva")
     
-    h_plus = 10 ** (-ph)
-    if h_plus >= initial_concentration:
-        raise ValueError("Concentração de H+ não pode ser maior que a concentração inicial")
+    activity = 10 ** (-p)
+    background = np.asarray(background_ionic_strength, dtype=float)
+
+    def update(ionic):
+        x = activity / activity_coefficient(1, ionic, activity_model, temperature=temperature)
+        return x + background, x
+
+    x = _iterate_ionic_strength(update, activity + background, activity_model)
+    if np.any(x >= initial_concentration):
+        raise ValueError(f"Concentração de {'H+' if ion == 'pH' else 'OH-'} não pode ser maior que a concentração inicial")
     
-    ka = (h_plus ** 2) / (initial_concentration - h_plus)
-    return ka
+    return _scalar_or_array((activity ** 2) / (initial_concentration - x))
+
+
+def calculate_ka_from_ph(ph: float | ArrayLike, initial_concentration: float | ArrayLike,
+                         temperature: float | ArrayLike = 25.0, activity_model: str = "ideal",
+                         background_ionic_strength: float | ArrayLike = 0.0) -> float | np.ndarray:
+    """
+    Calcula Ka de um ácido fraco a partir do pH e concentração inicial.
+    Ka = [H+]² / (C₀ - [H+])
+    O pH deve estar entre 0 e pKw na temperatura dada (°C). Com
+    activity_model ≠ "ideal" o pH é tratado como −log a(H+) e o Ka
+    retornado é termodinâmico: Ka = a(H+)² / (C₀ − [H+]).
+    """
+    return _k_from_p(ph, initial_concentration, temperature, activity_model,
+                     background_ionic_strength, "pH")
 
 
 def calculate_pka_from_ka(ka: float) -> float:
@@ -75,27 +227,27 @@ def calculate_pka_from_ka(ka: float) -> float:
     return -math.log10(ka)
 
 
-def calculate_ka_from_pka(pka: float) -> float:
-    """Calcula Ka a partir de pKa."""
-    return 10 ** (-pka)
+def calculate_ka_from_pka(pka: float | ArrayLike) -> float | np.ndarray:
+    """
+    Calcula Ka a partir de pKa. Aceita também uma lista/array de pKa
+    (sistemas polipróticos), devolvendo um array de Ka na mesma ordem.
+    """
+    if np.ndim(pka) == 0:
+        return 10 ** (-pka)
+    return 10.0 ** -np.asarray(pka, dtype=float)
 
 
-def calculate_kb_from_poh(poh: float, initial_concentration: float) -> float:
+def calculate_kb_from_poh(poh: float | ArrayLike, initial_concentration: float | ArrayLike,
+                          temperature: float | ArrayLike = 25.0, activity_model: str = "ideal",
+                          background_ionic_strength: float | ArrayLike = 0.0) -> float | np.ndarray:
     """
     Calcula Kb de uma base fraca a partir do pOH e concentração inicial.
     Kb = [OH-]² / (C₀ - [OH-])
+    O pOH deve estar entre 0 e pKw na temperatura dada (°C). Correções de
+    atividade como em calculate_ka_from_ph.
     """
-    if poh < 0 or poh > 14:
-        raise ValueError("pOH deve estar entre 0 e 14")
-    if initial_concentration <= 0:
-        raise ValueError("Concentração inicial deve ser positiva")
-    
-    oh_minus = 10 ** (-poh)
-    if oh_minus >= initial_concentration:
-        raise ValueError("Concentração de OH- não pode ser maior que a concentração inicial")
-    
-    kb = (oh_minus ** 2) / (initial_concentration - oh_minus)
-    return kb
+    return _k_from_p(poh, initial_concentration, temperature, activity_model,
+                     background_ionic_strength, "pOH")
 
 
 def calculate_pkb_from_kb(kb: float) -> float:
@@ -110,25 +262,42 @@ def calculate_kb_from_pkb(pkb: float) -> float:
     return 10 ** (-pkb)
 
 
-def ka_kb_relationship(ka: float = None, kb: float = None) -> dict:
+def ka_kb_relationship(ka: float | ArrayLike = None, kb: float | ArrayLike = None,
+                       temperature: float | ArrayLike = 25.0) -> dict:
     """
-    Relação Ka × Kb = Kw (a 25°C, Kw = 1.0 × 10⁻¹⁴).
-    Informe Ka ou Kb para calcular o outro.
+    Relação Ka × Kb = Kw, com Kw na temperatura dada (°C; 25 °C → 1.0 × 10⁻¹⁴).
+    Informe Ka ou Kb para calcular o outro. Listas/arrays (uma constante por
+    etapa de um sistema poliprótico, ou uma temperatura por linha) retornam
+    arrays em cada chave, com broadcasting.
     """
-    kw = 1.0e-14
+    kw = kw_at_temperature(temperature)
     
     if ka is not None and kb is not None:
         raise ValueError("Informe apenas Ka OU Kb, não ambos")
     elif ka is not None:
+        if np.ndim(ka) > 0 or np.ndim(kw) > 0:
+            ka = np.asarray(ka, dtype=float)
+            if not np.all(ka > 0):
+                raise ValueError("Ka deve ser positivo")
+            kb = kw / ka
+            ka = np.broadcast_to(ka, kb.shape)
+            return {"ka": ka, "kb": kb, "pka": -np.log10(ka), "pkb": -np.log10(kb), "kw": kw}
         if ka <= 0:
             raise ValueError("Ka deve ser positivo")
         kb = kw / ka
-        return {"ka": ka, "kb": kb, "pka": calculate_pka_from_ka(ka), "pkb": calculate_pkb_from_kb(kb)}
+        return {"ka": ka, "kb": kb, "pka": calculate_pka_from_ka(ka), "pkb": calculate_pkb_from_kb(kb), "kw": kw}
     elif kb is not None:
+        if np.ndim(kb) > 0 or np.ndim(kw) > 0:
+            kb = np.asarray(kb, dtype=float)
+            if not np.all(kb > 0):
+                raise ValueError("Kb deve ser positivo")
+            ka = kw / kb
+            kb = np.broadcast_to(kb, ka.shape)
+            return {"ka": ka, "kb": kb, "pka": -np.log10(ka), "pkb": -np.log10(kb), "kw": kw}
         if kb <= 0:
             raise ValueError("Kb deve ser positivo")
         ka = kw / kb
-        return {"ka": ka, "kb": kb, "pka": calculate_pka_from_ka(ka), "pkb": calculate_pkb_from_kb(kb)}
+        return {"ka": ka, "kb": kb, "pka": calculate_pka_from_ka(ka), "pkb": calculate_pkb_from_kb(kb), "kw": kw}
     else:
         raise ValueError("Informe Ka ou Kb")
 
@@ -140,6 +309,335 @@ def absorbance_beer_lambert(epsilon: float, path_length_cm: float, concentration
     return float(epsilon * path_length_cm * concentration_molar)
 
 
+
+# --- Temperature dependence (Kw, pKa) ---
+
+GAS_CONSTANT = 8.314462618  # J·mol⁻¹·K⁻¹
+KELVIN_OFFSET = 273.15
+
+# Grade das tabelas de interpolação: 0–100 °C a cada 0,1 °C
+TEMPERATURE_GRID_C = np.linspace(0.0, 100.0, 1001)
+
+
+def _pkw_model(temperature_c: np.ndarray) -> np.ndarray:
+    """
+    pKw(T) de Harned & Owen: log Kw = −4470,99/T + 6,0875 − 0,01706·T,
+    deslocado para que pKw(25 °C) = 14,00 (mesma convenção de KW_25C).
+    """
+    def log_kw(t_c):
+        t = np.asarray(t_c, dtype=float) + KELVIN_OFFSET
+        return -4470.99 / t + 6.0875 - 0.01706 * t
+
+    return 14.0 - (log_kw(temperature_c) - log_kw(25.0))
+
+
+PKW_TABLE = _pkw_model(TEMPERATURE_GRID_C)
+
+
+def _check_temperature(temperature_c) -> np.ndarray:
+    t = np.asarray(temperature_c, dtype=float)
+    if not np.all((t >= TEMPERATURE_GRID_C[0]) & (t <= TEMPERATURE_GRID_C[-1])):
+        raise ValueError("Temperatura deve estar entre 0 e 100 °C")
+    return t
+
+
+def _scalar_or_array(value: np.ndarray):
+    return float(value) if np.ndim(value) == 0 else value
+
+
+def pkw_at_temperature(temperature_c: float | ArrayLike = 25.0) -> float | np.ndarray:
+    """pKw em função da temperatura (°C), por interpolação em PKW_TABLE."""
+    t = _check_temperature(temperature_c)
+    return _scalar_or_array(np.interp(t, TEMPERATURE_GRID_C, PKW_TABLE))
+
+
+def kw_at_temperature(temperature_c: float | ArrayLike = 25.0) -> float | np.ndarray:
+    """Kw em função da temperatura (°C); aceita escalar ou array."""
+    return 10.0 ** -pkw_at_temperature(temperature_c)
+
+
+def van_t_hoff_pka(pka_ref: ArrayLike, delta_h: ArrayLike, temperature_c: float | ArrayLike,
+                   delta_cp: ArrayLike = 0.0, reference_c: float = 25.0) -> float | np.ndarray:
+    """
+    pKa(T) pela equação de van't Hoff integrada com ΔCp constante:
+    pKa(T) = pKa(T₀) + ΔH/(R ln10)·(1/T − 1/T₀) − ΔCp/(R ln10)·(T₀/T − 1 + ln(T/T₀))
+    ΔH em kJ/mol, ΔCp em J·mol⁻¹·K⁻¹, temperaturas em °C.
+    """
+    t = np.asarray(temperature_c, dtype=float) + KELVIN_OFFSET
+    t0 = reference_c + KELVIN_OFFSET
+    r_ln10 = GAS_CONSTANT * math.log(10)
+    dh = np.asarray(delta_h, dtype=float) * 1000.0
+    dcp = np.asarray(delta_cp, dtype=float)
+    pka = (np.asarray(pka_ref, dtype=float) + dh / r_ln10 * (1 / t - 1 / t0)
+           - dcp / r_ln10 * (t0 / t - 1 + np.log(t / t0)))
+    return _scalar_or_array(pka)
+
+
+# pKa (25 °C), ΔH (kJ/mol) e ΔCp (J·mol⁻¹·K⁻¹) de cada etapa de desprotonação.
+# Valores de Goldberg, Kishore & Lennen, J. Phys. Chem. Ref. Data 31, 231 (2002).
+ACID_THERMODYNAMICS: Dict[str, Tuple[Tuple[float, float, float], ...]] = {
+    "formiato": ((3.75, -0.1, -165.0),),
+    "acetato": ((4.756, -0.41, -142.0),),
+    "citrato": ((3.128, 4.07, -131.0), (4.761, 2.23, -178.0), (6.396, -3.38, -254.0)),
+    "MES": ((6.270, 14.8, 5.0),),
+    "fosfato": ((2.148, -8.0, -141.0), (7.198, 3.6, -230.0), (12.35, 16.0, -242.0)),
+    "carbonato": ((6.351, 9.15, -371.0), (10.329, 14.70, -249.0)),
+    "MOPS": ((7.184, 21.1, 25.0),),
+    "HEPES": ((7.564, 20.4, 47.0),),
+    "Tris": ((8.072, 47.45, -59.0),),
+    "borato": ((9.237, 13.8, -240.0),),
+    "amônio": ((9.245, 52.21, 8.0),),
+    "glicina": ((2.351, 4.0, -139.0), (9.780, 44.2, -57.0)),
+}
+
+
+@lru_cache(maxsize=None)
+def _pka_temperature_table(system: str) -> np.ndarray:
+    """Tabela pKa × TEMPERATURE_GRID_C (temperaturas × etapas) de um sistema do catálogo."""
+    if system not in ACID_THERMODYNAMICS:
+        raise ValueError(f"Sistema desconhecido: {system}")
+    data = np.array(ACID_THERMODYNAMICS[system], dtype=float)
+    table = van_t_hoff_pka(data[:, 0], data[:, 1], TEMPERATURE_GRID_C[:, None], data[:, 2])
+    table.setflags(write=False)
+    return table
+
+
+def pka_at_temperature(system: str, temperature_c: float | ArrayLike = 25.0) -> np.ndarray:
+    """
+    pKa de cada etapa de um sistema de ACID_THERMODYNAMICS na(s) temperatura(s)
+    dada(s) (°C). O modelo é avaliado uma única vez por sistema e as consultas
+    interpolam a tabela; retorna forma (..., n_etapas).
+    """
+    table = _pka_temperature_table(system)
+    t = _check_temperature(temperature_c)
+    return np.stack([np.interp(t, TEMPERATURE_GRID_C, table[:, k]) for k in range(table.shape[1])], axis=-1)
+
+
+# --- Activity coefficients (ionic strength) ---
+
+ACTIVITY_MODELS = ("ideal", "debye-huckel", "extended", "davies")
+
+# Constantes de Debye-Hückel a 25 °C: A em (mol/L)^-½, B em Å⁻¹·(mol/L)^-½
+DEBYE_HUCKEL_A_25C = 0.5091
+DEBYE_HUCKEL_B_25C = 0.3283
+
+
+def water_dielectric_constant(temperature_c: float | ArrayLike = 25.0) -> float | np.ndarray:
+    """Constante dielétrica da água (Malmberg & Maryott, 0–100 °C)."""
+    t = _check_temperature(temperature_c)
+    return _scalar_or_array(87.740 - 0.40008 * t + 9.398e-4 * t ** 2 - 1.410e-6 * t ** 3)
+
+
+def debye_huckel_constants(temperature_c: float | ArrayLike = 25.0) -> Tuple[float | np.ndarray, float | np.ndarray]:
+    """
+    Constantes A e B de Debye-Hückel na temperatura dada (°C).
+    A ∝ (εT)^-3/2 e B ∝ (εT)^-1/2, ancoradas nos valores de 25 °C.
+    """
+    eps_t = water_dielectric_constant(temperature_c) * (np.asarray(temperature_c, dtype=float) + KELVIN_OFFSET)
+    ratio = water_dielectric_constant(25.0) * (25.0 + KELVIN_OFFSET) / eps_t
+    return (_scalar_or_array(DEBYE_HUCKEL_A_25C * ratio ** 1.5),
+            _scalar_or_array(DEBYE_HUCKEL_B_25C * ratio ** 0.5))
+
+
+def ionic_strength(concentrations: ArrayLike, charges: ArrayLike) -> float | np.ndarray:
+    """I = ½ Σ cᵢ·zᵢ² (a última dimensão de concentrations percorre os íons)."""
+    c = np.asarray(concentrations, dtype=float)
+    z = np.asarray(charges, dtype=float)
+    return _scalar_or_array(0.5 * np.sum(c * z ** 2, axis=-1))
+
+
+def log_activity_coefficient(charge: ArrayLike, ionic_strength: ArrayLike, model: str = "davies",
+                             ion_size: ArrayLike = 4.0, temperature: float | ArrayLike = 25.0) -> float | np.ndarray:
+    """
+    log₁₀ γ de um íon de carga z na força iônica I (mol/L).
+
+    "ideal": γ = 1
+    "debye-huckel": log γ = −A z² √I                      (I < ~0,005)
+    "extended":     log γ = −A z² √I / (1 + B a √I)      (I < ~0,1; a em Å)
+    "davies":       log γ = −A z² (√I / (1 + √I) − 0,3 I) (I < ~0,5)
+    """
+    if model not in ACTIVITY_MODELS:
+        raise ValueError(f"Modelo de atividade desconhecido: {model}")
+    z2 = np.asarray(charge, dtype=float) ** 2
+    sqrt_i = np.sqrt(np.maximum(np.asarray(ionic_strength, dtype=float), 0.0))
+    if model == "ideal":
+        return _scalar_or_array(np.zeros(np.broadcast_shapes(z2.shape, sqrt_i.shape)))
+    a, b = debye_huckel_constants(temperature)
+    if model == "debye-huckel":
+        log_gamma = -a * z2 * sqrt_i
+    elif model == "extended":
+        log_gamma = -a * z2 * sqrt_i / (1 + b * np.asarray(ion_size, dtype=float) * sqrt_i)
+    else:
+        log_gamma = -a * z2 * (sqrt_i / (1 + sqrt_i) - 0.3 * sqrt_i ** 2)
+    return _scalar_or_array(log_gamma)
+
+
+def activity_coefficient(charge: ArrayLike, ionic_strength: ArrayLike, model: str = "davies",
+                         ion_size: ArrayLike = 4.0, temperature: float | ArrayLike = 25.0) -> float | np.ndarray:
+    """Coeficiente de atividade γ (ver log_activity_coefficient)."""
+    return _scalar_or_array(10.0 ** np.asarray(
+        log_activity_coefficient(charge, ionic_strength, model, ion_size, temperature)))
+
+
+def _iterate_ionic_strength(update, ionic: np.ndarray, activity_model: str,
+                            tolerance: float = 1e-10, max_iterations: int = 100):
+    """
+    Ponto fixo I → update(I) para arrays inteiros de soluções ao mesmo tempo.
+    update devolve (nova força iônica, estado); retorna o estado final.
+    No modelo ideal γ = 1 e basta uma avaliação.
+    """
+    if activity_model == "ideal":
+        return update(ionic)[1]
+    for _ in range(max_iterations):
+        new_ionic, state = update(ionic)
+        if np.all(np.abs(new_ionic - ionic) <= tolerance * np.maximum(new_ionic, 1e-12)):
+            break
+        ionic = new_ionic
+    return state
+
+
+# --- Declarative equation registry ---
+
+@dataclass(frozen=True)
+class EquationRelation:
+    """
+    Relação do tipo Π xᵢ^eᵢ = 1 (ex.: C1·V1 / (C2·V2) = 1).
+    Qualquer variável pode ser isolada: x_k = Π_{i≠k} xᵢ^(-eᵢ/e_k).
+    """
+    name: str
+    description: str
+    exponents: Tuple[Tuple[str, float], ...]
+
+    @property
+    def variables(self) -> Tuple[str, ...]:
+        return tuple(var for var, _ in self.exponents)
+
+
+EQUATIONS: Dict[str, EquationRelation] = {}
+
+
+def register_equation(name: str, description: str, **exponents: float) -> EquationRelation:
+    """Registra uma relação declarativa; os solvers são gerados sob demanda."""
+    if len(exponents) < 2 or any(e == 0 for e in exponents.values()):
+        raise ValueError("A relação precisa de pelo menos 2 variáveis com expoente não nulo")
+    relation = EquationRelation(name, description, tuple(exponents.items()))
+    EQUATIONS[name] = relation
+    equation_solver.cache_clear()
+    return relation
+
+
+def _equation_expression(relation: EquationRelation, variable: str) -> str:
+    """Expressão NumPy que isola `variable` (ex.: '(c2 * v2) / (v1)')."""
+    exponents = dict(relation.exponents)
+    if variable not in exponents:
+        raise ValueError(f"Variável '{variable}' não pertence a {relation.name}")
+    target = exponents[variable]
+    numerator, denominator = [], []
+    for var, e in relation.exponents:
+        if var == variable:
+            continue
+        power = -e / target
+        term = var if abs(power) == 1 else f"{var} ** {abs(power):g}"
+        (numerator if power > 0 else denominator).append(term)
+    num = " * ".join(numerator) if numerator else "1.0"
+    return f"({num}) / ({' * '.join(denominator)})" if denominator else f"({num})"
+
+
+@lru_cache(maxsize=None)
+def equation_solver(name: str, variable: str):
+    """
+    Solver vetorizado (montado uma única vez e mantido em cache) que
+    calcula `variable` = Π xᵢ^(-eᵢ/e_k) a partir das demais variáveis.
+    """
+    if name not in EQUATIONS:
+        raise ValueError(f"Equação desconhecida: {name}")
+    relation = EQUATIONS[name]
+    expression = _equation_expression(relation, variable)
+    target = dict(relation.exponents)[variable]
+    powers = tuple((var, -e / target) for var, e in relation.exponents if var != variable)
+
+    def solver(**values):
+        missing = [var for var, _ in powers if var not in values]
+        if missing:
+            raise ValueError(f"Variáveis ausentes: {missing}")
+        result = 1.0
+        for var, power in powers:
+            value = np.asarray(values[var], dtype=float)
+            result = result * (value if power == 1 else 1.0 / value if power == -1 else value ** power)
+        return result
+
+    solver.expression = f"{variable} = {expression}"
+    return solver
+
+
+def solve_equation(name: str, **values: float | None) -> dict:
+    """
+    Resolve uma relação registrada para a única variável informada como None.
+    Ex.: solve_equation("density", rho=None, m=10, V=5) -> {'rho': 2.0, ...}
+    """
+    if name not in EQUATIONS:
+        raise ValueError(f"Equação desconhecida: {name}")
+    variables = EQUATIONS[name].variables
+    unknown = [var for var in variables if values.get(var) is None]
+    if len(unknown) != 1:
+        raise ValueError(f"Informe exatamente {len(variables) - 1} variáveis e deixe 1 como None.")
+    target = unknown[0]
+    solver = equation_solver(name, target)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = solver(**{var: float(values[var]) for var in variables if var != target})
+    if not np.isfinite(result):
+        raise ValueError(f"Não foi possível calcular {target} (divisão por zero)")
+    solved = {var: float(values[var]) for var in variables if var != target}
+    solved[target] = float(result)
+    return {var: solved[var] for var in variables}
+
+
+def solve_equation_table(name: str, table) -> dict:
+    """
+    Resolve uma tabela inteira (DataFrame ou dicionário de colunas) em que
+    cada linha tem exatamente uma incógnita (NaN), possivelmente diferente
+    em cada linha. As linhas são agrupadas por incógnita e cada grupo é
+    resolvido de uma vez pelo solver vetorizado correspondente.
+
+    Retorna as colunas preenchidas, "unknown" (variável calculada em cada
+    linha) e "error" (máscara de linhas sem exatamente uma incógnita ou
+    com resultado não finito) em vez de levantar exceções.
+    """
+    if name not in EQUATIONS:
+        raise ValueError(f"Equação desconhecida: {name}")
+    variables = EQUATIONS[name].variables
+    missing_columns = [var for var in variables if var not in table]
+    if missing_columns:
+        raise ValueError(f"Colunas ausentes: {missing_columns}")
+
+    columns = {var: np.array(table[var], dtype=float) for var in variables}
+    n_rows = len(columns[variables[0]])
+    nan_mask = np.column_stack([np.isnan(columns[var]) for var in variables])
+    n_unknown = nan_mask.sum(axis=1)
+    error = n_unknown != 1
+    unknown = np.full(n_rows, '', dtype=object)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for k, var in enumerate(variables):
+            rows = nan_mask[:, k] & ~error
+            if not rows.any():
+                continue
+            solver = equation_solver(name, var)
+            result = solver(**{other: columns[other][rows] for other in variables if other != var})
+            columns[var][rows] = result
+            unknown[rows] = var
+
+    error |= ~np.all(np.isfinite(np.column_stack([columns[var] for var in variables])), axis=1)
+    unknown[error] = ''
+    return {**columns, "unknown": unknown, "error": error}
+
+
+register_equation("dilution", "C1·V1 = C2·V2", c1=1, v1=1, c2=-1, v2=-1)
+register_equation("beer_lambert", "A = ε·b·c", A=1, epsilon=-1, b=-1, c=-1)
+register_equation("moles", "n = m / M", n=1, m=-1, M=1)
+register_equation("density", "ρ = m / V", rho=1, m=-1, V=1)
+register_equation("molarity", "c = n / V", c=1, n=-1, V=1)
+
 # --- Linear regression for calibration curves ---
 
 @dataclass
@@ -148,6 +646,144 @@ class LinearFit:
     intercept: float
     r_value: float  # Pearson r
     r_squared: float
+    # Estatísticas para incertezas (NaN quando o ajuste foi montado sem elas).
+    # Em ajustes ponderados os pesos são normalizados para Σw = n, de modo que
+    # s_y/x é o desvio de uma leitura de peso médio e não depende da escala dos pesos.
+    n: int = 0
+    x_mean: float = math.nan
+    ss_xx: float = math.nan  # Σw(x − x̄)²
+    sum_weights: float = math.nan  # Σw (= n)
+    residual_std_error: float = math.nan  # s_y/x
+    slope_std_error: float = math.nan
+    intercept_std_error: float = math.nan
+    weighting: str = "none"  # ver LINEAR_FIT_WEIGHTINGS
+    weight_scale: float = 1.0  # peso bruto → peso normalizado
+    low_end_weight: float = 1.0  # peso normalizado do padrão de menor concentração
+
+    @property
+    def low_end_std_error(self) -> float:
+        """Desvio do sinal no padrão de menor concentração: s_y/x / √w₀ (= s_y/x sem ponderação)."""
+        return self.residual_std_error / math.sqrt(self.low_end_weight)
+
+    @property
+    def lod(self) -> float:
+        """Limite de detecção em concentração: 3,3·s₀ / |b| (s₀ no extremo inferior)."""
+        return 3.3 * self.low_end_std_error / abs(self.slope)
+
+    @property
+    def loq(self) -> float:
+        """Limite de quantificação em concentração: 10·s₀ / |b|."""
+        return 10.0 * self.low_end_std_error / abs(self.slope)
+
+    def predict(self, x: ArrayLike) -> float | np.ndarray:
+        """ŷ = b·x + a."""
+        return _scalar_or_array(self.slope * np.asarray(x, dtype=float) + self.intercept)
+
+    def _new_weights(self, x: np.ndarray, weights: ArrayLike | None) -> np.ndarray:
+        """
+        Peso normalizado de novas leituras em x: pesos brutos informados ou os
+        da ponderação do ajuste (1/σ² sem pesos usa o peso médio, 1).
+        """
+        if weights is not None:
+            return self.weight_scale * np.asarray(weights, dtype=float)
+        with np.errstate(divide="ignore"):
+            if self.weighting == "1/x":
+                return self.weight_scale / x
+            if self.weighting == "1/x2":
+                return self.weight_scale / x ** 2
+        return np.ones_like(x)
+
+    def _t_critical(self, confidence_level: float) -> float:
+        if not 0 < confidence_level < 1:
+            raise ValueError("Nível de confiança deve estar entre 0 e 1")
+        if self.n < 3 or not math.isfinite(self.residual_std_error):
+            raise ValueError("Necessário pelo menos 3 pontos para estimar incertezas")
+        return float(stats.t.ppf(1 - (1 - confidence_level) / 2, self.n - 2))
+
+    def _band(self, x: ArrayLike, confidence_level: float, extra) -> dict:
+        x = np.asarray(x, dtype=float)
+        t = self._t_critical(confidence_level)
+        y = self.slope * x + self.intercept
+        with np.errstate(invalid="ignore"):
+            half = t * self.residual_std_error * np.sqrt(extra + 1.0 / self.sum_weights
+                                                         + (x - self.x_mean) ** 2 / self.ss_xx)
+        return {
+            "x": x,
+            "y": y,
+            "lower": y - half,
+            "upper": y + half,
+            "half_width": half,
+            "t_critical": t,
+            "confidence_level": confidence_level,
+        }
+
+    def confidence_band(self, x: ArrayLike, confidence_level: float = 0.95) -> dict:
+        """Banda de confiança da reta: ŷ ± t·s_y/x·√(1/n + (x − x̄)²/Sxx)."""
+        return self._band(x, confidence_level, 0.0)
+
+    def prediction_band(self, x: ArrayLike, confidence_level: float = 0.95, replicates: int = 1,
+                        weights: ArrayLike | None = None) -> dict:
+        """
+        Banda de predição para a média de m novas leituras:
+        √(1/(m·w) + 1/n + (x − x̄)²/Sxx), com w o peso normalizado da leitura em x.
+        """
+        if replicates < 1:
+            raise ValueError("Número de replicatas deve ser ≥ 1")
+        x = np.asarray(x, dtype=float)
+        return self._band(x, confidence_level, 1.0 / (replicates * self._new_weights(x, weights)))
+
+    def inverse_predict(self, signal: ArrayLike, replicates: int = 1, confidence_level: float = 0.95,
+                        weights: ArrayLike | None = None) -> dict:
+        """
+        Concentração de amostras desconhecidas a partir do sinal (média de m
+        replicatas), em uma única operação para todo o array de sinais:
+
+        x₀ = (y₀ − a)/b
+        s_x₀ = (s_y/x / |b|)·√(1/(m·w₀) + 1/n + (y₀ − ȳ)²/(b²·Sxx))
+
+        w₀: peso normalizado das leituras em x₀ (pesos brutos em weights ou os
+        da ponderação do ajuste; 1 sem ponderação).
+        """
+        if replicates < 1:
+            raise ValueError("Número de replicatas deve ser ≥ 1")
+        t = self._t_critical(confidence_level)
+        signal = np.asarray(signal, dtype=float)
+        x0 = (signal - self.intercept) / self.slope
+        y_mean = self.slope * self.x_mean + self.intercept
+        with np.errstate(invalid="ignore"):
+            std_error = (self.residual_std_error / abs(self.slope)) * np.sqrt(
+                1.0 / (replicates * self._new_weights(x0, weights)) + 1.0 / self.sum_weights
+                + (signal - y_mean) ** 2 / (self.slope ** 2 * self.ss_xx))
+        return {
+            "concentration": _scalar_or_array(x0),
+            "std_error": _scalar_or_array(std_error),
+            "lower": _scalar_or_array(x0 - t * std_error),
+            "upper": _scalar_or_array(x0 + t * std_error),
+            "t_critical": t,
+            "confidence_level": confidence_level,
+        }
+
+
+def _linear_fit_result(slope: float, intercept: float, n: int, sum_weights: float, x_mean: float,
+                       ss_xx: float, ss_xy: float, ss_yy: float, weighting: str = "none",
+                       low_end_weight: float | None = None) -> LinearFit:
+    """
+    Monta o LinearFit com erros-padrão a partir das somas centradas
+    (ponderadas), normalizando os pesos para Σw = n. low_end_weight: peso
+    bruto do padrão de menor concentração.
+    """
+    scale = n / sum_weights if sum_weights > 0 else 1.0
+    ss_xx, ss_xy, ss_yy = scale * ss_xx, scale * ss_xy, scale * ss_yy
+    r = ss_xy / math.sqrt(ss_xx * ss_yy) if ss_xx > 0 and ss_yy > 0 else 0.0
+    if n > 2:
+        s = math.sqrt(max(ss_yy - ss_xy * ss_xy / ss_xx, 0.0) / (n - 2))
+        slope_se = s / math.sqrt(ss_xx)
+        intercept_se = s * math.sqrt(1.0 / n + x_mean * x_mean / ss_xx)
+    else:
+        s = slope_se = intercept_se = math.nan
+    low = 1.0 if low_end_weight is None else scale * low_end_weight
+    return LinearFit(float(slope), float(intercept), float(r), float(r * r), int(n), float(x_mean),
+                     float(ss_xx), float(n), s, slope_se, intercept_se, weighting, float(scale), float(low))
 
 
 def linear_fit(x: ArrayLike, y: ArrayLike) -> LinearFit:
@@ -163,8 +799,220 @@ def linear_fit(x: ArrayLike, y: ArrayLike) -> LinearFit:
     ss_xy = np.sum((x - x_mean) * (y - y_mean))
     ss_xx = np.sum((x - x_mean) ** 2)
     ss_yy = np.sum((y - y_mean) ** 2)
-    r = float(ss_xy / math.sqrt(ss_xx * ss_yy)) if ss_xx > 0 and ss_yy > 0 else 0.0
-    return LinearFit(float(slope), float(intercept), r, r * r)
+    return _linear_fit_result(slope, intercept, x.size, float(x.size), x_mean, ss_xx, ss_xy, ss_yy)
+
+
+LINEAR_FIT_DTYPE = np.dtype([
+    ("slope", float), ("intercept", float), ("r_value", float), ("r_squared", float), ("n", np.int64),
+    ("residual_std_error", float), ("slope_std_error", float), ("intercept_std_error", float),
+])
+
+
+def linear_fit_batch(x: ArrayLike, y: ArrayLike, as_frame: bool = False):
+    """
+    Ajusta muitas curvas de uma vez: y com forma (n_curvas, n_pontos) e x com
+    a mesma forma ou (n_pontos,) compartilhado. Pontos NaN (em x ou y) são
+    ignorados, o que permite curvas de tamanhos diferentes.
+
+    Somas centradas por linha em forma fechada; retorna um array estruturado
+    (LINEAR_FIT_DTYPE) ou um pandas DataFrame (as_frame=True). Curvas com
+    menos de 2 pontos válidos ou x constante ficam com NaN.
+    """
+    y = np.atleast_2d(np.asarray(y, dtype=float))
+    x = np.asarray(x, dtype=float)
+    if y.ndim != 2:
+        raise ValueError("y deve ter forma (n_curvas, n_pontos)")
+    try:
+        x = np.broadcast_to(x, y.shape)
+    except ValueError:
+        raise ValueError("x deve ter a forma de y ou (n_pontos,)") from None
+
+    valid = np.isfinite(x) & np.isfinite(y)
+    n = valid.sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x_mean = np.where(valid, x, 0.0).sum(axis=1) / n
+        y_mean = np.where(valid, y, 0.0).sum(axis=1) / n
+        dx = np.where(valid, x - x_mean[:, None], 0.0)
+        dy = np.where(valid, y - y_mean[:, None], 0.0)
+        ss_xx = np.einsum("ij,ij->i", dx, dx)
+        ss_xy = np.einsum("ij,ij->i", dx, dy)
+        ss_yy = np.einsum("ij,ij->i", dy, dy)
+        ok = (n >= 2) & (ss_xx > 0)
+        slope = np.where(ok, ss_xy / ss_xx, np.nan)
+        r = np.where(ok, np.where(ss_yy > 0, ss_xy / np.sqrt(ss_xx * ss_yy), 0.0), np.nan)
+        s = np.where(ok & (n > 2), np.sqrt(np.maximum(ss_yy - ss_xy * slope, 0.0) / (n - 2)), np.nan)
+        slope_se = s / np.sqrt(ss_xx)
+        intercept_se = s * np.sqrt(1.0 / n + x_mean ** 2 / ss_xx)
+
+    result = np.empty(y.shape[0], dtype=LINEAR_FIT_DTYPE)
+    result["slope"] = slope
+    result["intercept"] = y_mean - slope * x_mean
+    result["r_value"] = r
+    result["r_squared"] = r * r
+    result["n"] = n
+    result["residual_std_error"] = s
+    result["slope_std_error"] = slope_se
+    result["intercept_std_error"] = intercept_se
+    if as_frame:
+        import pandas as pd
+        return pd.DataFrame(result)
+    return result
+
+
+LINEAR_FIT_WEIGHTINGS = ("none", "1/x", "1/x2", "1/sigma2")
+
+
+class OnlineLinearFit:
+    """
+    Regressão linear (ponderada) por acumuladores: médias e co-momentos
+    ponderados atualizados a cada ponto (algoritmo de West), de modo que
+    adicionar ou remover um ponto custa O(1) e o ajuste está sempre pronto.
+
+    weighting: "none", "1/x", "1/x2" ou "1/sigma2" (sigma informado por ponto).
+    A remoção é a atualização inversa (peso negativo): o ponto precisa ter
+    sido adicionado antes com os mesmos valores. Os pares (x, peso) ficam
+    registrados para que LOD/LOQ usem o peso do padrão de menor concentração.
+    """
+
+    def __init__(self, weighting: str = "none"):
+        if weighting not in LINEAR_FIT_WEIGHTINGS:
+            raise ValueError(f"Ponderação deve ser uma de {LINEAR_FIT_WEIGHTINGS}")
+        self.weighting = weighting
+        self.reset()
+
+    def reset(self) -> None:
+        self.n = 0
+        self.sum_weights = 0.0
+        self.x_mean = 0.0
+        self.y_mean = 0.0
+        self.ss_xx = 0.0
+        self.ss_xy = 0.0
+        self.ss_yy = 0.0
+        self._points: Counter = Counter()
+
+    def weight(self, x: float, sigma: float | None = None) -> float:
+        """Peso (bruto) que a ponderação do ajuste atribui a um ponto."""
+        if self.weighting == "none":
+            return 1.0
+        if self.weighting == "1/sigma2":
+            if sigma is None or sigma <= 0:
+                raise ValueError("Informe sigma positivo para ponderação 1/σ²")
+            return 1.0 / sigma ** 2
+        if x <= 0:
+            raise ValueError("Ponderação 1/x exige x positivo")
+        return 1.0 / x if self.weighting == "1/x" else 1.0 / x ** 2
+
+    def _update(self, x: float, y: float, w: float) -> None:
+        total = self.sum_weights + w
+        dx = x - self.x_mean
+        dy = y - self.y_mean
+        self.x_mean += w * dx / total
+        self.y_mean += w * dy / total
+        self.ss_xx += w * dx * (x - self.x_mean)
+        self.ss_xy += w * dx * (y - self.y_mean)
+        self.ss_yy += w * dy * (y - self.y_mean)
+        self.sum_weights = total
+
+    def add(self, x: float, y: float, sigma: float | None = None) -> None:
+        """Inclui um ponto."""
+        w = self.weight(x, sigma)
+        self._update(float(x), float(y), w)
+        self._points[(float(x), w)] += 1
+        self.n += 1
+
+    def remove(self, x: float, y: float, sigma: float | None = None) -> None:
+        """Retira um ponto previamente adicionado (ex.: outlier), sem reajustar."""
+        if self.n == 0:
+            raise ValueError("Nenhum ponto para remover")
+        w = self.weight(x, sigma)
+        key = (float(x), w)
+        if self._points[key] == 0:
+            del self._points[key]
+            raise ValueError("Ponto não foi adicionado ao ajuste")
+        if self.n == 1:
+            self.reset()
+            return
+        self._update(float(x), float(y), -w)
+        self._points[key] -= 1
+        if self._points[key] == 0:
+            del self._points[key]
+        self.n -= 1
+
+    def extend(self, x: ArrayLike, y: ArrayLike, sigma: ArrayLike | None = None) -> None:
+        """Inclui um bloco de pontos de uma vez (combinação de Chan dos momentos)."""
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        if x.size != y.size:
+            raise ValueError("x e y devem ter mesmo tamanho")
+        if x.size == 0:
+            return
+        if self.weighting == "none":
+            w = np.ones_like(x)
+        elif self.weighting == "1/sigma2":
+            if sigma is None:
+                raise ValueError("Informe sigma positivo para ponderação 1/σ²")
+            sigma = np.broadcast_to(np.asarray(sigma, dtype=float), x.shape)
+            if np.any(sigma <= 0):
+                raise ValueError("Informe sigma positivo para ponderação 1/σ²")
+            w = 1.0 / sigma ** 2
+        else:
+            if np.any(x <= 0):
+                raise ValueError("Ponderação 1/x exige x positivo")
+            w = 1.0 / x if self.weighting == "1/x" else 1.0 / x ** 2
+        w_block = float(w.sum())
+        mx = float(np.dot(w, x)) / w_block
+        my = float(np.dot(w, y)) / w_block
+        dx, dy = x - mx, y - my
+        total = self.sum_weights + w_block
+        delta_x = mx - self.x_mean
+        delta_y = my - self.y_mean
+        factor = self.sum_weights * w_block / total
+        self.ss_xx += float(np.dot(w * dx, dx)) + factor * delta_x * delta_x
+        self.ss_xy += float(np.dot(w * dx, dy)) + factor * delta_x * delta_y
+        self.ss_yy += float(np.dot(w * dy, dy)) + factor * delta_y * delta_y
+        self.x_mean += delta_x * w_block / total
+        self.y_mean += delta_y * w_block / total
+        self.sum_weights = total
+        self._points.update(zip(x.tolist(), w.tolist()))
+        self.n += x.size
+
+    def _check(self) -> None:
+        if self.n < 2 or self.ss_xx <= 0:
+            raise ValueError("Necessário pelo menos 2 pontos com x distintos")
+
+    @property
+    def slope(self) -> float:
+        self._check()
+        return self.ss_xy / self.ss_xx
+
+    @property
+    def intercept(self) -> float:
+        return self.y_mean - self.slope * self.x_mean
+
+    @property
+    def r_value(self) -> float:
+        self._check()
+        return self.ss_xy / math.sqrt(self.ss_xx * self.ss_yy) if self.ss_yy > 0 else 0.0
+
+    @property
+    def r_squared(self) -> float:
+        return self.r_value ** 2
+
+    def _low_end_weight(self) -> float:
+        """Peso médio (bruto) dos pontos no menor x."""
+        x_low = min(x for x, _ in self._points)
+        count = total = 0.0
+        for (x, w), k in self._points.items():
+            if x == x_low:
+                count += k
+                total += k * w
+        return total / count
+
+    def result(self) -> LinearFit:
+        """Ajuste atual como LinearFit (com erros-padrão, bandas e predição inversa)."""
+        return _linear_fit_result(self.slope, self.intercept, self.n, self.sum_weights, self.x_mean,
+                                  self.ss_xx, self.ss_xy, self.ss_yy, self.weighting,
+                                  self._low_end_weight())
 
 
 # --- Periodic Table and Molecular Mass ---
@@ -194,72 +1042,140 @@ PERIODIC_TABLE = {
 }
 
 
+# Tokens reconhecidos em uma única varredura da fórmula:
+# elemento + contagem, abertura de grupo, fechamento + multiplicador,
+# separador de hidrato + coeficiente e qualquer outro caractere (erro).
+_FORMULA_TOKEN = re.compile(
+    r'([A-Z][a-z]?)(\d*)|([(\[{])|([)\]}])(\d*)|([·•*.])(\d*)|(.)'
+)
+# Carga no fim da fórmula: "^2-", "^+", "+3", "-2", "+", "--" e, após
+# colchete/parêntese, "]4-" / ")2+" (o número é a carga).
+_FORMULA_CHARGE = re.compile(r'(?:\^(\d*)([+-])|([+-])(\d+)|([)\]}]?)(\d*)([+-]+))$')
+# Dígitos entre elemento e sinal são ambíguos (carga ou contagem?) quando há
+# mais de um ("SO42-", "Hg22+") ou a fórmula é um só elemento ("Fe3+", "H2+");
+# um único dígito em fórmula poliatômica é contagem ("NO3-", "NH4+").
+_BARE_ELEMENT = re.compile(r'[A-Z][a-z]?\d+')
+_CLOSING_BRACKET = {')': '(', ']': '[', '}': '{'}
+
+
+@lru_cache(maxsize=65536)
+def _parse_formula_cached(formula: str) -> Tuple[Dict[str, int], int]:
+    """
+    Tokenizador de passada única baseado em pilha.
+    Retorna (contagens, carga) e fica memoizado por fórmula; o dicionário
+    em cache é compartilhado e nunca deve ser modificado por quem chama.
+    """
+    formula = formula.replace(' ', '')
+
+    charge = 0
+    charge_match = _FORMULA_CHARGE.search(formula) if ('+' in formula or '-' in formula) else None
+    if charge_match:
+        digits_caret, sign_caret, sign_num, digits_num, bracket, digits, signs = charge_match.groups()
+        end = charge_match.start()
+        if sign_caret:
+            charge = int(digits_caret or 1) * (1 if sign_caret == '+' else -1)
+        elif sign_num:
+            charge = int(digits_num) * (1 if sign_num == '+' else -1)
+        else:
+            if len(set(signs)) > 1:
+                raise ValueError(f"Carga inválida: {signs}")
+            sign = 1 if signs[0] == '+' else -1
+            if bracket and digits:
+                if len(signs) > 1:
+                    raise ValueError(f"Carga inválida: {digits}{signs}")
+                charge = int(digits) * sign
+                end += 1
+            else:
+                if digits and (len(digits) > 1 or _BARE_ELEMENT.fullmatch(formula, 0, end + len(digits))):
+                    raise ValueError(f"Carga ambígua em '{formula}': indique-a com '^' "
+                                     f"(ex.: 'SO4^2-', 'Fe^3+', 'H2^+')")
+                charge = len(signs) * sign
+                end += len(bracket) + len(digits)
+        formula = formula[:end]
+
+    # Coeficiente inicial (ex.: "5H2O" em uma parte de hidrato)
+    coefficient = 1
+    pos = 0
+    if formula[:1].isdigit():
+        while pos < len(formula) and formula[pos].isdigit():
+            pos += 1
+        coefficient = int(formula[:pos])
+
+    # group: contagens do grupo aberto; stack: (colchete, grupo externo)
+    total: Dict[str, int] = {}
+    group: Dict[str, int] = {}
+    stack: List[Tuple[str, Dict[str, int]]] = []
+
+    for element, count, opening, closing, multiplier, separator, part_coef, invalid in \
+            _FORMULA_TOKEN.findall(formula, pos):
+        if element:
+            group[element] = group.get(element, 0) + (int(count) if count else 1)
+        elif opening:
+            stack.append((opening, group))
+            group = {}
+        elif closing:
+            if not stack:
+                raise ValueError("Parênteses/colchetes desbalanceados")
+            bracket, outer = stack.pop()
+            if _CLOSING_BRACKET[closing] != bracket:
+                raise ValueError("Tipos de parênteses/colchetes não coincidem")
+            factor = int(multiplier) if multiplier else 1
+            for el, n in group.items():
+                outer[el] = outer.get(el, 0) + n * factor
+            group = outer
+        elif separator:
+            if stack:
+                raise ValueError("Parênteses/colchetes desbalanceados")
+            for el, n in group.items():
+                total[el] = total.get(el, 0) + n * coefficient
+            group = {}
+            coefficient = int(part_coef) if part_coef else 1
+        else:
+            raise ValueError(f"Caractere inválido na fórmula: '{invalid}'")
+
+    if stack:
+        raise ValueError("Parênteses/colchetes desbalanceados")
+    for el, n in group.items():
+        total[el] = total.get(el, 0) + n * coefficient
+    # elementos validados uma vez só, ao final
+    if not PERIODIC_TABLE.keys() >= total.keys():
+        unknown = next(el for el in total if el not in PERIODIC_TABLE)
+        raise ValueError(f"Elemento desconhecido: {unknown}")
+
+    return total, charge
+
+
 def parse_chemical_formula(formula: str) -> Dict[str, int]:
     """
     Parse a chemical formula and return element counts.
     Examples: 'H2SO4' -> {'H': 2, 'S': 1, 'O': 4}
               'Ca(OH)2' -> {'Ca': 1, 'O': 2, 'H': 2}
               'K3[Fe(CN)6]' -> {'K': 3, 'Fe': 1, 'C': 6, 'N': 6}
+              'CuSO4·5H2O' -> {'Cu': 1, 'S': 1, 'O': 9, 'H': 10}
+    Groups may nest with (), [] and {}. Hydrate parts are separated by
+    '·', '•', '*' or '.'. A trailing charge ('SO4^2-', 'NH4+', 'Fe+3',
+    '[Fe(CN)6]4-') is accepted and ignored here; use parse_formula_charge to
+    read it. A number right after a closing bracket is the charge; a single
+    digit before the sign of a polyatomic formula is a count ('NO3-'). Other
+    digits before the sign are ambiguous ('SO42-', 'Fe3+', 'H2+') and raise
+    ValueError: write the charge with '^' ('SO4^2-', 'Fe^3+', 'H2^+').
+    Results are memoized, so repeated formulas are parsed only once.
     """
-    formula = formula.replace(' ', '')
-    
-    # Handle both parentheses and brackets
-    while '(' in formula or '[' in formula:
-        # Find innermost parentheses or brackets
-        start = -1
-        bracket_type = None
-        
-        for i, char in enumerate(formula):
-            if char in '([':
-                start = i
-                bracket_type = char
-            elif char in ')]':
-                if start == -1:
-                    raise ValueError("Parênteses/colchetes desbalanceados")
-                
-                # Check if closing bracket matches opening
-                if (bracket_type == '(' and char != ')') or (bracket_type == '[' and char != ']'):
-                    raise ValueError("Tipos de parênteses/colchetes não coincidem")
-                
-                # Extract content and multiplier
-                content = formula[start+1:i]
-                after_bracket = formula[i+1:]
-                
-                # Find the multiplier after closing bracket
-                multiplier_match = re.match(r'^(\d+)', after_bracket)
-                multiplier = int(multiplier_match.group(1)) if multiplier_match else 1
-                
-                # Parse content inside brackets
-                inner_elements = parse_simple_formula(content)
-                
-                # Apply multiplier
-                expanded = ''
-                for element, count in inner_elements.items():
-                    expanded += element + str(count * multiplier)
-                
-                # Replace in formula
-                end_pos = i + 1 + (len(multiplier_match.group(1)) if multiplier_match else 0)
-                formula = formula[:start] + expanded + formula[end_pos:]
-                break
-    
-    return parse_simple_formula(formula)
+    return _parse_formula_cached(formula)[0].copy()
+
+
+def parse_formula_charge(formula: str) -> int:
+    """
+    Return the net charge written at the end of a formula.
+    Examples: 'SO4^2-' -> -2, 'NH4+' -> 1, 'Fe+3' -> 3, 'Fe^3+' -> 3,
+              '[Fe(CN)6]4-' -> -4, 'H2O' -> 0
+    """
+    return _parse_formula_cached(formula)[1]
 
 
 def parse_simple_formula(formula: str) -> Dict[str, int]:
     """Parse a simple formula without parentheses."""
-    elements = {}
-    pattern = r'([A-Z][a-z]?)(\d*)'
-    
-    for match in re.finditer(pattern, formula):
-        element = match.group(1)
-        count = int(match.group(2)) if match.group(2) else 1
-        
-        if element not in PERIODIC_TABLE:
-            raise ValueError(f"Elemento desconhecido: {element}")
-        
-        elements[element] = elements.get(element, 0) + count
-    
-    return elements
+    return parse_chemical_formula(formula)
 
 
 def calculate_molar_mass(formula: str) -> float:
@@ -276,78 +1192,504 @@ def calculate_molar_mass(formula: str) -> float:
         raise ValueError(f"Erro ao calcular massa molar: {str(e)}")
 
 
+
+# Índice fixo dos elementos (ordem de PERIODIC_TABLE) para cálculos em lote
+ELEMENT_SYMBOLS: Tuple[str, ...] = tuple(PERIODIC_TABLE)
+ELEMENT_INDEX: Dict[str, int] = {el: i for i, el in enumerate(ELEMENT_SYMBOLS)}
+ATOMIC_MASS_VECTOR = np.array([PERIODIC_TABLE[el] for el in ELEMENT_SYMBOLS], dtype=float)
+
+
+def formula_count_matrix(formulas: Iterable[str]) -> Tuple[sparse.csr_matrix, Dict[int, str]]:
+    """
+    Monta a matriz esparsa (n_fórmulas × n_elementos) de contagens atômicas,
+    com colunas na ordem de PERIODIC_TABLE.
+    Fórmulas inválidas ficam com linha vazia e a mensagem vai para o
+    dicionário de erros {linha: mensagem}.
+    """
+    rows: List[int] = []
+    cols: List[int] = []
+    vals: List[int] = []
+    errors: Dict[int, str] = {}
+    n = 0
+    for n, formula in enumerate(formulas, start=1):
+        i = n - 1
+        text = formula.strip() if isinstance(formula, str) else ''
+        if not text:
+            errors[i] = "Fórmula vazia"
+            continue
+        try:
+            elements = _parse_formula_cached(text)[0]
+        except ValueError as e:
+            errors[i] = str(e)
+            continue
+        for element, count in elements.items():
+            rows.append(i)
+            cols.append(ELEMENT_INDEX[element])
+            vals.append(count)
+    counts = sparse.csr_matrix(
+        (np.asarray(vals, dtype=float), (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp))),
+        shape=(n, len(ELEMENT_SYMBOLS)),
+    )
+    return counts, errors
+
+
+def batch_molar_mass(formulas: Iterable[str]) -> dict:
+    """
+    Massa molar e composição percentual de uma coluna inteira de fórmulas.
+    M = N · m, onde N é a matriz esparsa de contagens e m o vetor de massas.
+    Aceita listas, arrays ou pandas Series. Linhas inválidas recebem NaN
+    e aparecem em "errors" em vez de interromper o lote.
+    """
+    formulas = list(formulas)
+    counts, errors = formula_count_matrix(formulas)
+
+    molar_mass = counts @ ATOMIC_MASS_VECTOR
+    if errors:
+        molar_mass[list(errors)] = np.nan
+
+    # Massa de cada elemento por linha, normalizada pela massa molar da linha
+    element_mass = counts.multiply(ATOMIC_MASS_VECTOR).tocsr()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inv_mass = np.where(molar_mass > 0, 100.0 / molar_mass, 0.0)
+    percent = sparse.diags(inv_mass) @ element_mass
+
+    return {
+        "formulas": formulas,
+        "elements": ELEMENT_SYMBOLS,
+        "counts": counts,
+        "molar_mass": molar_mass,
+        "percent_composition": percent.tocsr(),
+        "errors": errors,
+    }
+
+
+def hill_formula(elements: Dict[str, int]) -> str:
+    """
+    Write element counts in Hill notation (C, H, then alphabetical).
+    Example: {'O': 6, 'C': 6, 'H': 12} -> 'C6H12O6'
+    """
+    pairs = [(el, int(n)) for el, n in elements.items() if n > 0]
+    has_carbon = any(el == 'C' for el, _ in pairs)
+
+    def order(pair):
+        el = pair[0]
+        if has_carbon and el in ('C', 'H'):
+            return (0 if el == 'C' else 1, el)
+        return (2, el)
+
+    return ''.join(el if n == 1 else f"{el}{n}" for el, n in sorted(pairs, key=order))
+
+
+# --- Elemental analysis (empirical / molecular formula) ---
+
+def empirical_formula_from_analysis(samples, molar_mass: ArrayLike | None = None,
+                                    elements: Iterable[str] = ('C', 'H', 'N', 'S', 'O'),
+                                    tolerance: float = 0.4, max_multiplier: int = 12,
+                                    oxygen_by_difference: bool = True) -> dict:
+    """
+    Fórmula empírica (e molecular) a partir de análise elementar (% m/m).
+
+    samples: DataFrame/dicionário com uma coluna por elemento ou array
+        (n_amostras × n_elementos) na ordem de `elements`.
+    molar_mass: massa molar aproximada (escalar ou por amostra) para
+        obter a fórmula molecular; NaN/None deixa só a empírica.
+    tolerance: desvio máximo (pontos percentuais) entre a composição medida
+        e a recalculada a partir da fórmula inteira.
+
+    As razões molares de todas as amostras são aproximadas por inteiros em
+    uma única operação: para cada multiplicador k = 1..max_multiplier as
+    contagens round(k·razão) são recalculadas em % e só os k dentro da
+    tolerância são aceitos (o menor deles, ou o que melhor reproduz a massa
+    molar informada). Cada resultado é conferido com calculate_molar_mass.
+    """
+    if hasattr(samples, 'keys'):
+        elements = tuple(el for el in samples.keys() if el in PERIODIC_TABLE)
+        if oxygen_by_difference and 'O' not in elements:
+            elements = elements + ('O',)
+        columns = [np.atleast_1d(np.asarray(samples[el], dtype=float)) if el in samples
+                   else None for el in elements]
+        n = max(len(col) for col in columns if col is not None)
+        pct = np.column_stack([col if col is not None else np.full(n, np.nan) for col in columns])
+    else:
+        elements = tuple(elements)
+        pct = np.atleast_2d(np.asarray(samples, dtype=float))
+        if pct.shape[1] != len(elements):
+            raise ValueError("Número de colunas diferente do número de elementos")
+    if not elements:
+        raise ValueError("Nenhuma coluna de elemento reconhecida")
+    for el in elements:
+        if el not in PERIODIC_TABLE:
+            raise ValueError(f"Elemento desconhecido: {el}")
+    if tolerance <= 0 or max_multiplier < 1:
+        raise ValueError("Tolerância e multiplicador máximo devem ser positivos")
+
+    n_samples = pct.shape[0]
+    masses = np.array([PERIODIC_TABLE[el] for el in elements])
+
+    if oxygen_by_difference and 'O' in elements:
+        o = elements.index('O')
+        others = np.nansum(np.delete(pct, o, axis=1), axis=1)
+        missing = np.isnan(pct[:, o])
+        pct[missing, o] = np.maximum(100.0 - others[missing], 0.0)
+
+    pct = np.where(np.isnan(pct), 0.0, pct)
+    errors: Dict[int, str] = {}
+    for i in np.flatnonzero((pct < 0).any(axis=1)):
+        errors[int(i)] = "Porcentagens negativas"
+    for i in np.flatnonzero(pct.sum(axis=1) <= 0):
+        errors[int(i)] = "Nenhuma porcentagem informada"
+    for i in np.flatnonzero(pct.sum(axis=1) > 100.0 + tolerance):
+        errors.setdefault(int(i), "Soma das porcentagens acima de 100%")
+    valid = np.ones(n_samples, dtype=bool)
+    valid[list(errors)] = False
+    pct[~valid] = 0.0
+
+    measured = pct / np.where(valid, pct.sum(axis=1), 1.0)[:, None] * 100.0
+    moles = pct / masses
+    present = moles > 0
+    smallest = np.where(present, moles, np.inf).min(axis=1)
+    ratios = moles / np.where(np.isfinite(smallest), smallest, 1.0)[:, None]
+
+    # (amostra, k, elemento): contagens inteiras candidatas para cada multiplicador
+    k = np.arange(1, max_multiplier + 1, dtype=float)
+    counts = np.rint(ratios[:, None, :] * k[None, :, None])
+    counts = np.where(present[:, None, :], np.maximum(counts, 1.0), 0.0)
+    mass_k = counts @ masses
+    safe_mass = np.where(mass_k > 0, mass_k, 1.0)
+    theory = counts * masses / safe_mass[..., None] * 100.0
+    deviation = np.abs(theory - measured[:, None, :]).max(axis=2)
+    within = deviation <= tolerance
+
+    # Sem massa molar: menor k dentro da tolerância. Com massa molar: entre os
+    # k aceitos, o que leva à massa molecular mais próxima da informada.
+    if molar_mass is None:
+        approx = np.full(n_samples, np.nan)
+    else:
+        approx = np.broadcast_to(np.asarray(molar_mass, dtype=float), (n_samples,))
+    has_mass = np.isfinite(approx) & (approx > 0)
+    factor_k = np.where(has_mass[:, None], np.maximum(np.rint(approx[:, None] / safe_mass), 1.0), 1.0)
+    mass_error = np.where(has_mass[:, None], np.abs(mass_k * factor_k - approx[:, None]) / approx[:, None], 0.0)
+    score = np.where(within, mass_error, np.inf) + k * 1e-9
+    best = np.where(within.any(axis=1), score.argmin(axis=1), deviation.argmin(axis=1))
+
+    rows = np.arange(n_samples)
+    mol_counts = (counts[rows, best] * factor_k[rows, best][:, None]).astype(np.int64)
+    divisor = np.gcd.reduce(mol_counts, axis=1)
+    divisor = np.where(divisor > 0, divisor, 1)
+    emp_counts = mol_counts // divisor[:, None]
+    factor = np.where(has_mass, divisor, 1)
+    mol_counts = emp_counts * factor[:, None]
+    emp_mass = emp_counts @ masses
+    emp_dev = deviation[rows, best]
+
+    empirical = []
+    molecular = []
+    for i in range(n_samples):
+        if not valid[i]:
+            empirical.append('')
+            molecular.append('')
+            continue
+        emp = hill_formula(dict(zip(elements, emp_counts[i])))
+        mol = hill_formula(dict(zip(elements, mol_counts[i])))
+        # Verificação independente pelo parser/massa molar padrão
+        if abs(calculate_molar_mass(emp) - emp_mass[i]) > 1e-6 * emp_mass[i]:
+            errors[i] = "Falha na verificação da massa molar"
+        empirical.append(emp)
+        molecular.append(mol)
+
+    nan_invalid = np.where(valid, 1.0, np.nan)
+    return {
+        "elements": elements,
+        "empirical_formula": empirical,
+        "empirical_counts": emp_counts,
+        "empirical_mass": emp_mass * nan_invalid,
+        "multiplier": factor,
+        "molecular_formula": molecular,
+        "molecular_counts": mol_counts,
+        "molecular_mass": emp_mass * factor * nan_invalid,
+        "max_deviation": emp_dev * nan_invalid,
+        "within_tolerance": within[rows, best] & valid,
+        "errors": errors,
+    }
+
+
+
+# --- Chemical equation balancing ---
+
+_REACTION_ARROW = re.compile(r'\s*(?:<=>|<->|->|=>|→|⇌|=)\s*')
+_SPECIES_SPLIT = re.compile(r'\s+\+\s+')
+_LEADING_COEFFICIENT = re.compile(r'^\d+\s*')
+
+
+def _species_composition(species: str) -> Tuple[Dict[str, int], int]:
+    """Composição e carga de uma espécie; 'e-' / 'e' representa o elétron."""
+    if species in ('e', 'e-', 'e^-'):
+        return {}, -1
+    return _parse_formula_cached(species)
+
+
+def _integer_nullspace(matrix: List[List[int]]) -> List[List[int]]:
+    """
+    Base inteira do espaço nulo por eliminação sem frações: cada operação
+    de linha usa só multiplicações inteiras e as linhas são reduzidas pelo
+    MDC, então os coeficientes permanecem exatos e pequenos.
+    """
+    rows = [list(r) for r in matrix if any(r)]
+    n_cols = len(matrix[0]) if matrix else 0
+    pivots: List[int] = []
+    r = 0
+    for col in range(n_cols):
+        pivot = next((i for i in range(r, len(rows)) if rows[i][col]), None)
+        if pivot is None:
+            continue
+        rows[r], rows[pivot] = rows[pivot], rows[r]
+        p = rows[r][col]
+        for i in range(len(rows)):
+            if i != r and rows[i][col]:
+                a = rows[i][col]
+                rows[i] = [p * x - a * y for x, y in zip(rows[i], rows[r])]
+                g = math.gcd(*rows[i])
+                if g > 1:
+                    rows[i] = [x // g for x in rows[i]]
+        pivots.append(col)
+        r += 1
+        if r == len(rows):
+            break
+
+    basis = []
+    for free in (c for c in range(n_cols) if c not in pivots):
+        scale = 1
+        for i, col in enumerate(pivots):
+            scale = scale * abs(rows[i][col]) // math.gcd(scale, abs(rows[i][col]))
+        vector = [0] * n_cols
+        vector[free] = scale
+        for i, col in enumerate(pivots):
+            vector[col] = -rows[i][free] * scale // rows[i][col]
+        g = math.gcd(*vector)
+        basis.append([x // g for x in vector])
+    return basis
+
+
+def balance_equation(equation: str) -> dict:
+    """
+    Balanceia uma equação química pelo espaço nulo inteiro da matriz
+    elemento × espécie (mais uma linha de carga).
+    Exemplos: 'Fe2O3 + CO -> Fe + CO2'
+              'MnO4- + H+ + e- -> Mn^2+ + H2O'
+              'Fe^3+ + e- -> Fe^2+'
+    As espécies são separadas por ' + ' (com espaços), o que permite
+    cargas como 'H+'. Coeficientes já escritos são ignorados.
+    """
+    sides = _REACTION_ARROW.split(equation.strip())
+    if len(sides) != 2 or not sides[0] or not sides[1]:
+        raise ValueError("Use uma seta (->, =, ⇌) separando reagentes e produtos")
+    reactants = [_LEADING_COEFFICIENT.sub('', sp) for sp in _SPECIES_SPLIT.split(sides[0].strip())]
+    products = [_LEADING_COEFFICIENT.sub('', sp) for sp in _SPECIES_SPLIT.split(sides[1].strip())]
+    species = reactants + products
+    if any(not sp for sp in species):
+        raise ValueError("Espécie vazia na equação")
+
+    compositions = [_species_composition(sp) for sp in species]
+    elements: List[str] = []
+    for comp, _ in compositions:
+        elements.extend(el for el in comp if el not in elements)
+    signs = [1] * len(reactants) + [-1] * len(products)
+    matrix = [[sign * comp.get(el, 0) for (comp, _), sign in zip(compositions, signs)] for el in elements]
+    matrix.append([sign * charge for (_, charge), sign in zip(compositions, signs)])
+
+    basis = _integer_nullspace(matrix)
+    if not basis:
+        raise ValueError("Não existe combinação que balanceie a equação")
+    if len(basis) > 1:
+        independent = "; ".join(
+            _format_reaction(species, [c * sign for c, sign in zip(v, signs)]) for v in basis
+        )
+        raise ValueError(
+            f"Equação degenerada: {len(basis)} reações independentes ({independent})"
+        )
+
+    coefficients = basis[0]
+    if all(c <= 0 for c in coefficients):
+        coefficients = [-c for c in coefficients]
+    if any(c <= 0 for c in coefficients):
+        raise ValueError("Não há solução com todos os coeficientes positivos")
+
+    return {
+        "reactants": list(zip(coefficients[:len(reactants)], reactants)),
+        "products": list(zip(coefficients[len(reactants):], products)),
+        "coefficients": coefficients,
+        "equation": _format_reaction(species, coefficients, len(reactants)),
+    }
+
+
+def _format_reaction(species: List[str], coefficients: List[int], n_reactants: int | None = None) -> str:
+    """
+    Monta a equação a partir dos coeficientes. Sem n_reactants, o sinal
+    decide o lado (positivo = reagente, negativo = produto).
+    """
+    def term(c, sp):
+        return sp if abs(c) == 1 else f"{abs(c)} {sp}"
+
+    if n_reactants is None:
+        left = [term(c, sp) for c, sp in zip(coefficients, species) if c > 0]
+        right = [term(c, sp) for c, sp in zip(coefficients, species) if c < 0]
+    else:
+        left = [term(c, sp) for c, sp in zip(coefficients[:n_reactants], species[:n_reactants])]
+        right = [term(c, sp) for c, sp in zip(coefficients[n_reactants:], species[n_reactants:])]
+    return " + ".join(left) + " -> " + " + ".join(right)
+
+
+def balance_equations(lines: Iterable[str]) -> dict:
+    """
+    Balanceia várias equações (ex.: as linhas de um arquivo).
+    Linhas vazias ou iniciadas por '#' são ignoradas; falhas não
+    interrompem o lote e ficam em "errors" {índice da linha: mensagem}.
+    """
+    equations: List[str] = []
+    coefficients: List[List[int] | None] = []
+    errors: Dict[int, str] = {}
+    for i, line in enumerate(lines):
+        text = line.strip()
+        if not text or text.startswith('#'):
+            equations.append('')
+            coefficients.append(None)
+            continue
+        try:
+            result = balance_equation(text)
+        except ValueError as e:
+            errors[i] = str(e)
+            equations.append('')
+            coefficients.append(None)
+            continue
+        equations.append(result["equation"])
+        coefficients.append(result["coefficients"])
+    return {"equations": equations, "coefficients": coefficients, "errors": errors}
+
 # --- Unit Conversions ---
 
-MASS_CONVERSIONS = {
-    'kg': 1000.0,
-    'g': 1.0,
-    'mg': 0.001,
-    'μg': 0.000001,
-    'ug': 0.000001  # Alternative for μg
+# Prefixos SI aplicados às unidades base do registro
+SI_PREFIXES = {
+    'G': 1e9, 'M': 1e6, 'k': 1e3, 'h': 1e2, 'da': 1e1,
+    'd': 1e-1, 'c': 1e-2, 'm': 1e-3, 'μ': 1e-6, 'µ': 1e-6, 'u': 1e-6,
+    'n': 1e-9, 'p': 1e-12, 'f': 1e-15,
 }
 
-VOLUME_CONVERSIONS = {
-    'L': 1.0,
-    'mL': 0.001,
-    'μL': 0.000001,
-    'uL': 0.000001  # Alternative for μL
-}
+# Registro único de unidades: símbolo -> (dimensão, fator, deslocamento).
+# valor_base = valor × fator + deslocamento, com bases g, L, mol, M (mol/L),
+# g/L, Pa, m e K.
+UNIT_REGISTRY: Dict[str, Tuple[str, float, float]] = {}
 
-CONCENTRATION_CONVERSIONS = {
-    'M': 1.0,
-    'mM': 0.001,
-    'μM': 0.000001,
-    'uM': 0.000001  # Alternative for μM
-}
 
+def register_unit(symbol: str, dimension: str, factor: float, offset: float = 0.0,
+                  prefixes: bool = False) -> None:
+    """Adiciona uma unidade (e, opcionalmente, suas variantes com prefixo SI)."""
+    UNIT_REGISTRY[symbol] = (dimension, factor, offset)
+    if prefixes:
+        for prefix, scale in SI_PREFIXES.items():
+            UNIT_REGISTRY.setdefault(prefix + symbol, (dimension, factor * scale, offset))
+    unit_conversion.cache_clear()
+
+
+@lru_cache(maxsize=1024)
+def unit_conversion(from_unit: str, to_unit: str) -> Tuple[float, float]:
+    """
+    Coeficientes (a, b) tais que valor_destino = a × valor_origem + b.
+    Ficam em cache por par de unidades; a dimensão é verificada aqui.
+    """
+    for unit in (from_unit, to_unit):
+        if unit not in UNIT_REGISTRY:
+            raise ValueError(f"Unidade desconhecida: {unit}")
+    dim_from, f_from, o_from = UNIT_REGISTRY[from_unit]
+    dim_to, f_to, o_to = UNIT_REGISTRY[to_unit]
+    if dim_from != dim_to:
+        raise ValueError(f"Unidades incompatíveis: {from_unit} ({dim_from}) e {to_unit} ({dim_to})")
+    return f_from / f_to, (o_from - o_to) / f_to
+
+
+def convert_units(value, from_unit: str, to_unit: str, dimension: str | None = None):
+    """
+    Converte escalares, listas, arrays NumPy ou pandas Series entre unidades
+    de mesma dimensão. Colunas inteiras são convertidas em uma única
+    operação vetorizada (a × valor + b); Series mantêm o índice.
+    """
+    if dimension is not None:
+        for unit in (from_unit, to_unit):
+            if UNIT_REGISTRY.get(unit, (None,))[0] != dimension:
+                raise ValueError(f"Unidades não suportadas. Use: {units_for_dimension(dimension)}")
+    a, b = unit_conversion(from_unit, to_unit)
+    if np.isscalar(value):
+        return float(value) * a + b
+    if not hasattr(value, 'dtype'):
+        value = np.asarray(value, dtype=float)
+    result = value * a
+    return result + b if b else result
+
+
+def units_for_dimension(dimension: str) -> List[str]:
+    """Símbolos registrados para uma dimensão."""
+    return [symbol for symbol, (dim, _, _) in UNIT_REGISTRY.items() if dim == dimension]
+
+
+register_unit('g', 'mass', 1.0, prefixes=True)
+register_unit('t', 'mass', 1e6)
+register_unit('L', 'volume', 1.0, prefixes=True)
+register_unit('l', 'volume', 1.0, prefixes=True)
+for _symbol, _factor in (('m3', 1e3), ('dm3', 1.0), ('cm3', 1e-3), ('mm3', 1e-6)):
+    register_unit(_symbol, 'volume', _factor)
+    register_unit(_symbol.replace('3', '³'), 'volume', _factor)
+register_unit('mol', 'amount', 1.0, prefixes=True)
+register_unit('M', 'concentration', 1.0, prefixes=True)
+register_unit('mol/L', 'concentration', 1.0)
+register_unit('mmol/L', 'concentration', 1e-3)
+register_unit('μmol/L', 'concentration', 1e-6)
+register_unit('g/L', 'mass_concentration', 1.0)
+register_unit('mg/L', 'mass_concentration', 1e-3)
+register_unit('μg/L', 'mass_concentration', 1e-6)
+register_unit('mg/mL', 'mass_concentration', 1.0)
+register_unit('Pa', 'pressure', 1.0, prefixes=True)
+register_unit('bar', 'pressure', 1e5, prefixes=True)
+register_unit('atm', 'pressure', 101325.0)
+register_unit('Torr', 'pressure', 101325.0 / 760.0)
+register_unit('mmHg', 'pressure', 133.322387415)
+register_unit('psi', 'pressure', 6894.757293168)
+register_unit('m', 'length', 1.0, prefixes=True)
+register_unit('K', 'temperature', 1.0)
+register_unit('°C', 'temperature', 1.0, 273.15)
+register_unit('°F', 'temperature', 5.0 / 9.0, 273.15 - 32.0 * 5.0 / 9.0)
+
+# Unidades usuais exibidas na interface (fator relativo à unidade base)
+MASS_CONVERSIONS = {u: UNIT_REGISTRY[u][1] for u in ('kg', 'g', 'mg', 'μg', 'ug')}
+VOLUME_CONVERSIONS = {u: UNIT_REGISTRY[u][1] for u in ('L', 'mL', 'μL', 'uL')}
+CONCENTRATION_CONVERSIONS = {u: UNIT_REGISTRY[u][1] for u in ('M', 'mM', 'μM', 'uM')}
 PRESSURE_CONVERSIONS = {
-    'atm': 1.0,
-    'bar': 0.98692,
-    'Pa': 9.8692e-6,
-    'kPa': 0.0098692,
-    'mmHg': 0.00131579,
-    'Torr': 0.00131579
+    u: UNIT_REGISTRY[u][1] / UNIT_REGISTRY['atm'][1]
+    for u in ('atm', 'bar', 'Pa', 'kPa', 'mmHg', 'Torr')
 }
 
 
-def convert_mass(value: float, from_unit: str, to_unit: str) -> float:
-    """Convert mass between different units."""
-    if from_unit not in MASS_CONVERSIONS or to_unit not in MASS_CONVERSIONS:
-        raise ValueError(f"Unidades não suportadas. Use: {list(MASS_CONVERSIONS.keys())}")
-    
-    # Convert to grams first, then to target unit
-    grams = value * MASS_CONVERSIONS[from_unit]
-    return grams / MASS_CONVERSIONS[to_unit]
+def convert_mass(value, from_unit: str, to_unit: str):
+    """Convert mass between different units (scalar, array or Series)."""
+    return convert_units(value, from_unit, to_unit, dimension='mass')
 
 
-def convert_volume(value: float, from_unit: str, to_unit: str) -> float:
-    """Convert volume between different units."""
-    if from_unit not in VOLUME_CONVERSIONS or to_unit not in VOLUME_CONVERSIONS:
-        raise ValueError(f"Unidades não suportadas. Use: {list(VOLUME_CONVERSIONS.keys())}")
-    
-    # Convert to liters first, then to target unit
-    liters = value * VOLUME_CONVERSIONS[from_unit]
-    return liters / VOLUME_CONVERSIONS[to_unit]
+def convert_volume(value, from_unit: str, to_unit: str):
+    """Convert volume between different units (scalar, array or Series)."""
+    return convert_units(value, from_unit, to_unit, dimension='volume')
 
 
-def convert_concentration(value: float, from_unit: str, to_unit: str) -> float:
+def convert_concentration(value, from_unit: str, to_unit: str):
     """Convert concentration between different units (molar only)."""
-    if from_unit not in CONCENTRATION_CONVERSIONS or to_unit not in CONCENTRATION_CONVERSIONS:
-        raise ValueError(f"Unidades não suportadas. Use: {list(CONCENTRATION_CONVERSIONS.keys())}")
-    
-    # Convert to M first, then to target unit
-    molar = value * CONCENTRATION_CONVERSIONS[from_unit]
-    return molar / CONCENTRATION_CONVERSIONS[to_unit]
+    return convert_units(value, from_unit, to_unit, dimension='concentration')
 
 
-def convert_pressure(value: float, from_unit: str, to_unit: str) -> float:
-    """Convert pressure between different units."""
-    if from_unit not in PRESSURE_CONVERSIONS or to_unit not in PRESSURE_CONVERSIONS:
-        raise ValueError(f"Unidades não suportadas. Use: {list(PRESSURE_CONVERSIONS.keys())}")
-    
-    # Convert to atm first, then to target unit
-    atm = value * PRESSURE_CONVERSIONS[from_unit]
-    return atm / PRESSURE_CONVERSIONS[to_unit]
+def convert_pressure(value, from_unit: str, to_unit: str):
+    """Convert pressure between different units (scalar, array or Series)."""
+    return convert_units(value, from_unit, to_unit, dimension='pressure')
+
+
+def convert_temperature(value, from_unit: str, to_unit: str):
+    """Convert temperature between °C, K and °F (scalar, array or Series)."""
+    return convert_units(value, from_unit, to_unit, dimension='temperature')
 
 
 def celsius_to_kelvin(celsius: float) -> float:
@@ -474,10 +1816,10 @@ def absolute_deviation(data: List[float], reference: float = None) -> List[float
     if not data:
         raise ValueError("Lista de dados não pode estar vazia")
     
-    data_array = np.array(data)
+    data_array = np.asarray(data, dtype=float)
     ref_value = reference if reference is not None else np.mean(data_array)
     
-    return [abs(x - ref_value) for x in data]
+    return np.abs(data_array - ref_value).tolist()
 
 
 def mean_deviation(data: List[float]) -> float:
@@ -488,8 +1830,8 @@ def mean_deviation(data: List[float]) -> float:
     if not data:
         raise ValueError("Lista de dados não pode estar vazia")
     
-    abs_devs = absolute_deviation(data)
-    return sum(abs_devs) / len(abs_devs)
+    data_array = np.asarray(data, dtype=float)
+    return float(np.mean(np.abs(data_array - data_array.mean())))
 
 
 def sample_variance(data: List[float]) -> float:
@@ -530,6 +1872,141 @@ def coefficient_of_variation(data: List[float]) -> float:
     return (std_dev / mean_val) * 100
 
 
+class RunningStatistics:
+    """
+    Estatística descritiva em fluxo: n, média, M2 = Σ(xi − x̄)², mínimo e
+    máximo, atualizados em O(1) por valor (algoritmo de Welford), sem guardar
+    os dados.
+
+    Blocos (extend) e acumuladores parciais de outros trechos ou processos
+    (merge) são combinados pela fórmula de Chan:
+    M2 = M2a + M2b + δ²·na·nb/n, com δ = x̄b − x̄a.
+    O objeto é picklável, de modo que workers podem devolver acumuladores.
+    Aceita apenas valores finitos e uma coluna por vez (NaN ou blocos 2-D
+    levantam ValueError em vez de contaminar média e extremos).
+    """
+
+    def __init__(self, data: ArrayLike | None = None):
+        self.reset()
+        if data is not None:
+            self.extend(data)
+
+    def reset(self) -> None:
+        self.n = 0
+        self.mean_value = 0.0
+        self.m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, value: float) -> None:
+        """Inclui um valor."""
+        value = float(value)
+        if not math.isfinite(value):
+            raise ValueError("Valores devem ser finitos (remova NaN antes de acumular)")
+        self.n += 1
+        delta = value - self.mean_value
+        self.mean_value += delta / self.n
+        self.m2 += delta * (value - self.mean_value)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def _combine(self, n: int, mean: float, m2: float, minimum: float, maximum: float) -> None:
+        if n == 0:
+            return
+        total = self.n + n
+        delta = mean - self.mean_value
+        self.m2 += m2 + delta * delta * self.n * n / total
+        self.mean_value += delta * n / total
+        self.n = total
+        self.minimum = min(self.minimum, minimum)
+        self.maximum = max(self.maximum, maximum)
+
+    def extend(self, values: ArrayLike, column: str | None = None) -> None:
+        """
+        Inclui um bloco de valores (momentos do bloco em numpy + Chan).
+        column: coluna a usar quando o bloco é uma tabela (ex.: DataFrame).
+        """
+        if column is not None:
+            values = values[column]
+        values = np.asarray(values, dtype=float)
+        if values.ndim > 1:
+            raise ValueError("Bloco deve ter uma única coluna (informe column)")
+        values = values.ravel()
+        if values.size == 0:
+            return
+        if not np.isfinite(values).all():
+            raise ValueError("Valores devem ser finitos (remova NaN antes de acumular)")
+        mean = float(values.mean())
+        deviations = values - mean
+        self._combine(values.size, mean, float(np.dot(deviations, deviations)),
+                      float(values.min()), float(values.max()))
+
+    def merge(self, other: "RunningStatistics") -> "RunningStatistics":
+        """Incorpora outro acumulador (ex.: de outro trecho ou processo)."""
+        self._combine(other.n, other.mean_value, other.m2, other.minimum, other.maximum)
+        return self
+
+    @classmethod
+    def from_chunks(cls, chunks, column: str | None = None) -> "RunningStatistics":
+        """
+        Acumula um iterável de blocos, ex.:
+        from_chunks(pandas.read_csv(..., chunksize=...), column="valor").
+        """
+        accumulator = cls()
+        for chunk in chunks:
+            accumulator.extend(chunk, column)
+        return accumulator
+
+    @property
+    def mean(self) -> float:
+        if self.n == 0:
+            raise ValueError("Lista de dados não pode estar vazia")
+        return self.mean_value
+
+    @property
+    def variance(self) -> float:
+        """Variância amostral s² = M2/(n − 1)."""
+        if self.n < 2:
+            raise ValueError("Necessário pelo menos 2 valores para variância amostral")
+        return self.m2 / (self.n - 1)
+
+    @property
+    def std_dev(self) -> float:
+        return math.sqrt(self.variance)
+
+    @property
+    def coefficient_of_variation(self) -> float:
+        """CV = (s / x̄) × 100%"""
+        if self.mean == 0:
+            raise ValueError("Média não pode ser zero para calcular CV")
+        return self.std_dev / self.mean * 100
+
+    def confidence_interval(self, confidence_level: float = 0.95, distribution: str = "t") -> dict:
+        """
+        IC da média: x̄ ± t(α/2,n-1)·s/√n ("t") ou x̄ ± z(α/2)·s/√n ("z", n ≥ 30),
+        no formato de confidence_interval_mean_small_n / _large_n.
+        """
+        if not 0 < confidence_level < 1:
+            raise ValueError("Nível de confiança deve estar entre 0 e 1")
+        if distribution not in ("t", "z"):
+            raise ValueError("Distribuição deve ser 't' ou 'z'")
+        if distribution == "z" and self.n < 30:
+            raise ValueError("Para usar distribuição normal, n deve ser ≥ 30")
+        std_dev = self.std_dev
+        alpha = 1 - confidence_level
+        result = {"mean": self.mean, "std_dev": std_dev, "n": self.n}
+        if distribution == "t":
+            critical = float(stats.t.ppf(1 - alpha / 2, self.n - 1))
+            result.update(df=self.n - 1, t_critical=critical)
+        else:
+            critical = float(stats.norm.ppf(1 - alpha / 2))
+            result["z_critical"] = critical
+        margin_error = critical * std_dev / math.sqrt(self.n)
+        result.update(margin_error=margin_error, lower_limit=self.mean - margin_error,
+                      upper_limit=self.mean + margin_error, confidence_level=confidence_level)
+        return result
+
+
 def correction_factor(n: int) -> float:
     """
     Fator de correção para amostras pequenas.
@@ -549,35 +2026,7 @@ def confidence_interval_mean_small_n(data: List[float], confidence_level: float
     if len(data) < 2:
         raise ValueError("Necessário pelo menos 2 valores")
     
-    if not 0 < confidence_level < 1:
-        raise ValueError("Nível de confiança deve estar entre 0 e 1")
-    
-    data_array = np.array(data)
-    n = len(data_array)
-    mean_val = np.mean(data_array)
-    std_dev = sample_standard_deviation(data)
-    
-    # Graus de liberdade
-    df = n - 1
-    
-    # Valor crítico t
-    alpha = 1 - confidence_level
-    t_critical = stats.t.ppf(1 - alpha/2, df)
-    
-    # Margem de erro
-    margin_error = t_critical * (std_dev / math.sqrt(n))
-    
-    return {
-        "mean": mean_val,
-        "std_dev": std_dev,
-        "n": n,
-        "df": df,
-        "t_critical": t_critical,
-        "margin_error": margin_error,
-        "lower_limit": mean_val - margin_error,
-        "upper_limit": mean_val + margin_error,
-        "confidence_level": confidence_level
-    }
+    return RunningStatistics(data).confidence_interval(confidence_level, "t")
 
 
 def confidence_interval_mean_large_n(data: List[float], confidence_level: float = 0.95) -> dict:
@@ -588,31 +2037,7 @@ def confidence_interval_mean_large_n(data: List[float], confidence_level: float
     if len(data) < 30:
         raise ValueError("Para usar distribuição normal, n deve ser ≥ 30")
     
-    if not 0 < confidence_level < 1:
-        raise ValueError("Nível de confiança deve estar entre 0 e 1")
-    
-    data_array = np.array(data)
-    n = len(data_array)
-    mean_val = np.mean(data_array)
-    std_dev = sample_standard_deviation(data)
-    
-    # Valor crítico z
-    alpha = 1 - confidence_level
-    z_critical = stats.norm.ppf(1 - alpha/2)
-    
-    # Margem de erro
-    margin_error = z_critical * (std_dev / math.sqrt(n))
-    
-    return {
-        "mean": mean_val,
-        "std_dev": std_dev,
-        "n": n,
-        "z_critical": z_critical,
-        "margin_error": margin_error,
-        "lower_limit": mean_val - margin_error,
-        "upper_limit": mean_val + margin_error,
-        "confidence_level": confidence_level
-    }
+    return RunningStatistics(data).confidence_interval(confidence_level, "z")
 
 
 def t_test_two_means(data1: List[float], data2: List[float], confidence_level: float = 0.95) -> dict:
@@ -0,0 +1,227 @@
+"""
+Potenciais de Nernst e diagramas de Pourbaix (E × pH).
+
+Cada espécie do elemento é descrita pela energia livre de formação
+(ΔGf°, kJ/mol); a energia livre relativa ao metal é linear em E e pH, de
+modo que a estabilidade em toda a grade é um único argmin vetorizado. As
+fronteiras dos domínios são traçadas por contorno (contourpy, o mesmo
+gerador usado pelo matplotlib).
+"""
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .calculations import (
+    GAS_CONSTANT,
+    KELVIN_OFFSET,
+    parse_chemical_formula,
+    parse_formula_charge,
+)
+
+FARADAY_CONSTANT = 96485.33212  # C·mol⁻¹
+WATER_FORMATION_ENERGY = -237.129  # ΔGf° H2O(l), kJ/mol
+
+
+def nernst_slope(n: int = 1, temperature: ArrayLike = 25.0) -> np.ndarray | float:
+    """Inclinação RT·ln10/(nF) em V por década (0,05916/n a 25 °C)."""
+    if np.any(np.asarray(n) <= 0):
+        raise ValueError("Número de elétrons deve ser positivo")
+    t = np.asarray(temperature, dtype=float) + KELVIN_OFFSET
+    if np.any(t <= 0):
+        raise ValueError("Temperatura abaixo do zero absoluto")
+    slope = GAS_CONSTANT * t * math.log(10) / (np.asarray(n, dtype=float) * FARADAY_CONSTANT)
+    return float(slope) if np.ndim(slope) == 0 else slope
+
+
+def standard_potential(delta_g: ArrayLike, n: int) -> np.ndarray | float:
+    """E° = −ΔG°/(nF), com ΔG° da semirreação de redução em kJ/mol."""
+    if np.any(np.asarray(n) <= 0):
+        raise ValueError("Número de elétrons deve ser positivo")
+    e0 = -np.asarray(delta_g, dtype=float) * 1000.0 / (np.asarray(n, dtype=float) * FARADAY_CONSTANT)
+    return float(e0) if np.ndim(e0) == 0 else e0
+
+
+def nernst_potential(e0: ArrayLike, n: int, oxidized: ArrayLike = 1.0, reduced: ArrayLike = 1.0,
+                     protons: float = 0.0, ph: ArrayLike = 0.0,
+                     temperature: ArrayLike = 25.0) -> np.ndarray | float:
+    """
+    Potencial de Nernst para Ox + m H⁺ + n e⁻ → Red.
+
+    E = E° − (RT·ln10/nF)·(log a_Red − log a_Ox + m·pH)
+
+    oxidized / reduced: atividades (ou concentrações, mol/L) já elevadas aos
+    coeficientes estequiométricos. Todos os argumentos aceitam arrays e são
+    combinados por broadcasting.
+    """
+    oxidized = np.asarray(oxidized, dtype=float)
+    reduced = np.asarray(reduced, dtype=float)
+    if np.any(oxidized <= 0) or np.any(reduced <= 0):
+        raise ValueError("Atividades devem ser positivas")
+    slope = nernst_slope(n, temperature)
+    potential = (np.asarray(e0, dtype=float)
+                 - slope * (np.log10(reduced) - np.log10(oxidized) + protons * np.asarray(ph, dtype=float)))
+    return float(potential) if np.ndim(potential) == 0 else potential
+
+
+# --- Pourbaix diagrams ---
+
+# ΔGf° (kJ/mol, 25 °C) das espécies de cada sistema. Cargas em notação
+# "Fe^3+" ou "Fe+3"; espécies carregadas são aquosas, neutras são sólidas.
+POURBAIX_SYSTEMS: Dict[str, List[Tuple[str, float]]] = {}
+
+
+def register_pourbaix_system(element: str, species: Sequence[Tuple[str, float]]) -> None:
+    """
+    Cadastra (ou substitui) as espécies (fórmula, ΔGf° em kJ/mol) de um
+    elemento. Cada fórmula só pode conter o elemento, O e H.
+    """
+    if not species:
+        raise ValueError("Informe ao menos uma espécie")
+    for formula, _ in species:
+        _species_composition(element, formula)
+    POURBAIX_SYSTEMS[element] = [(formula, float(delta_g)) for formula, delta_g in species]
+
+
+def _species_composition(element: str, formula: str) -> Tuple[float, float, float, int]:
+    """Átomos do elemento, O, H e carga de uma espécie."""
+    counts = parse_chemical_formula(formula)
+    if element not in counts:
+        raise ValueError(f"Espécie {formula} não contém {element}")
+    if set(counts) - {element, "O", "H"}:
+        raise ValueError(f"Espécie {formula} deve conter apenas {element}, O e H")
+    return counts[element], counts.get("O", 0), counts.get("H", 0), parse_formula_charge(formula)
+
+
+register_pourbaix_system("Fe", [
+    ("Fe", 0.0),
+    ("Fe^2+", -78.90),
+    ("Fe^3+", -4.70),
+    ("Fe3O4", -1015.4),
+    ("Fe2O3", -742.2),
+    ("HFeO2-", -379.2),
+])
+register_pourbaix_system("Cu", [
+    ("Cu", 0.0),
+    ("Cu^2+", 65.49),
+    ("Cu2O", -146.0),
+    ("CuO", -129.7),
+    ("HCuO2-", -258.5),
+    ("CuO2^2-", -183.6),
+])
+register_pourbaix_system("Zn", [
+    ("Zn", 0.0),
+    ("Zn^2+", -147.06),
+    ("ZnO", -320.5),
+    ("HZnO2-", -464.0),
+    ("ZnO2^2-", -384.2),
+])
+
+
+def water_stability_lines(ph: ArrayLike, temperature: float = 25.0) -> Dict[str, np.ndarray]:
+    """Limites de estabilidade da água (p = 1 bar): O2/H2O e H⁺/H2, em V vs. EPH."""
+    ph = np.asarray(ph, dtype=float)
+    slope = nernst_slope(1, temperature)
+    return {
+        "O2/H2O": standard_potential(2 * WATER_FORMATION_ENERGY, 4) - slope * ph,
+        "H+/H2": -slope * ph,
+    }
+
+
+def pourbaix_diagram(element: str, species: Sequence[Tuple[str, float]] | None = None,
+                     concentration: float = 1e-6, ph_range: Tuple[float, float] = (-2.0, 16.0),
+                     potential_range: Tuple[float, float] = (-2.0, 2.5),
+                     resolution: int | Tuple[int, int] = 1000, temperature: float = 25.0) -> dict:
+    """
+    Diagrama de Pourbaix de um elemento sobre uma grade E × pH.
+
+    species: lista (fórmula, ΔGf° kJ/mol); padrão POURBAIX_SYSTEMS[element].
+    concentration: atividade das espécies dissolvidas (mol/L); sólidos = 1.
+    resolution: pontos por eixo (ou (n_pH, n_E)).
+    temperature: °C; afeta apenas os termos RT (ΔGf° tabelados a 25 °C).
+
+    Para cada espécie (por átomo do elemento M):
+    M + o H2O → MOₒHₕ^q + (2o − h) H⁺ + (2o − h + q) e⁻
+    ΔG(E, pH)/F = ΔG°/F + (RT·ln10/F)·(log a − nH·pH) − ne·E
+    e a espécie estável em cada ponto é a de menor ΔG.
+
+    Retorna as grades de pH e E, o mapa de rótulos (n_E × n_pH, índice em
+    "species"), as linhas da água e, por domínio estável, as fronteiras
+    traçadas (arrays de pontos (pH, E)), a posição do rótulo e a fração da
+    área do diagrama.
+    """
+    import contourpy
+
+    if species is None:
+        if element not in POURBAIX_SYSTEMS:
+            raise ValueError(f"Sistema de Pourbaix desconhecido: {element}")
+        species = POURBAIX_SYSTEMS[element]
+    if not species:
+        raise ValueError("Informe ao menos uma espécie")
+    if concentration <= 0:
+        raise ValueError("Concentração deve ser positiva")
+    if ph_range[1] <= ph_range[0] or potential_range[1] <= potential_range[0]:
+        raise ValueError("Faixas de pH e potencial devem ser crescentes")
+    n_ph, n_e = (resolution, resolution) if np.ndim(resolution) == 0 else resolution
+    if min(n_ph, n_e) < 2:
+        raise ValueError("Use pelo menos 2 pontos por eixo")
+
+    slope = nernst_slope(1, temperature)
+    names, aqueous, offset, proton_term, electrons = [], [], [], [], []
+    for formula, delta_g in species:
+        atoms, oxygen, hydrogen, charge = _species_composition(element, formula)
+        o, h, q = oxygen / atoms, hydrogen / atoms, charge / atoms
+        n_h = 2 * o - h
+        dissolved = charge != 0
+        g0 = (delta_g / atoms - o * WATER_FORMATION_ENERGY) * 1000.0 / FARADAY_CONSTANT
+        names.append(formula)
+        aqueous.append(dissolved)
+        offset.append(g0 + (slope * math.log10(concentration) / atoms if dissolved else 0.0))
+        proton_term.append(-n_h * slope)
+        electrons.append(-(n_h + q))
+
+    ph = np.linspace(ph_range[0], ph_range[1], n_ph)
+    potential = np.linspace(potential_range[0], potential_range[1], n_e)
+    # ΔG_i(E, pH) = A_i + B_i·pH + C_i·E; argmin acumulado espécie a espécie
+    # evita materializar o cubo espécies × E × pH
+    best = offset[0] + proton_term[0] * ph[None, :] + electrons[0] * potential[:, None]
+    labels = np.zeros(best.shape, dtype=np.intp)
+    for i in range(1, len(names)):
+        energy = offset[i] + proton_term[i] * ph[None, :] + electrons[i] * potential[:, None]
+        lower = energy < best
+        labels[lower] = i
+        np.minimum(best, energy, out=best)
+
+    flat = labels.ravel()
+    area = np.bincount(flat, minlength=len(names))
+    ph_sum = np.bincount(flat, weights=np.broadcast_to(ph, labels.shape).ravel(), minlength=len(names))
+    e_sum = np.bincount(flat, weights=np.repeat(potential, n_ph), minlength=len(names))
+
+    domains = []
+    for i, name in enumerate(names):
+        if area[i] == 0:
+            continue
+        generator = contourpy.contour_generator(ph, potential, (labels == i).astype(np.float32))
+        domains.append({
+            "species": name,
+            "index": i,
+            "phase": "aq" if aqueous[i] else "s",
+            "boundaries": generator.lines(0.5),
+            "label_position": (float(ph_sum[i] / area[i]), float(e_sum[i] / area[i])),
+            "area_fraction": float(area[i] / flat.size),
+        })
+
+    return {
+        "element": element,
+        "ph": ph,
+        "potential": potential,
+        "labels": labels,
+        "species": names,
+        "domains": domains,
+        "water": water_stability_lines(ph, temperature),
+        "concentration": concentration,
+        "temperature": temperature,
+    }
@@ -0,0 +1,351 @@
+"""
+Solver geral de equilíbrio químico (ação das massas + balanço de massa).
+
+O sistema é descrito por componentes (H+, Ac-, Ca2+, ...) e espécies
+formadas a partir deles:
+
+    log cⱼ = log Kⱼ + Σᵢ Sⱼᵢ · log xᵢ        (xᵢ = concentração livre do componente)
+    Σⱼ Sⱼᵢ · cⱼ + Σₛ Pₛᵢ · mₛ = Tᵢ           (balanço de massa, mₛ = sólido formado)
+
+Newton-Raphson em log₁₀ x com jacobiano analítico
+∂Rᵢ/∂log xₖ = ln10 · Σⱼ Sⱼᵢ Sⱼₖ cⱼ, resolvido para milhares de condições
+ao mesmo tempo como um único sistema linear em lote. Componentes com
+atividade fixa (ex.: pH tamponado) e sólidos (conjunto ativo por índice de
+saturação) usam linhas de identidade para manter as formas uniformes.
+"""
+from __future__ import annotations
+
+import math
+from typing import Dict, List, Mapping, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .calculations import kw_at_temperature, log_activity_coefficient
+from .speciation import conjugate_acid_pkas
+
+LN10 = math.log(10)
+
+
+class EquilibriumSystem:
+    """
+    components: nomes dos componentes (cada um também é uma espécie, log K = 0).
+    species: {nome: ({componente: coeficiente}, log K de formação)}.
+    solids: {nome: ({componente: coeficiente}, log K de formação)}; para um sal
+        MₐXᵦ(s) formado de a M + b X, log K = −log Ksp.
+    charges: {componente: carga} (padrão 0); as cargas das espécies seguem da
+        estequiometria. Só são usadas nas correções de atividade.
+    """
+
+    def __init__(self, components: Sequence[str],
+                 species: Mapping[str, Tuple[Mapping[str, float], float]] | None = None,
+                 solids: Mapping[str, Tuple[Mapping[str, float], float]] | None = None,
+                 charges: Mapping[str, float] | None = None):
+        self.components = list(components)
+        if len(set(self.components)) != len(self.components):
+            raise ValueError("Componentes repetidos")
+        index = {name: i for i, name in enumerate(self.components)}
+
+        def build(table):
+            names, rows, log_k = [], [], []
+            for name, (stoichiometry, k) in (table or {}).items():
+                row = np.zeros(len(self.components))
+                for component, coefficient in stoichiometry.items():
+                    if component not in index:
+                        raise ValueError(f"Componente desconhecido em {name}: {component}")
+                    row[index[component]] = coefficient
+                names.append(name)
+                rows.append(row)
+                log_k.append(float(k))
+            matrix = np.array(rows, dtype=float).reshape(len(rows), len(self.components))
+            return names, matrix, np.array(log_k, dtype=float)
+
+        extra_names, extra_matrix, extra_log_k = build(species)
+        self.species: List[str] = self.components + extra_names
+        self.stoichiometry = np.vstack([np.eye(len(self.components)), extra_matrix])
+        self.log_k = np.concatenate([np.zeros(len(self.components)), extra_log_k])
+        self.solids, self.solid_stoichiometry, self.solid_log_k = build(solids)
+        charges = charges or {}
+        unknown = set(charges) - set(self.components)
+        if unknown:
+            raise ValueError(f"Componente desconhecido: {sorted(unknown)[0]}")
+        self.charges = self.stoichiometry @ np.array([float(charges.get(c, 0)) for c in self.components])
+
+    def component_index(self, name: str) -> int:
+        try:
+            return self.components.index(name)
+        except ValueError:
+            raise ValueError(f"Componente desconhecido: {name}") from None
+
+    def species_index(self, name: str) -> int:
+        try:
+            return self.species.index(name)
+        except ValueError:
+            raise ValueError(f"Espécie desconhecida: {name}") from None
+
+
+def _batch_columns(system: EquilibriumSystem, values, default: float) -> Tuple[np.ndarray, np.ndarray, tuple]:
+    """Dicionário {componente: valor/array} → matriz (lote × componentes) e máscara de presença."""
+    values = values or {}
+    columns = [np.asarray(values.get(name, default), dtype=float) for name in system.components]
+    present = [name in values for name in system.components]
+    unknown = set(values) - set(system.components)
+    if unknown:
+        raise ValueError(f"Componente desconhecido: {sorted(unknown)[0]}")
+    shape = np.broadcast_shapes(*(c.shape for c in columns))
+    matrix = np.stack([np.broadcast_to(c, shape).ravel() for c in columns], axis=-1)
+    return matrix, np.broadcast_to(np.array(present), matrix.shape).copy(), shape
+
+
+def _newton(S: np.ndarray, P: np.ndarray, log_k: np.ndarray, solid_log_k: np.ndarray,
+            totals: np.ndarray, fixed: np.ndarray, is_fixed: np.ndarray, v: np.ndarray,
+            amounts: np.ndarray, active: np.ndarray, tolerance: float, max_iterations: int,
+            max_step: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Newton em lote com conjunto ativo de sólidos. log_k/solid_log_k são por
+    linha (lote × espécies/sólidos); v, amounts e active são atualizados no
+    lugar. Retorna as máscaras de convergência e o número de iterações.
+    Linhas com jacobiano singular (ou passo não finito) são congeladas e
+    ficam como não convergidas, sem interromper as demais.
+    """
+    size, n = v.shape
+    s_count = P.shape[0]
+    dim = n + s_count
+    eye_n = np.eye(n, dtype=bool)
+    converged = np.zeros(size, dtype=bool)
+    failed = np.zeros(size, dtype=bool)
+    iterations = np.zeros(size, dtype=int)
+
+    for _ in range(max(1, 2 * s_count + 1)):
+        converged[:] = False
+        for it in range(max_iterations):
+            rows = np.flatnonzero(~converged & ~failed)
+            if rows.size == 0:
+                break
+            vr, ar, act = v[rows], amounts[rows], active[rows]
+            fx = is_fixed[rows]
+            with np.errstate(over="ignore", under="ignore"):
+                c = 10.0 ** (log_k[rows] + vr @ S.T)
+            balance = c @ S + ar @ P - totals[rows]
+            scale = c @ np.abs(S) + ar @ np.abs(P) + np.abs(totals[rows]) + 1e-300
+            residual = np.where(fx, vr - fixed[rows], balance / scale)
+
+            jac = np.zeros((rows.size, dim, dim))
+            jac[:, :n, :n] = LN10 * ((S.T * c[:, None, :]) @ S) / scale[:, :, None]
+            jac[:, :n, n:] = P.T[None, :, :] / scale[:, :, None]
+            jac[:, :n, :n] = np.where(fx[:, :, None], eye_n, jac[:, :n, :n])
+            jac[:, :n, n:] = np.where(fx[:, :, None], 0.0, jac[:, :n, n:])
+
+            if s_count:
+                saturation = solid_log_k[rows] + vr @ P.T
+                residual = np.concatenate([residual, np.where(act, saturation, ar)], axis=1)
+                jac[:, n:, :n] = np.where(act[:, :, None], P[None, :, :], 0.0)
+                jac[:, n:, n:] = np.where(act[:, :, None], 0.0, np.eye(s_count))
+
+            done = np.all(np.abs(residual) <= tolerance, axis=1)
+            converged[rows[done]] = True
+            iterations[rows] = it
+            if done.all():
+                break
+            try:
+                step = np.linalg.solve(jac, -residual[..., None])[..., 0]
+            except np.linalg.LinAlgError:
+                # um jacobiano singular não pode derrubar o lote: resolve linha a linha
+                step = np.zeros((rows.size, dim))
+                for i in range(rows.size):
+                    try:
+                        step[i] = np.linalg.solve(jac[i], -residual[i])
+                    except np.linalg.LinAlgError:
+                        step[i] = np.nan
+            bad = ~np.all(np.isfinite(step), axis=1)
+            if bad.any():
+                failed[rows[bad]] = True
+                step[bad] = 0.0
+            dv = step[:, :n]
+            # Limita o passo em log para manter a convergência a partir de chutes ruins
+            dv *= np.minimum(1.0, max_step / np.maximum(np.max(np.abs(dv), axis=1, keepdims=True), 1e-300))
+            v[rows] = vr + dv
+            amounts[rows] = ar + step[:, n:]
+
+        if not s_count:
+            break
+        saturation = solid_log_k + v @ P.T
+        dissolve = active & (amounts < 0)
+        precipitate = (~active) & (saturation > tolerance)
+        if not (dissolve.any() or precipitate.any()):
+            break
+        active[:] = (active & ~dissolve) | precipitate
+        amounts[:] = np.where(active, amounts, 0.0)
+    return converged & ~failed, iterations
+
+
+def solve_equilibrium(system: EquilibriumSystem, totals: Mapping[str, ArrayLike] | None = None,
+                      fixed: Mapping[str, ArrayLike] | None = None,
+                      initial_log: Mapping[str, ArrayLike] | None = None,
+                      activity_model: str = "ideal", background_ionic_strength: ArrayLike = 0.0,
+                      temperature: float = 25.0, tolerance: float = 1e-10,
+                      max_iterations: int = 200, max_step: float = 2.0) -> dict:
+    """
+    Resolve o equilíbrio para todas as condições de uma vez.
+
+    totals: {componente: concentração total Tᵢ (escalar ou array)}.
+    fixed: {componente: log₁₀ da atividade livre fixa}, ex.
+        {"H+": -ph}; o balanço de massa desse componente é ignorado.
+    initial_log: estimativa inicial de log₁₀ x (opcional).
+    activity_model: "ideal", "debye-huckel", "extended" ou "davies"; os log K
+        são termodinâmicos e a força iônica (espécies + fundo) é iterada até
+        a autoconsistência em cada linha.
+    Escalares e arrays são combinados por broadcasting.
+
+    Retorna log₁₀ das concentrações livres, concentrações de todas as
+    espécies, quantidade de cada sólido, índices de saturação, força iônica,
+    iterações e as máscaras "converged"/"error".
+    """
+    fixed = fixed or {}
+    n = len(system.components)
+    m = len(system.species)
+    s_count = len(system.solids)
+    totals_m, _, shape_t = _batch_columns(system, totals, 0.0)
+    fixed_m, is_fixed, shape_f = _batch_columns(system, fixed, 0.0)
+    background = np.asarray(background_ionic_strength, dtype=float)
+    shape = np.broadcast_shapes(shape_t, shape_f, background.shape)
+    size = int(np.prod(shape, dtype=int))
+    totals_m = np.broadcast_to(totals_m.reshape(shape_t + (n,)), shape + (n,)).reshape(size, n)
+    fixed_m = np.broadcast_to(fixed_m.reshape(shape_f + (n,)), shape + (n,)).reshape(size, n)
+    is_fixed = np.broadcast_to(is_fixed.reshape(shape_f + (n,)), shape + (n,)).reshape(size, n)
+    background = np.broadcast_to(background, shape).reshape(size)
+
+    S = system.stoichiometry
+    P = system.solid_stoichiometry
+    # Componente sem total e que só forma espécies com coeficiente ≥ 0: concentração nula
+    absent = (~is_fixed) & (totals_m == 0) & np.all(S >= 0, axis=0)
+    fixed_m = np.where(absent, -300.0, fixed_m)
+    is_fixed = is_fixed | absent
+
+    if initial_log is not None:
+        guess, _, shape_g = _batch_columns(system, initial_log, -7.0)
+        v = np.broadcast_to(guess.reshape(shape_g + (n,)), shape + (n,)).reshape(size, n).copy()
+    else:
+        with np.errstate(divide="ignore"):
+            v = np.where(totals_m > 0, np.log10(np.abs(totals_m)), -7.0)
+    v = np.where(is_fixed, fixed_m, v)
+
+    amounts = np.zeros((size, s_count))
+    active = np.zeros((size, s_count), dtype=bool)
+    ionic = background.copy()
+    ideal = activity_model == "ideal"
+    # γ da força iônica corrente; settled: linhas em que I já é autoconsistente
+    log_gamma = np.zeros((size, m)) if ideal else log_activity_coefficient(
+        system.charges, ionic[:, None], activity_model, temperature=temperature)
+    settled = np.full(size, ideal)
+
+    for _ in range(100):
+        # log K condicionais: log K' = log K + Σ Sⱼᵢ log γᵢ − log γⱼ
+        gamma_c = log_gamma[:, :n]
+        log_k = system.log_k + gamma_c @ S.T - log_gamma
+        solid_log_k = system.solid_log_k + gamma_c @ P.T
+        fixed_c = np.where(absent, fixed_m, fixed_m - gamma_c)
+        v = np.where(is_fixed, fixed_c, v)
+        converged, iterations = _newton(S, P, log_k, solid_log_k, totals_m, fixed_c, is_fixed, v,
+                                        amounts, active, tolerance, max_iterations, max_step)
+        if ideal:
+            break
+        with np.errstate(over="ignore", under="ignore"):
+            c = 10.0 ** (log_k + v @ S.T)
+        new_ionic = 0.5 * c @ system.charges ** 2 + background
+        settled = np.abs(new_ionic - ionic) <= 1e-10 * np.maximum(new_ionic, 1e-12)
+        if np.all(settled | ~np.isfinite(new_ionic)):
+            break
+        ionic = new_ionic
+        log_gamma = log_activity_coefficient(system.charges, ionic[:, None], activity_model,
+                                             temperature=temperature)
+    # γ, log K' e v retornados vêm da mesma força iônica
+    converged = converged & settled
+
+    with np.errstate(over="ignore", under="ignore"):
+        log_c = log_k + v @ S.T
+        if ideal:
+            ionic = 0.5 * 10.0 ** log_c @ system.charges ** 2 + background
+    result = {
+        "components": system.components,
+        "species": system.species,
+        "log_free": v.reshape(shape + (n,)),
+        "log_concentrations": log_c.reshape(shape + (m,)),
+        "concentrations": (10.0 ** log_c).reshape(shape + (m,)),
+        "log_activity_coefficients": log_gamma.reshape(shape + (m,)),
+        "ionic_strength": ionic.reshape(shape),
+        "solids": system.solids,
+        "precipitated": amounts.reshape(shape + (s_count,)),
+        "saturation_index": (solid_log_k + v @ P.T).reshape(shape + (s_count,)),
+        "iterations": iterations.reshape(shape),
+        "converged": converged.reshape(shape),
+        "error": ~converged.reshape(shape),
+    }
+    if "H+" in system.components:
+        h = system.component_index("H+")
+        result["ph"] = -(v[:, h] + log_gamma[:, h]).reshape(shape)
+    return result
+
+
+# --- Sistemas ácido-base ---
+
+def acid_base_system(acids: Mapping[str, Sequence[float]], kw: float = 1.0e-14,
+                     charges: Mapping[str, float] | None = None) -> EquilibriumSystem:
+    """
+    Sistema ácido-base com componentes H+ e a forma totalmente desprotonada
+    de cada ácido. acids: {nome: [pKa₁, pKa₂, ...]}. As espécies protonadas
+    recebem o nome "H{j}·nome" e OH- vem de Kw.
+    charges: carga da forma desprotonada (padrão −n, ácido HₙA neutro; use 0
+        para bases neutras B).
+    """
+    species = {"OH-": ({"H+": -1}, math.log10(kw))}
+    for name, pkas in acids.items():
+        pkas = list(pkas)
+        log_beta = 0.0
+        # HⱼA forma-se de A + j H+ com log βⱼ = Σ dos j últimos pKa
+        for j in range(1, len(pkas) + 1):
+            log_beta += pkas[-j]
+            species[f"H{j}·{name}"] = ({name: 1, "H+": j}, log_beta)
+    component_charges = {"H+": 1}
+    component_charges.update({name: -len(list(pkas)) for name, pkas in acids.items()})
+    component_charges.update(charges or {})
+    return EquilibriumSystem(["H+"] + list(acids), species, charges=component_charges)
+
+
+def mixture_ph(acids: Mapping[str, Tuple[ArrayLike, Sequence[float]]] | None = None,
+               bases: Mapping[str, Tuple[ArrayLike, Sequence[float]]] | None = None,
+               strong_acid: ArrayLike = 0.0, strong_base: ArrayLike = 0.0,
+               temperature: float = 25.0, activity_model: str = "ideal",
+               background_ionic_strength: ArrayLike = 0.0) -> dict:
+    """
+    pH de uma mistura arbitrária de ácidos/bases fracos e fortes.
+
+    acids: {nome: (concentração, [pKa...])} adicionados na forma HₙA.
+    bases: {nome: (concentração, [pKb...])} adicionados na forma B.
+    strong_acid / strong_base: concentrações de ácido/base forte monopróticos.
+    Concentrações podem ser arrays (um cálculo por linha). Os contraíons dos
+    eletrólitos fortes entram na força iônica. Retorna o mesmo dicionário de
+    solve_equilibrium (pH = −log a(H+) fora do modelo ideal).
+    """
+    acids = dict(acids or {})
+    bases = dict(bases or {})
+    if set(acids) & set(bases):
+        raise ValueError("Use nomes diferentes para ácidos e bases")
+    pkas = {name: list(pk) for name, (_, pk) in acids.items()}
+    pkas.update({name: conjugate_acid_pkas(pk, temperature) for name, (_, pk) in bases.items()})
+    system = acid_base_system(pkas, kw_at_temperature(temperature), {name: 0 for name in bases})
+
+    # Balanço de prótons: cada HₙA adicionado traz n prótons, OH- forte retira um
+    proton_total = np.asarray(strong_acid, dtype=float) - np.asarray(strong_base, dtype=float)
+    totals = {}
+    for name, (concentration, pk) in acids.items():
+        totals[name] = np.asarray(concentration, dtype=float)
+        proton_total = proton_total + len(pk) * totals[name]
+    for name, (concentration, _) in bases.items():
+        totals[name] = np.asarray(concentration, dtype=float)
+    totals["H+"] = proton_total
+    # Cl⁻/Na⁺ dos eletrólitos fortes: espectadores que só contam na força iônica
+    spectators = 0.5 * (np.asarray(strong_acid, dtype=float) + np.asarray(strong_base, dtype=float))
+    return solve_equilibrium(system, totals, activity_model=activity_model,
+                             background_ionic_strength=spectators + np.asarray(background_ionic_strength, dtype=float),
+                             temperature=temperature)
@@ -0,0 +1,433 @@
+"""
+Massas exatas e distribuição isotópica de fórmulas químicas.
+A distribuição é obtida por convolução no domínio da frequência (FFT),
+sem expansão combinatória das combinações isotópicas.
+"""
+from __future__ import annotations
+
+import math
+import re
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+from scipy import fft as sp_fft
+
+from .calculations import PERIODIC_TABLE, hill_formula, parse_chemical_formula, parse_formula_charge
+
+
+ELECTRON_MASS = 5.48579909065e-4  # u
+
+# Isótopos estáveis (massa exata em u, abundância natural em fração)
+# Fonte: NIST "Atomic Weights and Isotopic Compositions".
+ISOTOPE_TABLE: Dict[str, Tuple[Tuple[float, float], ...]] = {
+    'H': ((1.00782503223, 0.999885), (2.01410177812, 0.000115)),
+    'He': ((3.0160293201, 0.00000134), (4.00260325413, 0.99999866)),
+    'Li': ((6.0151228874, 0.0759), (7.0160034366, 0.9241)),
+    'Be': ((9.012183065, 1.0),),
+    'B': ((10.01293695, 0.199), (11.00930536, 0.801)),
+    'C': ((12.0, 0.9893), (13.00335483507, 0.0107)),
+    'N': ((14.00307400443, 0.99636), (15.00010889888, 0.00364)),
+    'O': ((15.99491461957, 0.99757), (16.99913175650, 0.00038), (17.99915961286, 0.00205)),
+    'F': ((18.99840316273, 1.0),),
+    'Ne': ((19.9924401762, 0.9048), (20.993846685, 0.0027), (21.991385114, 0.0925)),
+    'Na': ((22.9897692820, 1.0),),
+    'Mg': ((23.985041697, 0.7899), (24.985836976, 0.1000), (25.982592968, 0.1101)),
+    'Al': ((26.98153853, 1.0),),
+    'Si': ((27.97692653465, 0.92223), (28.97649466490, 0.04685), (29.973770136, 0.03092)),
+    'P': ((30.97376199842, 1.0),),
+    'S': ((31.9720711744, 0.9499), (32.9714589098, 0.0075), (33.967867004, 0.0425),
+          (35.96708071, 0.0001)),
+    'Cl': ((34.968852682, 0.7576), (36.965902602, 0.2424)),
+    'Ar': ((35.967545105, 0.003336), (37.96273211, 0.000629), (39.9623831237, 0.996035)),
+    'K': ((38.9637064864, 0.932581), (39.963998166, 0.000117), (40.9618252579, 0.067302)),
+    'Ca': ((39.962590863, 0.96941), (41.95861783, 0.00647), (42.95876644, 0.00135),
+           (43.95548156, 0.02086), (45.9536890, 0.00004), (47.95252276, 0.00187)),
+    'Sc': ((44.95590828, 1.0),),
+    'Ti': ((45.95262772, 0.0825), (46.95175879, 0.0744), (47.94794198, 0.7372),
+           (48.94786568, 0.0541), (49.94478689, 0.0518)),
+    'V': ((49.94715601, 0.00250), (50.94395704, 0.99750)),
+    'Cr': ((49.94604183, 0.04345), (51.94050623, 0.83789), (52.94064815, 0.09501),
+           (53.93887916, 0.02365)),
+    'Mn': ((54.93804391, 1.0),),
+    'Fe': ((53.93960899, 0.05845), (55.93493633, 0.91754), (56.93539284, 0.02119),
+           (57.93327443, 0.00282)),
+    'Co': ((58.93319429, 1.0),),
+    'Ni': ((57.93534241, 0.68077), (59.93078588, 0.26223), (60.93105557, 0.011399),
+           (61.92834537, 0.036346), (63.92796682, 0.009255)),
+    'Cu': ((62.92959772, 0.6915), (64.92778970, 0.3085)),
+    'Zn': ((63.92914201, 0.4917), (65.92603381, 0.2773), (66.92712775, 0.0404),
+           (67.92484455, 0.1845), (69.9253192, 0.0061)),
+    'Ga': ((68.9255735, 0.60108), (70.92470258, 0.39892)),
+    'Ge': ((69.92424875, 0.2057), (71.922075826, 0.2745), (72.923458956, 0.0775),
+           (73.921177761, 0.3650), (75.921402726, 0.0773)),
+    'As': ((74.92159457, 1.0),),
+    'Se': ((73.922475934, 0.0089), (75.919213704, 0.0937), (76.919914154, 0.0763),
+           (77.91730928, 0.2377), (79.9165218, 0.4961), (81.9166995, 0.0873)),
+    'Br': ((78.9183376, 0.5069), (80.9162897, 0.4931)),
+    'Kr': ((77.92036494, 0.00355), (79.91637808, 0.02286), (81.91348273, 0.11593),
+           (82.91412716, 0.11500), (83.9114977282, 0.56987), (85.9106106269, 0.17279)),
+    'Rb': ((84.9117897379, 0.7217), (86.9091805310, 0.2783)),
+    'Sr': ((83.9134191, 0.0056), (85.9092606, 0.0986), (86.9088775, 0.0700),
+           (87.9056125, 0.8258)),
+    'Y': ((88.9058403, 1.0),),
+    'Zr': ((89.9046977, 0.5145), (90.9056396, 0.1122), (91.9050347, 0.1715),
+           (93.9063108, 0.1738), (95.9082714, 0.0280)),
+    'Nb': ((92.9063730, 1.0),),
+    'Mo': ((91.90680796, 0.1453), (93.90508490, 0.0915), (94.90583877, 0.1584),
+           (95.90467612, 0.1667), (96.90601812, 0.0960), (97.90540482, 0.2439),
+           (99.9074718, 0.0982)),
+    'Ru': ((95.90759025, 0.0554), (97.9052868, 0.0187), (98.9059341, 0.1276),
+           (99.9042143, 0.1260), (100.9055769, 0.1706), (101.9043441, 0.3155),
+           (103.9054275, 0.1862)),
+    'Rh': ((102.9054980, 1.0),),
+    'Pd': ((101.9056022, 0.0102), (103.9040305, 0.1114), (104.9050796, 0.2233),
+           (105.9034804, 0.2733), (107.9038916, 0.2646), (109.9051722, 0.1172)),
+    'Ag': ((106.9050916, 0.51839), (108.9047553, 0.48161)),
+    'Cd': ((105.9064599, 0.0125), (107.9041834, 0.0089), (109.90300661, 0.1249),
+           (110.90418287, 0.1280), (111.90276287, 0.2413), (112.90440813, 0.1222),
+           (113.90336509, 0.2873), (115.90476315, 0.0749)),
+    'In': ((112.90406184, 0.0429), (114.903878776, 0.9571)),
+    'Sn': ((111.90482387, 0.0097), (113.9027827, 0.0066), (114.903344699, 0.0034),
+           (115.90174280, 0.1454), (116.90295398, 0.0768), (117.90160657, 0.2422),
+           (118.90331117, 0.0859), (119.90220163, 0.3258), (121.9034438, 0.0463),
+           (123.9052766, 0.0579)),
+    'Sb': ((120.9038120, 0.5721), (122.9042132, 0.4279)),
+    'Te': ((119.9040593, 0.0009), (121.9030435, 0.0255), (122.9042698, 0.0089),
+           (123.9028171, 0.0474), (124.9044299, 0.0707), (125.9033109, 0.1884),
+           (127.90446128, 0.3174), (129.906222748, 0.3408)),
+    'I': ((126.9044719, 1.0),),
+    'Xe': ((123.9058920, 0.000952), (125.9042983, 0.000890), (127.9035310, 0.019102),
+           (128.9047808611, 0.264006), (129.903509349, 0.040710), (130.90508406, 0.212324),
+           (131.9041550856, 0.269086), (133.90539466, 0.104357), (135.907214484, 0.088573)),
+    'Cs': ((132.9054519610, 1.0),),
+    'Ba': ((129.9063207, 0.00106), (131.9050611, 0.00101), (133.90450818, 0.02417),
+           (134.90568838, 0.06592), (135.90457573, 0.07854), (136.90582714, 0.11232),
+           (137.90524700, 0.71698)),
+    'La': ((137.9071149, 0.0008881), (138.9063563, 0.9991119)),
+    'Ce': ((135.90712921, 0.00185), (137.905991, 0.00251), (139.9054431, 0.88450),
+           (141.9092504, 0.11114)),
+    'Pr': ((140.9076576, 1.0),),
+    'Nd': ((141.9077290, 0.27152), (142.9098200, 0.12174), (143.9100930, 0.23798),
+           (144.9125793, 0.08293), (145.9131226, 0.17189), (147.9168993, 0.05756),
+           (149.9209022, 0.05638)),
+    'Sm': ((143.9120065, 0.0307), (146.9149044, 0.1499), (147.9148292, 0.1124),
+           (148.9171921, 0.1382), (149.9172829, 0.0738), (151.9197397, 0.2675),
+           (153.9222169, 0.2275)),
+    'Eu': ((150.9198578, 0.4781), (152.9212380, 0.5219)),
+    'Gd': ((151.9197995, 0.0020), (153.9208741, 0.0218), (154.9226305, 0.1480),
+           (155.9221312, 0.2047), (156.9239686, 0.1565), (157.9241123, 0.2484),
+           (159.9270624, 0.2186)),
+    'Tb': ((158.9253547, 1.0),),
+    'Dy': ((155.9242847, 0.00056), (157.9244159, 0.00095), (159.9252046, 0.02329),
+           (160.9269405, 0.18889), (161.9268056, 0.25475), (162.9287383, 0.24896),
+           (163.9291819, 0.28260)),
+    'Ho': ((164.9303288, 1.0),),
+    'Er': ((161.9287884, 0.00139), (163.9292088, 0.01601), (165.9302995, 0.33503),
+           (166.9320546, 0.22869), (167.9323767, 0.26978), (169.9354702, 0.14910)),
+    'Tm': ((168.9342179, 1.0),),
+    'Yb': ((167.9338896, 0.00123), (169.9347664, 0.02982), (170.9363302, 0.1409),
+           (171.9363859, 0.2168), (172.9382151, 0.16103), (173.9388664, 0.32026),
+           (175.9425764, 0.12996)),
+    'Lu': ((174.9407752, 0.97401), (175.9426897, 0.02599)),
+    'Hf': ((173.9400461, 0.0016), (175.9414076, 0.0526), (176.9432277, 0.1860),
+           (177.9437058, 0.2728), (178.9458232, 0.1362), (179.9465570, 0.3508)),
+    'Ta': ((179.9474648, 0.0001201), (180.9479958, 0.9998799)),
+    'W': ((179.9467108, 0.0012), (181.94820394, 0.2650), (182.95022275, 0.1431),
+          (183.95093092, 0.3064), (185.9543628, 0.2843)),
+    'Re': ((184.9529545, 0.3740), (186.9557501, 0.6260)),
+    'Os': ((183.9524885, 0.0002), (185.9538350, 0.0159), (186.9557474, 0.0196),
+           (187.9558352, 0.1324), (188.9581442, 0.1615), (189.9584437, 0.2626),
+           (191.9614770, 0.4078)),
+    'Ir': ((190.9605893, 0.373), (192.9629216, 0.627)),
+    'Pt': ((189.9599297, 0.00012), (191.9610387, 0.00782), (193.9626809, 0.3286),
+           (194.9647917, 0.3378), (195.96495209, 0.2521), (197.9678949, 0.07356)),
+    'Au': ((196.96656879, 1.0),),
+    'Hg': ((195.9658326, 0.0015), (197.96676860, 0.0997), (198.96828064, 0.1687),
+           (199.96832659, 0.2310), (200.97030284, 0.1318), (201.97064340, 0.2986),
+           (203.97349398, 0.0687)),
+    'Tl': ((202.9723446, 0.2952), (204.9744278, 0.7048)),
+    'Pb': ((203.9730440, 0.014), (205.9744657, 0.241), (206.9758973, 0.221),
+           (207.9766525, 0.524)),
+    'Bi': ((208.9803991, 1.0),),
+    'Th': ((232.0380558, 1.0),),
+    'Pa': ((231.0358842, 1.0),),
+    'U': ((234.0409523, 0.000054), (235.0439301, 0.007204), (238.0507884, 0.992742)),
+}
+
+
+def element_isotopes(element: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Massas e abundâncias (normalizadas) dos isótopos de um elemento.
+    Elementos sem isótopos estáveis usam a massa de PERIODIC_TABLE como
+    um único pico.
+    """
+    if element not in PERIODIC_TABLE:
+        raise ValueError(f"Elemento desconhecido: {element}")
+    isotopes = ISOTOPE_TABLE.get(element, ((PERIODIC_TABLE[element], 1.0),))
+    masses = np.array([m for m, _ in isotopes], dtype=float)
+    abundances = np.array([a for _, a in isotopes], dtype=float)
+    return masses, abundances / abundances.sum()
+
+
+# Massa do isótopo mais abundante de cada elemento
+MONOISOTOPIC_MASSES: Dict[str, float] = {
+    el: max(isotopes, key=lambda iso: iso[1])[0] for el, isotopes in ISOTOPE_TABLE.items()
+}
+
+
+def monoisotopic_mass(formula: str) -> float:
+    """
+    Massa monoisotópica (isótopo mais abundante de cada elemento), em u.
+    Para íons ('NH4+', 'SO4^2-') a massa dos elétrons é descontada/somada.
+    """
+    elements = parse_chemical_formula(formula)
+    mass = sum(MONOISOTOPIC_MASSES.get(el, PERIODIC_TABLE[el]) * n for el, n in elements.items())
+    return mass - parse_formula_charge(formula) * ELECTRON_MASS
+
+
+def average_mass(formula: str) -> float:
+    """Massa média ponderada pelas abundâncias naturais de ISOTOPE_TABLE, em u."""
+    elements = parse_chemical_formula(formula)
+    mass = 0.0
+    for el, n in elements.items():
+        masses, abundances = element_isotopes(el)
+        mass += float(masses @ abundances) * n
+    return mass - parse_formula_charge(formula) * ELECTRON_MASS
+
+
+def isotopic_distribution(formula: str, resolution: Optional[float] = None,
+                          min_abundance: float = 1e-6) -> dict:
+    """
+    Padrão isotópico completo de uma fórmula via convolução por FFT.
+
+    Cada elemento vira um vetor de abundâncias sobre uma grade de massa;
+    o padrão da molécula é o produto dos espectros de Fourier elevados ao
+    número de átomos. As massas de cada pico são centróides exatos, obtidos
+    com um segundo produto ponderado pela massa.
+
+    resolution: poder de resolução m/Δm do instrumento. Se None, os picos
+        são agrupados por massa nominal (grade de 1 u).
+    min_abundance: picos abaixo desta fração do pico base são descartados.
+
+    Retorna massas, abundâncias (soma 1), intensidades relativas (%),
+    m/z para íons, massa monoisotópica e massa média.
+    """
+    elements = parse_chemical_formula(formula)
+    if not elements:
+        raise ValueError("Fórmula vazia")
+    if resolution is not None and resolution <= 0:
+        raise ValueError("Resolução deve ser positiva")
+    charge = parse_formula_charge(formula)
+
+    spectra = []
+    for el, n in elements.items():
+        masses, abundances = element_isotopes(el)
+        spectra.append((n, masses - masses[0], masses, abundances))
+
+    mono = monoisotopic_mass(formula)
+    avg = average_mass(formula)
+
+    # Largura da grade: 1 u (massa nominal) ou Δm = M/R na massa monoisotópica
+    if resolution is None:
+        bin_width = 1.0
+        to_bin = np.rint
+    else:
+        bin_width = mono / resolution
+        to_bin = lambda offsets: np.rint(offsets / bin_width)
+
+    # Janela útil: média + 12σ cobre toda a massa de probabilidade relevante;
+    # o excedente é aliasado de forma circular em valores desprezíveis.
+    mean_offset = 0.0
+    variance = 0.0
+    max_offset = 0
+    full_span = 0
+    for n, offsets, _, abundances in spectra:
+        bins = to_bin(offsets)
+        mu = float(bins @ abundances)
+        mean_offset += n * mu
+        variance += n * float(((bins - mu) ** 2) @ abundances)
+        max_offset = max(max_offset, int(bins[-1]))
+        full_span += n * int(bins[-1])
+    window = int(math.ceil(mean_offset + 12.0 * math.sqrt(variance) + 2))
+    length = sp_fft.next_fast_len(max(min(full_span + 1, window), max_offset + 1))
+
+    total = np.ones(length, dtype=complex)
+    element_ffts = []
+    for n, offsets, masses, abundances in spectra:
+        bins = to_bin(offsets).astype(int)
+        p = np.zeros(length)
+        q = np.zeros(length)
+        np.add.at(p, bins, abundances)
+        np.add.at(q, bins, abundances * masses)
+        fp = sp_fft.fft(p)
+        element_ffts.append((n, fp, sp_fft.fft(q)))
+        total *= fp ** n
+
+    # Espectro ponderado pela massa: Σ n_e · Q_e · P_e^(n_e-1) · Π P_outros^n
+    weighted = np.zeros(length, dtype=complex)
+    for i, (n, fp, fq) in enumerate(element_ffts):
+        term = n * fq * fp ** (n - 1)
+        for j, (m, fp_other, _) in enumerate(element_ffts):
+            if j != i:
+                term = term * fp_other ** m
+        weighted += term
+
+    abundance = sp_fft.ifft(total).real
+    mass_sum = sp_fft.ifft(weighted).real
+
+    keep = abundance > max(min_abundance, 1e-12) * abundance.max()
+    abundance = abundance[keep]
+    masses = mass_sum[keep] / abundance
+    masses = masses - charge * ELECTRON_MASS
+
+    order = np.argsort(masses)
+    masses = masses[order]
+    abundance = abundance[order]
+    abundance = abundance / abundance.sum()
+
+    return {
+        "formula": formula,
+        "charge": charge,
+        "monoisotopic_mass": mono,
+        "average_mass": avg,
+        "masses": masses,
+        "mz": masses / abs(charge) if charge else masses,
+        "abundances": abundance,
+        "relative_intensity": 100.0 * abundance / abundance.max(),
+        "bin_width": bin_width,
+    }
+
+
+# --- Busca de fórmulas a partir da massa exata ---
+
+# Valência usada no cálculo de RDBE (anéis + duplas ligações)
+VALENCES: Dict[str, int] = {
+    'H': 1, 'F': 1, 'Cl': 1, 'Br': 1, 'I': 1, 'Li': 1, 'Na': 1, 'K': 1,
+    'B': 3, 'N': 3, 'P': 3, 'As': 3,
+    'O': 2, 'S': 2, 'Se': 2, 'Mg': 2, 'Ca': 2,
+    'C': 4, 'Si': 4, 'Ge': 4, 'Sn': 4,
+}
+
+_BOUND_TOKEN = re.compile(r'([A-Z][a-z]?)(\d+)(?:-(\d+))?')
+
+
+def parse_element_bounds(bounds: Union[str, Dict[str, Tuple[int, int]]]) -> Dict[str, Tuple[int, int]]:
+    """
+    Converte limites de elementos para {elemento: (mín, máx)}.
+    Aceita texto como "C0-50 H0-100 N0-10 O0-20" ou um dicionário.
+    """
+    if isinstance(bounds, str):
+        parsed = {}
+        for token in bounds.replace(',', ' ').split():
+            match = _BOUND_TOKEN.fullmatch(token)
+            if not match:
+                raise ValueError(f"Limite inválido: {token}")
+            el, lo, hi = match.groups()
+            parsed[el] = (int(lo), int(hi) if hi is not None else int(lo))
+        bounds = parsed
+    result = {}
+    for el, (lo, hi) in bounds.items():
+        if el not in PERIODIC_TABLE:
+            raise ValueError(f"Elemento desconhecido: {el}")
+        if lo < 0 or hi < lo:
+            raise ValueError(f"Limites inválidos para {el}: {lo}-{hi}")
+        result[el] = (int(lo), int(hi))
+    if not result:
+        raise ValueError("Informe pelo menos um elemento")
+    return result
+
+
+def formulas_from_mass(mass: float, bounds: Union[str, Dict[str, Tuple[int, int]]],
+                       ppm: float = 5.0, charge: int = 0, mass_type: str = "monoisotopic",
+                       rdbe_min: Optional[float] = 0.0, rdbe_max: Optional[float] = None,
+                       nitrogen_rule: bool = True, max_results: Optional[int] = None) -> dict:
+    """
+    Enumera todas as fórmulas compatíveis com uma massa medida.
+
+    A enumeração é feita elemento a elemento (do mais pesado ao mais leve)
+    sobre arrays de fórmulas parciais: para cada parcial, a faixa de contagens
+    do próximo elemento é limitada pela massa que os elementos restantes
+    ainda conseguem somar, de forma que ramos impossíveis nunca são gerados.
+
+    mass: massa neutra, ou m/z medido quando charge != 0 (fórmula do íon).
+    mass_type: "monoisotopic" (massas exatas) ou "average" (PERIODIC_TABLE).
+    rdbe_min / rdbe_max: limites de anéis + duplas ligações.
+    nitrogen_rule: exige espécies de camada fechada (RDBE inteiro para
+        moléculas neutras, semi-inteiro para íons de carga ímpar).
+
+    Retorna fórmulas, matriz de contagens, massas teóricas, erros (ppm) e
+    RDBE, ordenados pelo erro absoluto.
+    """
+    if mass <= 0:
+        raise ValueError("Massa deve ser positiva")
+    if ppm <= 0:
+        raise ValueError("Tolerância (ppm) deve ser positiva")
+    if mass_type not in ("monoisotopic", "average"):
+        raise ValueError("mass_type deve ser 'monoisotopic' ou 'average'")
+    bounds = parse_element_bounds(bounds)
+
+    target = mass * abs(charge) + charge * ELECTRON_MASS if charge else mass
+    tolerance = target * ppm * 1e-6
+    target_lo, target_hi = target - tolerance, target + tolerance
+
+    table = MONOISOTOPIC_MASSES if mass_type == "monoisotopic" else PERIODIC_TABLE
+    elements = tuple(sorted(bounds, key=lambda el: table.get(el, PERIODIC_TABLE[el]), reverse=True))
+    el_masses = np.array([table.get(el, PERIODIC_TABLE[el]) for el in elements])
+    lows = np.array([bounds[el][0] for el in elements])
+    highs = np.array([bounds[el][1] for el in elements])
+
+    # Massa mínima/máxima que os elementos seguintes ainda podem contribuir
+    rest_min = np.append(np.cumsum((lows * el_masses)[::-1])[::-1][1:], 0.0)
+    rest_max = np.append(np.cumsum((highs * el_masses)[::-1])[::-1][1:], 0.0)
+
+    partial_mass = np.zeros(1)
+    counts = np.zeros((1, 0), dtype=np.int64)
+    for k, m in enumerate(el_masses):
+        n_lo = np.maximum(lows[k], np.ceil((target_lo - partial_mass - rest_max[k]) / m - 1e-9))
+        n_hi = np.minimum(highs[k], np.floor((target_hi - partial_mass - rest_min[k]) / m + 1e-9))
+        sizes = np.maximum(n_hi - n_lo + 1, 0).astype(np.int64)
+        if sizes.sum() == 0:
+            counts = np.zeros((0, len(elements)), dtype=np.int64)
+            partial_mass = np.zeros(0)
+            break
+        parent = np.repeat(np.arange(len(partial_mass)), sizes)
+        # Posição de cada filho dentro da faixa do seu pai
+        starts = np.cumsum(sizes) - sizes
+        step = np.arange(sizes.sum()) - np.repeat(starts, sizes)
+        n_k = n_lo[parent].astype(np.int64) + step
+        counts = np.column_stack([counts[parent], n_k])
+        partial_mass = partial_mass[parent] + n_k * m
+
+    theoretical = partial_mass
+    keep = (theoretical >= target_lo) & (theoretical <= target_hi)
+
+    valence = np.array([VALENCES.get(el, 2) for el in elements])
+    rdbe = 1.0 + counts @ (valence - 2) / 2.0
+    # RDBE equivalente da molécula neutra de origem
+    parent_rdbe = rdbe + charge / 2.0
+    if rdbe_min is not None:
+        keep &= parent_rdbe >= rdbe_min
+    if rdbe_max is not None:
+        keep &= parent_rdbe <= rdbe_max
+    if nitrogen_rule:
+        keep &= np.isclose(parent_rdbe, np.round(parent_rdbe))
+
+    counts = counts[keep]
+    theoretical = theoretical[keep]
+    rdbe = rdbe[keep]
+    error_ppm = (theoretical - target) / target * 1e6
+
+    order = np.argsort(np.abs(error_ppm), kind="stable")
+    if max_results is not None:
+        order = order[:max_results]
+    counts = counts[order]
+
+    return {
+        "elements": elements,
+        "formulas": [hill_formula(dict(zip(elements, row))) for row in counts],
+        "counts": counts,
+        "masses": theoretical[order],
+        "error_ppm": error_ppm[order],
+        "rdbe": rdbe[order],
+        "target_mass": target,
+    }
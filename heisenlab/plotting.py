@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Iterable, Tuple
 
+import numpy as np
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel
@@ -146,3 +147,197 @@ class FullScreenPlotDialog(QDialog):
             else:
                 self.showFullScreen()
         super().keyPressEvent(event)
+
+
+def plot_titration_curve(canvas: MplCanvas, result: dict, show_derivative: bool = True) -> None:
+    """Desenha a curva de simulate_titration no canvas (pH, dpH/dV, equivalências e tampões)."""
+    # Remover eixos gêmeos de plotagens anteriores
+    for extra_ax in canvas.figure.axes[1:]:
+        extra_ax.remove()
+    ax = canvas.ax
+    ax.clear()
+
+    volume = result["volume"]
+    ax.plot(volume, result["ph"], color='tab:blue', linewidth=2, label='pH')
+
+    for region in result["buffer_regions"]:
+        ax.axvspan(region["start_volume"], region["end_volume"], color='tab:green', alpha=0.12)
+        ax.plot(region["half_equivalence_volume"], region["ph_at_half_equivalence"], 'o',
+                color='tab:green', markersize=6,
+                label=f'pH = pKa ({region["pka"]:.2f})')
+
+    for i, point in enumerate(result["equivalence_points"], start=1):
+        if point["volume"] > volume[-1]:
+            continue
+        ax.axvline(point["volume"], color='tab:red', linestyle='--', linewidth=1, alpha=0.6)
+        ax.plot(point["volume"], point["ph"], 's', color='tab:red', markersize=6,
+                label=f'PE{i}: {point["volume"]:.3g} (pH {point["ph"]:.2f})')
+
+    if show_derivative:
+        d_ax = ax.twinx()
+        d_ax.plot(volume, result["dph_dv"], color='tab:orange', linewidth=1, alpha=0.7, label='dpH/dV')
+        d_ax.set_ylabel('dpH/dV')
+
+    ax.set_xlabel('Volume de titulante')
+    ax.set_ylabel('pH')
+    ax.set_title('Curva de titulação')
+    ax.set_xlim(volume[0], volume[-1])
+    ax.grid(True, alpha=0.3)
+    ax.legend(loc='best', fontsize=9)
+    canvas.figure.tight_layout(pad=1.5)
+    canvas.draw()
+
+
+def plot_distribution_diagram(canvas: MplCanvas, result: dict, log_scale: bool = False) -> None:
+    """Desenha as frações α de distribution_diagram no canvas (uma curva por espécie)."""
+    for extra_ax in canvas.figure.axes[1:]:
+        extra_ax.remove()
+    ax = canvas.ax
+    ax.clear()
+
+    ph = result["ph"]
+    values = result["log_alpha"] if log_scale else result["alpha"]
+    for j, label in enumerate(result["labels"]):
+        ax.plot(ph, values[:, j], linewidth=2, label=label)
+    for pka in result["pkas"]:
+        ax.axvline(pka, color='gray', linestyle=':', linewidth=1)
+
+    ax.set_xlabel('pH')
+    ax.set_ylabel('log₁₀ α' if log_scale else 'Fração α')
+    ax.set_title('Diagrama de distribuição')
+    ax.set_xlim(ph[0], ph[-1])
+    if log_scale:
+        ax.set_ylim(max(float(np.min(values)), -12.0), 0.5)
+    else:
+        ax.set_ylim(-0.02, 1.02)
+    ax.grid(True, alpha=0.3)
+    ax.legend(loc='best', fontsize=10)
+    canvas.figure.tight_layout(pad=1.5)
+    canvas.draw()
+
+
+def plot_pourbaix_diagram(canvas: MplCanvas, result: dict, show_water: bool = True) -> None:
+    """Desenha o diagrama de pourbaix_diagram no canvas (domínios, fronteiras e linhas da água)."""
+    from matplotlib.colors import ListedColormap
+
+    for extra_ax in canvas.figure.axes[1:]:
+        extra_ax.remove()
+    ax = canvas.ax
+    ax.clear()
+
+    ph = result["ph"]
+    potential = result["potential"]
+    extent = (ph[0], ph[-1], potential[0], potential[-1])
+    # Rótulos inteiros como imagem: uma única textura, independente da resolução
+    colors = [f"C{i % 10}" for i in range(len(result["species"]))]
+    ax.imshow(result["labels"], origin='lower', extent=extent, aspect='auto',
+              cmap=ListedColormap(colors), vmin=-0.5, vmax=len(colors) - 0.5,
+              interpolation='nearest', alpha=0.35)
+
+    for domain in result["domains"]:
+        for line in domain["boundaries"]:
+            ax.plot(line[:, 0], line[:, 1], color='black', linewidth=1)
+        x, y = domain["label_position"]
+        ax.text(x, y, domain["species"], ha='center', va='center', fontsize=9,
+                fontweight='bold' if domain["phase"] == "s" else 'normal')
+
+    if show_water:
+        for name, line in result["water"].items():
+            ax.plot(ph, line, color='tab:blue', linestyle='--', linewidth=1.2)
+            ax.annotate(name, (ph[-1], line[-1]), textcoords='offset points', xytext=(-4, 4),
+                        ha='right', fontsize=8, color='tab:blue')
+
+    ax.set_xlabel('pH')
+    ax.set_ylabel('E (V vs. EPH)')
+    ax.set_title(f'Diagrama de Pourbaix – {result["element"]} '
+                 f'({result["concentration"]:.0e} mol/L, {result["temperature"]:g} °C)')
+    ax.set_xlim(extent[0], extent[1])
+    ax.set_ylim(extent[2], extent[3])
+    canvas.figure.tight_layout(pad=1.5)
+    canvas.draw()
+
+
+def plot_precipitation_titration(canvas: MplCanvas, result: dict) -> None:
+    """Desenha a curva de simulate_precipitation_titration (pM e pX, equivalência e ponto final)."""
+    for extra_ax in canvas.figure.axes[1:]:
+        extra_ax.remove()
+    ax = canvas.ax
+    ax.clear()
+
+    volume = result["volume"]
+    ax.plot(volume, result["p_cation"], color='tab:blue', linewidth=2, label=result["cation_label"])
+    ax.plot(volume, result["p_anion"], color='tab:green', linewidth=2, label=result["anion_label"])
+
+    eq = result["equivalence_point"]
+    ax.axvline(eq["volume"], color='tab:red', linestyle='--', linewidth=1, alpha=0.6)
+    ax.plot(eq["volume"], eq["p"], 's', color='tab:red', markersize=6,
+            label=f'PE: {eq["volume"]:.4g}')
+    end = result["end_point"]
+    if end is not None:
+        ax.axvline(end["volume"], color='tab:orange', linestyle=':', linewidth=1.5,
+                   label=f'Ponto final ({result["method"].capitalize()}): {end["volume"]:.4g} '
+                         f'({end["error_percent"]:+.3f}%)')
+
+    ax.set_xlabel('Volume de titulante')
+    ax.set_ylabel('p(íon) = −log[íon]')
+    ax.set_title(f'Titulação de precipitação ({result["salt"]})')
+    ax.set_xlim(volume[0], volume[-1])
+    ax.grid(True, alpha=0.3)
+    ax.legend(loc='best', fontsize=9)
+    canvas.figure.tight_layout(pad=1.5)
+    canvas.draw()
+
+
+def plot_calibration_curve(canvas: MplCanvas, fit, x, y, included=None, unknowns: dict | None = None,
+                           confidence_level: float = 0.95, flagged=None) -> None:
+    """
+    Desenha padrões, reta ajustada (LinearFit), bandas de confiança/predição,
+    LOD e, se informadas, as amostras de inverse_predict com seus intervalos.
+    flagged: máscara de pontos destacados (ex.: regression_diagnostics).
+    """
+    for extra_ax in canvas.figure.axes[1:]:
+        extra_ax.remove()
+    ax = canvas.ax
+    ax.clear()
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    included = np.ones(x.size, dtype=bool) if included is None else np.asarray(included, dtype=bool)
+    ax.plot(x[included], y[included], 'o', color='tab:blue', markersize=7, label='Padrões')
+    if (~included).any():
+        ax.plot(x[~included], y[~included], 'x', color='gray', markersize=8, label='Excluídos')
+    if flagged is not None and np.any(flagged):
+        flagged = np.asarray(flagged, dtype=bool)
+        ax.plot(x[flagged], y[flagged], 'o', markerfacecolor='none', markeredgecolor='tab:orange',
+                markeredgewidth=2, markersize=13, label='Sinalizados')
+
+    x_max = x.max()
+    if unknowns is not None:
+        x_max = max(x_max, float(np.nanmax(np.atleast_1d(unknowns["upper"]))))
+    grid = np.linspace(min(0.0, x.min()), x_max * 1.05, 200)
+    ax.plot(grid, fit.slope * grid + fit.intercept, color='tab:red', linewidth=2,
+            label=f'y = {fit.slope:.5g}x {fit.intercept:+.5g} (R² = {fit.r_squared:.5f})')
+    if fit.n > 2:
+        conf = fit.confidence_band(grid, confidence_level)
+        pred = fit.prediction_band(grid, confidence_level)
+        ax.fill_between(grid, conf["lower"], conf["upper"], color='tab:red', alpha=0.15,
+                        label=f'Confiança {confidence_level:.0%}')
+        ax.plot(grid, pred["lower"], '--', color='tab:red', linewidth=1, alpha=0.7,
+                label=f'Predição {confidence_level:.0%}')
+        ax.plot(grid, pred["upper"], '--', color='tab:red', linewidth=1, alpha=0.7)
+        ax.axvline(fit.lod, color='tab:purple', linestyle=':', linewidth=1.2, label=f'LOD = {fit.lod:.3g}')
+
+    if unknowns is not None:
+        conc = np.atleast_1d(unknowns["concentration"])
+        err = np.atleast_1d(unknowns["upper"]) - conc
+        signal = fit.slope * conc + fit.intercept
+        ax.errorbar(conc, signal, xerr=err, fmt='s', color='tab:green', markersize=5,
+                    capsize=3, label='Amostras')
+
+    ax.set_xlabel('Concentração')
+    ax.set_ylabel('Sinal')
+    ax.set_title('Curva de calibração')
+    ax.grid(True, alpha=0.3)
+    ax.legend(loc='best', fontsize=9)
+    canvas.figure.tight_layout(pad=1.5)
+    canvas.draw()
@@ -0,0 +1,935 @@
+"""
+Regressão para curvas de calibração além de linear_fit.
+
+Modelos não lineares (quadrático, potência, logísticos 4PL/5PL) com
+jacobianos analíticos e chutes iniciais automáticos. O ajuste é um
+Levenberg-Marquardt em lote: todas as curvas de um bloco avançam juntas
+(uma solução linear k × k por curva em cada iteração), e blocos diferentes
+são distribuídos por um pool de processos.
+
+Estimadores robustos da reta (Theil-Sen, mediana repetida, RANSAC) que
+devolvem um LinearFit com a máscara de inliers, para curvas com padrões
+discrepantes.
+"""
+from __future__ import annotations
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+from scipy import stats
+
+from .calculations import LinearFit, _scalar_or_array, linear_fit, linear_fit_batch
+
+
+# --- Nonlinear calibration models ---
+
+@dataclass(frozen=True)
+class CalibrationModel:
+    """
+    Modelo y = f(x; p) avaliado em lote: x e y com forma (n_curvas, n_pontos),
+    p com forma (n_curvas, k). jacobian retorna (n_curvas, n_pontos, k);
+    initial_guess recebe x, y e a máscara de pontos válidos; inverse dá x(y).
+    """
+    name: str
+    parameters: Tuple[str, ...]
+    function: Callable
+    jacobian: Callable
+    initial_guess: Callable
+    inverse: Callable
+    equation: str = ""
+
+
+CALIBRATION_MODELS: Dict[str, CalibrationModel] = {}
+
+
+def register_calibration_model(model: CalibrationModel) -> CalibrationModel:
+    """Adiciona um modelo ao catálogo (funções de módulo, para uso no pool de processos)."""
+    CALIBRATION_MODELS[model.name] = model
+    return model
+
+
+def _column(p: np.ndarray, i: int) -> np.ndarray:
+    return p[:, i, None]
+
+
+def _quadratic(x, p):
+    return _column(p, 0) + _column(p, 1) * x + _column(p, 2) * x ** 2
+
+
+def _quadratic_jacobian(x, p):
+    return np.stack([np.ones_like(x), x, x ** 2], axis=-1)
+
+
+def _quadratic_guess(x, y, valid):
+    # O modelo é linear nos parâmetros: a solução de mínimos quadrados já é exata
+    X = np.where(valid[..., None], _quadratic_jacobian(x, None), 0.0)
+    A = np.einsum("npk,npl->nkl", X, X)
+    b = np.einsum("npk,np->nk", X, np.where(valid, y, 0.0))
+    return np.einsum("nkl,nl->nk", np.linalg.pinv(A), b)
+
+
+def _quadratic_inverse(y, p):
+    a, b, c = (p[..., i] for i in range(3))
+    disc = np.sqrt(b * b - 4 * c * (a - y))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        # Raiz do ramo crescente a partir de x = 0; c ≈ 0 cai no caso linear
+        root = np.where(np.abs(c) > 1e-12 * np.abs(b), (-b + np.sign(b) * disc) / (2 * c), (y - a) / b)
+    return root
+
+
+def _power(x, p):
+    return _column(p, 0) * np.abs(x) ** _column(p, 1)
+
+
+def _power_jacobian(x, p):
+    xb = np.abs(x) ** _column(p, 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_x = np.where(x > 0, np.log(np.where(x > 0, x, 1.0)), 0.0)
+    return np.stack([xb, _column(p, 0) * xb * log_x], axis=-1)
+
+
+def _power_guess(x, y, valid):
+    ok = valid & (x > 0) & (y > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        fit = linear_fit_batch(np.where(ok, np.log(x), np.nan), np.where(ok, np.log(y), np.nan))
+    slope = np.where(np.isfinite(fit["slope"]), fit["slope"], 1.0)
+    intercept = np.where(np.isfinite(fit["intercept"]), fit["intercept"], 0.0)
+    return np.column_stack([np.exp(intercept), slope])
+
+
+def _power_inverse(y, p):
+    return (y / p[..., 0]) ** (1.0 / p[..., 1])
+
+
+def _logistic_guess(x, y, valid):
+    """Chute 4PL: assíntotas nas extremidades em x, b e c pela reta logit × ln x."""
+    x_low = np.where(valid, x, np.inf).argmin(axis=1)
+    x_high = np.where(valid, x, -np.inf).argmax(axis=1)
+    rows = np.arange(x.shape[0])
+    y_first, y_last = y[rows, x_low], y[rows, x_high]
+    span = y_last - y_first
+    a = y_first - 0.05 * span
+    d = y_last + 0.05 * span
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = (a[:, None] - y) / (y - d[:, None])
+        ok = valid & (x > 0) & (ratio > 0)
+        fit = linear_fit_batch(np.where(ok, np.log(x), np.nan), np.where(ok, np.log(ratio), np.nan))
+        b = fit["slope"]
+        c = np.exp(-fit["intercept"] / b)
+    # c de reserva: média geométrica dos x positivos (somas mascaradas; NaN em linha vazia)
+    positive = valid & (x > 0)
+    log_x = np.where(positive, np.log(np.where(positive, x, 1.0)), 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fallback_c = np.exp(log_x.sum(axis=1) / positive.sum(axis=1))
+    bad = ~(np.isfinite(b) & np.isfinite(c) & (b != 0))
+    b = np.where(bad, 1.0, b)
+    c = np.where(bad, fallback_c, c)
+    return np.column_stack([a, b, c, d])
+
+
+def _four_pl(x, p):
+    a, b, c, d = (_column(p, i) for i in range(4))
+    return d + (a - d) / (1 + (x / c) ** b)
+
+
+def _four_pl_jacobian(x, p):
+    a, b, c, d = (_column(p, i) for i in range(4))
+    u = (x / c) ** b
+    den = 1 + u
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_ratio = np.where(x > 0, np.log(np.where(x > 0, x, 1.0) / c), 0.0)
+    common = (a - d) * u / den ** 2
+    return np.stack([
+        np.broadcast_to(1 / den, x.shape),
+        -common * log_ratio,
+        common * b / c,
+        np.broadcast_to(u / den, x.shape),
+    ], axis=-1)
+
+
+def _four_pl_inverse(y, p):
+    a, b, c, d = (p[..., i] for i in range(4))
+    return c * ((a - d) / (y - d) - 1) ** (1.0 / b)
+
+
+def _five_pl(x, p):
+    a, b, c, d, g = (_column(p, i) for i in range(5))
+    return d + (a - d) / (1 + (x / c) ** b) ** g
+
+
+def _five_pl_jacobian(x, p):
+    a, b, c, d, g = (_column(p, i) for i in range(5))
+    u = (x / c) ** b
+    den = 1 + u
+    power = den ** -g
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_ratio = np.where(x > 0, np.log(np.where(x > 0, x, 1.0) / c), 0.0)
+    common = (a - d) * g * power / den * u
+    return np.stack([
+        power,
+        -common * log_ratio,
+        common * b / c,
+        1 - power,
+        -(a - d) * power * np.log(den),
+    ], axis=-1)
+
+
+def _five_pl_guess(x, y, valid):
+    return np.column_stack([_logistic_guess(x, y, valid), np.ones(x.shape[0])])
+
+
+def _five_pl_inverse(y, p):
+    a, b, c, d, g = (p[..., i] for i in range(5))
+    return c * (((a - d) / (y - d)) ** (1.0 / g) - 1) ** (1.0 / b)
+
+
+register_calibration_model(CalibrationModel(
+    "quadratic", ("a", "b", "c"), _quadratic, _quadratic_jacobian, _quadratic_guess,
+    _quadratic_inverse, "y = a + b·x + c·x²"))
+register_calibration_model(CalibrationModel(
+    "power", ("a", "b"), _power, _power_jacobian, _power_guess, _power_inverse, "y = a·xᵇ"))
+register_calibration_model(CalibrationModel(
+    "4pl", ("a", "b", "c", "d"), _four_pl, _four_pl_jacobian, _logistic_guess, _four_pl_inverse,
+    "y = d + (a − d)/(1 + (x/c)ᵇ)"))
+register_calibration_model(CalibrationModel(
+    "5pl", ("a", "b", "c", "d", "g"), _five_pl, _five_pl_jacobian, _five_pl_guess, _five_pl_inverse,
+    "y = d + (a − d)/(1 + (x/c)ᵇ)ᵍ"))
+
+
+def _get_model(model) -> CalibrationModel:
+    if isinstance(model, CalibrationModel):
+        return model
+    if model not in CALIBRATION_MODELS:
+        raise ValueError(f"Modelo desconhecido: {model}. Use: {list(CALIBRATION_MODELS)}")
+    return CALIBRATION_MODELS[model]
+
+
+def _levenberg_marquardt(model: CalibrationModel, x, y, sqrt_w, valid, p, tolerance, max_iterations):
+    """LM em lote; cada curva tem seu próprio λ e critério de parada."""
+    n_curves, k = p.shape
+
+    def weighted_residual(params, rows=slice(None)):
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            return np.where(valid[rows], (model.function(x[rows], params) - y[rows]) * sqrt_w[rows], 0.0)
+
+    def weighted_jacobian(params, rows):
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            J = model.jacobian(x[rows], params) * sqrt_w[rows, :, None]
+        return np.where(valid[rows, :, None] & np.isfinite(J), J, 0.0)
+
+    def cost_of(residual):
+        cost = np.einsum("np,np->n", residual, residual)
+        return np.where(np.isfinite(cost), cost, np.inf)
+
+    residual = weighted_residual(p)
+    cost = cost_of(residual)
+    lam = np.full(n_curves, 1e-3)
+    converged = np.zeros(n_curves, dtype=bool)
+    iterations = np.zeros(n_curves, dtype=int)
+    for _ in range(max_iterations):
+        active = ~converged & (lam < 1e12)
+        if not active.any():
+            break
+        rows = np.flatnonzero(active)
+        J = weighted_jacobian(p[rows], rows)
+        A = np.einsum("npk,npl->nkl", J, J)
+        g = np.einsum("npk,np->nk", J, residual[rows])
+        diagonal = np.maximum(np.einsum("nkk->nk", A), 1e-12 * (1 + np.abs(A).max(axis=(1, 2)))[:, None])
+        damped = A + lam[rows, None, None] * diagonal[:, :, None] * np.eye(k)
+        try:
+            step = -np.linalg.solve(damped, g[..., None])[..., 0]
+        except np.linalg.LinAlgError:
+            step = -np.einsum("nkl,nl->nk", np.linalg.pinv(damped), g)
+        trial = p[rows] + step
+        trial_residual = weighted_residual(trial, rows)
+        trial_cost = cost_of(trial_residual)
+        accept = trial_cost < cost[rows]
+        improvement = cost[rows] - trial_cost
+        small = (np.abs(step) <= tolerance * (np.abs(p[rows]) + tolerance)).all(axis=1)
+        # passo pequeno só indica convergência se aceito (com λ alto ele encolhe sem progresso)
+        done = accept & ((improvement <= tolerance * (cost[rows] + 1e-300)) | small)
+
+        p[rows] = np.where(accept[:, None], trial, p[rows])
+        residual[rows] = np.where(accept[:, None], trial_residual, residual[rows])
+        cost[rows] = np.where(accept, trial_cost, cost[rows])
+        lam[rows] = np.clip(np.where(accept, lam[rows] / 3, lam[rows] * 2), 1e-15, 1e12)
+        converged[rows] = done
+        iterations[rows] += 1
+    # λ no teto: nenhum passo reduz o custo. Só é mínimo (local) se o gradiente
+    # for ortogonal aos resíduos: max|Jⱼ·r| / (‖Jⱼ‖·‖r‖) ≤ √tolerance; senão, estagnou.
+    stalled = np.flatnonzero(~converged & (lam >= 1e12) & np.isfinite(cost))
+    if stalled.size:
+        J = weighted_jacobian(p[stalled], stalled)
+        g = np.abs(np.einsum("npk,np->nk", J, residual[stalled]))
+        scale = np.sqrt(np.einsum("npk,npk->nk", J, J) * cost[stalled, None])
+        converged[stalled] = (cost[stalled] == 0) | (g <= math.sqrt(tolerance) * scale).all(axis=1)
+    return p, cost, converged & np.isfinite(cost), iterations
+
+
+def _fit_chunk(args) -> dict:
+    name, x, y, weights, tolerance, max_iterations = args
+    model = CALIBRATION_MODELS[name] if isinstance(name, str) else name
+    valid = np.isfinite(x) & np.isfinite(y) & np.isfinite(weights) & (weights > 0)
+    sqrt_w = np.sqrt(np.where(valid, weights, 0.0))
+    x = np.where(valid, x, 0.0)
+    y = np.where(valid, y, 0.0)
+    p0 = model.initial_guess(np.where(valid, x, np.nan), np.where(valid, y, np.nan), valid)
+    p0 = np.where(np.isfinite(p0), p0, 1.0)
+    p, cost, converged, iterations = _levenberg_marquardt(model, x, y, sqrt_w, valid, p0.astype(float),
+                                                          tolerance, max_iterations)
+
+    k = p.shape[1]
+    n = valid.sum(axis=1)
+    dof = n - k
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        J = model.jacobian(x, p) * sqrt_w[..., None]
+        J = np.where(valid[..., None] & np.isfinite(J), J, 0.0)
+        variance = np.where(dof > 0, cost / dof, np.nan)
+        covariance = variance[:, None, None] * np.linalg.pinv(np.einsum("npk,npl->nkl", J, J))
+        w = sqrt_w ** 2
+        y_mean = np.einsum("np,np->n", w, y) / w.sum(axis=1)
+        ss_total = np.einsum("np,np->n", w, (y - y_mean[:, None]) ** 2)
+        r_squared = 1 - cost / ss_total
+    return {
+        "parameters": p,
+        "std_errors": np.sqrt(np.abs(np.einsum("nkk->nk", covariance))),
+        "covariance": covariance,
+        "residual_std_error": np.sqrt(variance),
+        "r_squared": r_squared,
+        "n": n,
+        "converged": converged & (n >= k),
+        "iterations": iterations,
+    }
+
+
+def fit_calibration_curves(model, x: ArrayLike, y: ArrayLike, weights: ArrayLike | None = None,
+                           processes: int | None = None, chunk_size: int = 1024,
+                           tolerance: float = 1e-10, max_iterations: int = 200) -> dict:
+    """
+    Ajusta um modelo de CALIBRATION_MODELS ("quadratic", "power", "4pl",
+    "5pl") a muitas curvas: y (n_curvas, n_pontos), x com a mesma forma ou
+    (n_pontos,). NaN marca pontos ausentes; weights (ex.: 1/σ² ou 1/y²)
+    segue a forma de y.
+
+    As curvas são divididas em blocos de chunk_size, ajustados em lote; com
+    processes > 1 (padrão: todos os núcleos quando há mais de um bloco) os
+    blocos vão para um ProcessPoolExecutor.
+
+    Retorna parâmetros (n_curvas × k) e seus erros-padrão e covariâncias,
+    erro-padrão residual, R², n, convergência e iterações.
+    """
+    model = _get_model(model)
+    y = np.atleast_2d(np.asarray(y, dtype=float))
+    if y.shape[0] == 0:
+        raise ValueError("y deve conter ao menos uma curva")
+    try:
+        x = np.broadcast_to(np.asarray(x, dtype=float), y.shape)
+        weights = np.broadcast_to(np.asarray(1.0 if weights is None else weights, dtype=float), y.shape)
+    except ValueError:
+        raise ValueError("x e weights devem ter a forma de y ou (n_pontos,)") from None
+    if chunk_size < 1:
+        raise ValueError("chunk_size deve ser positivo")
+
+    # Modelos do catálogo vão por nome (picklável); os demais, pelo objeto
+    key = model.name if CALIBRATION_MODELS.get(model.name) is model else model
+    tasks = [(key, x[i:i + chunk_size], y[i:i + chunk_size], weights[i:i + chunk_size], tolerance, max_iterations)
+             for i in range(0, y.shape[0], chunk_size)]
+    if processes is None:
+        processes = min(os.cpu_count() or 1, len(tasks))
+    if processes > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            chunks = list(pool.map(_fit_chunk, tasks))
+    else:
+        chunks = [_fit_chunk(task) for task in tasks]
+
+    result = {key: np.concatenate([chunk[key] for chunk in chunks]) for key in chunks[0]}
+    result["model"] = model.name
+    result["parameter_names"] = model.parameters
+    return result
+
+
+@dataclass
+class CalibrationFit:
+    """Ajuste não linear de uma curva (ver fit_calibration_model)."""
+    model: str
+    parameters: Dict[str, float]
+    std_errors: Dict[str, float]
+    residual_std_error: float
+    r_squared: float
+    n: int
+    converged: bool
+    covariance: np.ndarray = field(repr=False, default=None)
+
+    def _vector(self) -> np.ndarray:
+        return np.array(list(self.parameters.values()))
+
+    def predict(self, x: ArrayLike) -> float | np.ndarray:
+        """Resposta do modelo em x."""
+        x = np.asarray(x, dtype=float)
+        y = CALIBRATION_MODELS[self.model].function(np.atleast_1d(x)[None, :], self._vector()[None, :])[0]
+        return _scalar_or_array(y.reshape(x.shape))
+
+    def inverse_predict(self, signal: ArrayLike) -> float | np.ndarray:
+        """Concentração a partir do sinal (inversa analítica do modelo; NaN fora da faixa)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            x = CALIBRATION_MODELS[self.model].inverse(np.asarray(signal, dtype=float), self._vector())
+        return _scalar_or_array(x)
+
+
+def fit_calibration_model(model, x: ArrayLike, y: ArrayLike, weights: ArrayLike | None = None,
+                          tolerance: float = 1e-10, max_iterations: int = 200) -> CalibrationFit:
+    """Ajusta um modelo não linear a uma única curva (mesmo motor de fit_calibration_curves)."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    model = _get_model(model)
+    if x.size != y.size or x.size < len(model.parameters):
+        raise ValueError(f"x e y devem ter mesmo tamanho e pelo menos {len(model.parameters)} pontos")
+    result = fit_calibration_curves(model, x.ravel(), y.ravel()[None, :],
+                                    None if weights is None else np.asarray(weights, dtype=float).ravel(),
+                                    processes=1, tolerance=tolerance, max_iterations=max_iterations)
+    names = model.parameters
+    return CalibrationFit(
+        model.name,
+        {name: float(v) for name, v in zip(names, result["parameters"][0])},
+        {name: float(v) for name, v in zip(names, result["std_errors"][0])},
+        float(result["residual_std_error"][0]),
+        float(result["r_squared"][0]),
+        int(result["n"][0]),
+        bool(result["converged"][0]),
+        result["covariance"][0],
+    )
+
+
+# --- Robust linear regression ---
+
+@dataclass
+class RobustLinearFit(LinearFit):
+    """
+    LinearFit de um estimador robusto. Inclinação e intercepto vêm do
+    estimador; n, somas e erros-padrão são calculados apenas sobre os
+    inliers (resíduos em torno da reta robusta), de modo que LOD, bandas e
+    inverse_predict funcionam como em linear_fit.
+    """
+    inliers: np.ndarray = field(default=None, repr=False)
+    method: str = ""
+
+
+def _finite_xy(x: ArrayLike, y: ArrayLike) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    x = np.asarray(x, dtype=float).ravel()
+    y = np.asarray(y, dtype=float).ravel()
+    if x.size != y.size:
+        raise ValueError("x e y devem ter mesmo tamanho")
+    finite = np.isfinite(x) & np.isfinite(y)
+    if np.unique(x[finite]).size < 2:
+        raise ValueError("Necessário pelo menos 2 valores distintos de x")
+    return x, y, finite
+
+
+def _inlier_mask(residuals: np.ndarray, finite: np.ndarray, threshold: float, y: np.ndarray) -> np.ndarray:
+    """|r| ≤ threshold·σ̂, com σ̂ = 1,4826·mediana|r| (MAD em torno da reta)."""
+    if threshold <= 0:
+        raise ValueError("Limite de resíduo deve ser positivo")
+    r = np.abs(residuals[finite])
+    scale = 1.4826 * np.median(r)
+    # reta exata para mais da metade dos pontos: tolerância de arredondamento
+    limit = max(threshold * scale, 64 * np.finfo(float).eps * max(np.max(np.abs(y[finite])), 1.0))
+    mask = np.zeros(residuals.shape, dtype=bool)
+    mask[finite] = r <= limit
+    return mask
+
+
+def _robust_result(x: np.ndarray, y: np.ndarray, slope: float, intercept: float,
+                   inliers: np.ndarray, method: str) -> RobustLinearFit:
+    xi, yi = x[inliers], y[inliers]
+    n = xi.size
+    x_mean, y_mean = xi.mean(), yi.mean()
+    dx, dy = xi - x_mean, yi - y_mean
+    ss_xx, ss_xy, ss_yy = float(dx @ dx), float(dx @ dy), float(dy @ dy)
+    r = ss_xy / math.sqrt(ss_xx * ss_yy) if ss_xx > 0 and ss_yy > 0 else 0.0
+    if n > 2 and ss_xx > 0:
+        residuals = yi - intercept - slope * xi
+        s = math.sqrt(float(residuals @ residuals) / (n - 2))
+        slope_se = s / math.sqrt(ss_xx)
+        intercept_se = s * math.sqrt(1.0 / n + x_mean * x_mean / ss_xx)
+    else:
+        s = slope_se = intercept_se = math.nan
+    return RobustLinearFit(float(slope), float(intercept), float(r), float(r * r), n=int(n),
+                           x_mean=float(x_mean), ss_xx=ss_xx, sum_weights=float(n), residual_std_error=s,
+                           slope_std_error=slope_se, intercept_std_error=intercept_se,
+                           inliers=inliers, method=method)
+
+
+def _count_inversions(ranks: np.ndarray) -> int:
+    """
+    Pares i < j com ranks[i] > ranks[j] (ranks inteiros em [0, n)), bit a
+    bit a partir do mais significativo: em cada nível, dentro de cada grupo
+    de mesmo prefixo, conta os 1 que precedem cada 0. O(n log n) por nível.
+    """
+    n = ranks.size
+    total = 0
+    order = np.arange(n)
+    for bit in range(max(int(n - 1).bit_length(), 1) - 1, -1, -1):
+        prefix = ranks >> (bit + 1)
+        # a ordem do nível anterior já agrupa os prefixos mais curtos
+        order = order[np.argsort(prefix[order], kind="stable")]
+        group_prefix = prefix[order]
+        ones = (ranks[order] >> bit) & 1
+        new_group = np.r_[True, group_prefix[1:] != group_prefix[:-1]]
+        before = np.cumsum(ones) - ones
+        before -= before[new_group][np.cumsum(new_group) - 1]
+        total += int(before[ones == 0].sum())
+    return total
+
+
+def _count_slopes_below(x: np.ndarray, y: np.ndarray, t: float, groups: np.ndarray | None) -> int:
+    """
+    Número de inclinações (y_j − y_i)/(x_j − x_i) < t, sem formá-las: com
+    x_i < x_j, inclinação < t ⇔ y_j − t·x_j < y_i − t·x_i, ou seja, é uma
+    inversão da sequência z = y − t·x ordenada por x. x já vem ordenado;
+    groups numera os empates em x (None se não há), que são ordenados por z
+    e assim nunca contam.
+    """
+    z = y - t * x
+    by_z = np.argsort(z)
+    dense = np.empty(z.size, dtype=np.intp)
+    dense[by_z] = np.cumsum(np.r_[False, np.diff(z[by_z]) != 0])
+    if groups is not None:
+        dense = dense[np.lexsort((dense, groups))]
+    return _count_inversions(dense)
+
+
+def _slopes_between(x: np.ndarray, y: np.ndarray, lo: float, hi: float, expected: int) -> np.ndarray:
+    """
+    Inclinações em [lo, hi): pares cuja ordem relativa em z = y − t·x troca
+    entre t = lo e t = hi. São as inversões da permutação entre as duas
+    ordenações; com k inversões, cada par está a no máximo k posições.
+    """
+    index = np.arange(x.size)
+    at_lo = np.lexsort((index, x, y - lo * x))
+    position_hi = np.empty(x.size, dtype=np.intp)
+    position_hi[np.lexsort((index, x, y - hi * x))] = index
+    p = position_hi[at_lo]
+    first, second = [], []
+    for d in range(1, expected + 1):
+        swapped = np.flatnonzero(p[:-d] > p[d:])
+        first.append(at_lo[swapped])
+        second.append(at_lo[swapped + d])
+    i, j = np.concatenate(first), np.concatenate(second)
+    return np.sort((y[j] - y[i]) / (x[j] - x[i]))
+
+
+def _select_slopes(x: np.ndarray, y: np.ndarray, groups: np.ndarray | None, first: int, last: int,
+                   lo: float, hi: float, below_lo: int, below_hi: int, sample: np.ndarray,
+                   pivots: list, resolution: float) -> np.ndarray:
+    """
+    Inclinações de ordem first..last (1-based) entre pares, sabendo que há
+    below_lo < first inclinações abaixo de lo e below_hi ≥ last abaixo de hi.
+    Busca em t com contagem exata: pivôs iniciais dados, depois o quantil
+    correspondente da amostra ordenada de inclinações que cai no intervalo
+    (ou interpolação linear; bisseção se um lado não avança); com poucas inclinações restantes no intervalo, elas são
+    enumeradas. resolution: largura absoluta mínima do intervalo.
+    """
+    target = 0.5 * (first + last) - 0.5
+    last_side = stalled = 0
+    while below_hi - below_lo > 64:
+        if hi - lo <= max(4 * np.finfo(float).eps * max(abs(lo), abs(hi)), resolution):
+            # bloco de inclinações empatadas: valor exato vindo da amostra, se houver
+            inside = sample[np.searchsorted(sample, lo):np.searchsorted(sample, hi)]
+            return np.full(last - first + 1, inside[0] if inside.size else 0.5 * (lo + hi))
+        if pivots:
+            t = pivots.pop(0)
+            if not lo < t < hi:
+                continue
+        else:
+            fraction = (target - below_lo) / (below_hi - below_lo)
+            inside = sample[np.searchsorted(sample, lo, "right"):np.searchsorted(sample, hi)]
+            if stalled >= 2:
+                t = 0.5 * (lo + hi)
+            elif inside.size >= 16:
+                t = np.quantile(inside, fraction)
+            else:
+                t = lo + (hi - lo) * fraction
+            if not lo < t < hi:
+                t = 0.5 * (lo + hi)
+        count = _count_slopes_below(x, y, t, groups)
+        if first <= count < last:
+            # o pivô separa as ordens pedidas: cada lado tem seu intervalo
+            return np.concatenate([
+                _select_slopes(x, y, groups, first, count, lo, t, below_lo, count, sample, [], resolution),
+                _select_slopes(x, y, groups, count + 1, last, t, hi, count, below_hi, sample, [], resolution),
+            ])
+        side = -1 if count < first else 1
+        if side < 0:
+            lo, below_lo = t, count
+        else:
+            hi, below_hi = t, count
+        stalled = stalled + 1 if side == last_side else 0
+        last_side = side
+    return _slopes_between(x, y, lo, hi, below_hi - below_lo)[first - below_lo - 1:last - below_lo]
+
+
+def theil_sen_slope(x: ArrayLike, y: ArrayLike, seed=None) -> float:
+    """
+    Mediana das inclinações entre todos os pares com x distintos, com
+    contagens O(n log n) e memória O(n) — as n(n−1)/2 inclinações nunca são
+    formadas. Uma amostra aleatória de pares fornece o intervalo inicial.
+    """
+    x, y, finite = _finite_xy(x, y)
+    order = np.argsort(x[finite], kind="stable")
+    x, y = x[finite][order], y[finite][order]
+    n = x.size
+    new_value = np.r_[True, x[1:] != x[:-1]]
+    ties = np.diff(np.r_[np.flatnonzero(new_value), n])
+    groups = None if ties.size == n else np.cumsum(new_value)
+    total = n * (n - 1) // 2 - int(np.sum(ties * (ties - 1) // 2))
+
+    if total <= 4 * n:
+        i, j = np.triu_indices(n, 1)
+    else:
+        i, j = np.random.default_rng(seed).integers(0, n, size=(2, min(max(20 * n, 10_000), 1_000_000)))
+    distinct = x[i] != x[j]
+    sample = np.sort((y[j] - y[i])[distinct] / (x[j] - x[i])[distinct])
+    first, last = (total + 1) // 2, total // 2 + 1
+    q = (first - 0.5) / total
+    margin = 3.0 * math.sqrt(q * (1 - q) / sample.size) + 1.0 / sample.size
+    pivots = [np.quantile(sample, max(q - margin, 0.0)), np.quantile(sample, min(q + margin, 1.0))]
+    bound = 2.0 * (np.ptp(y) / np.diff(x[new_value]).min() + 1.0)
+    resolution = 4 * np.finfo(float).eps * np.ptp(y) / np.ptp(x)
+    return float(np.mean(_select_slopes(x, y, groups, first, last, -bound, bound, 0, total,
+                                        sample, pivots, resolution)))
+
+
+def theil_sen_fit(x: ArrayLike, y: ArrayLike, threshold: float = 3.0, seed=None) -> RobustLinearFit:
+    """
+    Reta de Theil-Sen: b = mediana das inclinações entre pares,
+    a = mediana(y − b·x). Ponto de ruptura ≈ 29 %.
+
+    threshold: inliers são os pontos com |resíduo| ≤ threshold·σ̂
+    (σ̂ = 1,4826·MAD dos resíduos). Pontos NaN são ignorados.
+    """
+    x, y, finite = _finite_xy(x, y)
+    slope = theil_sen_slope(x[finite], y[finite], seed)
+    intercept = float(np.median(y[finite] - slope * x[finite]))
+    inliers = _inlier_mask(y - intercept - slope * x, finite, threshold, y)
+    return _robust_result(x, y, slope, intercept, inliers, "theil-sen")
+
+
+def repeated_median_fit(x: ArrayLike, y: ArrayLike, threshold: float = 3.0,
+                        block_size: int = 1 << 22) -> RobustLinearFit:
+    """
+    Mediana repetida de Siegel: b = mediana_i(mediana_j≠i inclinação_ij),
+    a = mediana(y − b·x). Ponto de ruptura de 50 %.
+
+    As medianas internas são calculadas em blocos de linhas com no máximo
+    block_size inclinações (tempo O(n²), memória limitada). threshold como
+    em theil_sen_fit.
+    """
+    x, y, finite = _finite_xy(x, y)
+    xf, yf = x[finite], y[finite]
+    n = xf.size
+    rows = max(block_size // n, 1)
+    inner = np.empty(n)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for start in range(0, n, rows):
+            block = slice(start, start + rows)
+            dx = xf[None, :] - xf[block, None]
+            slopes = (yf[None, :] - yf[block, None]) / dx
+            slopes[dx == 0] = np.nan
+            inner[block] = np.nanmedian(slopes, axis=1)
+    slope = float(np.nanmedian(inner))
+    intercept = float(np.median(yf - slope * xf))
+    inliers = _inlier_mask(y - intercept - slope * x, finite, threshold, y)
+    return _robust_result(x, y, slope, intercept, inliers, "repeated-median")
+
+
+def ransac_fit(x: ArrayLike, y: ArrayLike, threshold: float = 3.0, trials: int = 1000,
+               residual_threshold: float | None = None, seed=None,
+               block_size: int = 1 << 22) -> RobustLinearFit:
+    """
+    RANSAC: retas por pares aleatórios de pontos, mantém a de maior consenso
+    (|resíduo| ≤ residual_threshold; empate → menor soma de quadrados) e
+    reajusta por mínimos quadrados nos inliers, repetindo até o consenso
+    estabilizar.
+
+    residual_threshold: em unidades de y; padrão threshold·σ̂ dos resíduos
+    da reta de Theil-Sen. Os candidatos são avaliados em blocos de no máximo
+    block_size resíduos.
+    """
+    x, y, finite = _finite_xy(x, y)
+    if trials < 1:
+        raise ValueError("Número de tentativas deve ser positivo")
+    xf, yf = x[finite], y[finite]
+    if residual_threshold is None:
+        robust = theil_sen_fit(xf, yf, threshold, seed)
+        r = np.abs(yf - robust.intercept - robust.slope * xf)
+        residual_threshold = max(threshold * 1.4826 * float(np.median(r)),
+                                 64 * np.finfo(float).eps * max(float(np.max(np.abs(yf))), 1.0))
+    elif residual_threshold <= 0:
+        raise ValueError("Limite de resíduo deve ser positivo")
+
+    rng = np.random.default_rng(seed)
+    i, j = rng.integers(0, xf.size, size=(2, trials))
+    distinct = xf[i] != xf[j]
+    i, j = i[distinct], j[distinct]
+    if i.size == 0:
+        raise ValueError("Nenhum par amostrado com x distintos; aumente trials")
+    slopes = (yf[j] - yf[i]) / (xf[j] - xf[i])
+    intercepts = yf[i] - slopes * xf[i]
+    support = np.empty(slopes.size, dtype=np.int64)
+    spread = np.empty(slopes.size)
+    rows = max(block_size // xf.size, 1)
+    for start in range(0, slopes.size, rows):
+        block = slice(start, start + rows)
+        r2 = (yf[None, :] - intercepts[block, None] - slopes[block, None] * xf[None, :]) ** 2
+        inside = r2 <= residual_threshold ** 2
+        support[block] = inside.sum(axis=1)
+        spread[block] = np.where(inside, r2, 0.0).sum(axis=1)
+    best = np.lexsort((spread, -support))[0]
+
+    slope, intercept = slopes[best], intercepts[best]
+    consensus = None
+    for _ in range(100):
+        updated = np.abs(yf - intercept - slope * xf) <= residual_threshold
+        if consensus is not None and np.array_equal(updated, consensus):
+            break
+        consensus = updated
+        if np.unique(xf[consensus]).size < 2:
+            break
+        fit = linear_fit(xf[consensus], yf[consensus])
+        slope, intercept = fit.slope, fit.intercept
+    inliers = np.zeros(x.shape, dtype=bool)
+    inliers[finite] = consensus
+    return _robust_result(x, y, slope, intercept, inliers, "ransac")
+
+
+# --- Regression diagnostics ---
+
+def regression_diagnostics_batch(x: ArrayLike, y: ArrayLike, weights: ArrayLike | None = None,
+                                 alpha: float = 0.05) -> dict:
+    """
+    Diagnósticos da reta de mínimos quadrados (a de linear_fit, ou a
+    ponderada com weights) para muitas curvas de uma vez: y com forma
+    (n_curvas, n_pontos), x e weights com a mesma forma ou (n_pontos,).
+    Pontos NaN são ignorados.
+
+    Por ponto, sem reajustes — tudo sai da diagonal do chapéu em forma fechada:
+      h_i = w_i/Σw + w_i(x_i − x̄)²/Sxx                (alavancagem)
+      r_i = √w_i·e_i / (s·√(1 − h_i))                  (resíduo padronizado)
+      t_i = r_i·√((n − 3)/(n − 2 − r_i²))              (studentizado externo)
+      D_i = r_i²·h_i / (2(1 − h_i))                    (distância de Cook)
+    Máscaras: high_leverage (h > 4/n), outlier (|t| > t crítico bicaudal com
+    n − 3 gl), influential (D > 4/n) e flagged = outlier | influential.
+
+    Por curva: Durbin-Watson dos resíduos na ordem das colunas (aquisição),
+    com valor-p pela aproximação normal d ≈ 2(1 − ρ), ρ ~ N(0, 1/n); e teste
+    F de falta de ajuste contra o erro puro das replicatas (mesmo x), com
+    m − 2 e n − m gl (m = níveis distintos; NaN sem replicatas).
+    """
+    y = np.atleast_2d(np.asarray(y, dtype=float))
+    if y.ndim != 2:
+        raise ValueError("y deve ter forma (n_curvas, n_pontos)")
+    if not 0 < alpha < 1:
+        raise ValueError("alpha deve estar entre 0 e 1")
+    try:
+        x = np.broadcast_to(np.asarray(x, dtype=float), y.shape)
+        w = np.broadcast_to(np.asarray(1.0 if weights is None else weights, dtype=float), y.shape)
+    except ValueError:
+        raise ValueError("x e weights devem ter a forma de y ou (n_pontos,)") from None
+    if np.any(w < 0):
+        raise ValueError("Pesos devem ser não negativos")
+
+    valid = np.isfinite(x) & np.isfinite(y) & np.isfinite(w) & (w > 0)
+    w = np.where(valid, w, 0.0)
+    n = valid.sum(axis=1)
+    rows = np.arange(y.shape[0])
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sum_w = w.sum(axis=1)
+        x_mean = (w * np.where(valid, x, 0.0)).sum(axis=1) / sum_w
+        y_mean = (w * np.where(valid, y, 0.0)).sum(axis=1) / sum_w
+        dx = np.where(valid, x - x_mean[:, None], 0.0)
+        dy = np.where(valid, y - y_mean[:, None], 0.0)
+        ss_xx = np.einsum("ij,ij,ij->i", w, dx, dx)
+        slope = np.where((n >= 2) & (ss_xx > 0), np.einsum("ij,ij,ij->i", w, dx, dy) / ss_xx, np.nan)
+        intercept = y_mean - slope * x_mean
+        residuals = np.where(valid, y - intercept[:, None] - slope[:, None] * x, np.nan)
+        weighted = np.sqrt(w) * residuals
+        sse = np.nansum(weighted ** 2, axis=1)
+        s = np.where(n > 2, np.sqrt(sse / (n - 2)), np.nan)
+
+        leverage = np.where(valid, w / sum_w[:, None] + w * dx ** 2 / ss_xx[:, None], np.nan)
+        standardized = weighted / (s[:, None] * np.sqrt(1.0 - leverage))
+        dof = (n - 3)[:, None]
+        studentized = standardized * np.sqrt(dof / (dof + 1 - standardized ** 2))
+        cooks = standardized ** 2 * leverage / (2.0 * (1.0 - leverage))
+
+        # Durbin-Watson: pontos válidos primeiro, na ordem original
+        by_validity = np.argsort(~valid, axis=1, kind="stable")
+        ordered = np.take_along_axis(weighted, by_validity, axis=1)
+        durbin_watson = np.nansum(np.diff(ordered, axis=1) ** 2, axis=1) / sse
+        z = (1.0 - durbin_watson / 2.0) * np.sqrt(n)
+        durbin_watson_p = 2.0 * stats.norm.sf(np.abs(z))
+
+        # Falta de ajuste: grupos de x iguais após ordenar cada linha por x
+        by_x = np.argsort(np.where(valid, x, np.inf), axis=1, kind="stable")
+        xs = np.take_along_axis(x, by_x, axis=1)
+        ys = np.take_along_axis(np.where(valid, y, 0.0), by_x, axis=1)
+        ws = np.take_along_axis(w, by_x, axis=1)
+        vs = np.take_along_axis(valid, by_x, axis=1)
+        new_level = vs & np.c_[np.ones((y.shape[0], 1), dtype=bool), xs[:, 1:] != xs[:, :-1]]
+        levels = new_level.sum(axis=1)
+        group = rows[:, None] * y.shape[1] + np.maximum(np.cumsum(new_level, axis=1) - 1, 0)
+        group_weight = np.bincount(group[vs], ws[vs], minlength=y.size)
+        group_mean = np.bincount(group[vs], (ws * ys)[vs], minlength=y.size) / group_weight
+        pure_error = np.bincount(np.broadcast_to(rows[:, None], y.shape)[vs],
+                                 (ws * (ys - group_mean[group]) ** 2)[vs], minlength=y.shape[0])
+        df_lack, df_pure = levels - 2, n - levels
+        testable = (df_lack > 0) & (df_pure > 0) & np.isfinite(sse)
+        lack_f = np.where(testable, (np.maximum(sse - pure_error, 0.0) / df_lack) / (pure_error / df_pure), np.nan)
+        lack_p = np.where(testable, stats.f.sf(lack_f, np.maximum(df_lack, 1), np.maximum(df_pure, 1)), np.nan)
+
+        t_critical = np.where(n > 3, stats.t.ppf(1 - alpha / 2, np.maximum(n - 3, 1)), np.nan)
+        high_leverage = leverage > (4.0 / n)[:, None]
+        outlier = np.abs(studentized) > t_critical[:, None]
+        influential = cooks > (4.0 / n)[:, None]
+
+    return {
+        "slope": slope,
+        "intercept": intercept,
+        "residual_std_error": s,
+        "n": n,
+        "residuals": residuals,
+        "leverage": leverage,
+        "standardized_residuals": standardized,
+        "studentized_residuals": studentized,
+        "cooks_distance": cooks,
+        "high_leverage": high_leverage,
+        "outlier": outlier,
+        "influential": influential,
+        "flagged": outlier | influential,
+        "durbin_watson": durbin_watson,
+        "durbin_watson_p_value": durbin_watson_p,
+        "autocorrelated": durbin_watson_p < alpha,
+        "lack_of_fit_f": lack_f,
+        "lack_of_fit_p_value": lack_p,
+        "lack_of_fit": lack_p < alpha,
+        "alpha": alpha,
+    }
+
+
+def regression_diagnostics(x: ArrayLike, y: ArrayLike, weights: ArrayLike | None = None,
+                           alpha: float = 0.05) -> dict:
+    """Diagnósticos de uma única curva (ver regression_diagnostics_batch)."""
+    x = np.asarray(x, dtype=float).ravel()
+    y = np.asarray(y, dtype=float).ravel()
+    if x.size != y.size or x.size < 3:
+        raise ValueError("x e y devem ter mesmo tamanho e pelo menos 3 pontos")
+    result = regression_diagnostics_batch(x, y, None if weights is None else np.ravel(weights), alpha)
+    return {key: value if np.ndim(value) == 0 else
+            (value[0] if value.ndim == 2 else value[0].item())
+            for key, value in result.items()}
+
+
+# --- Comparison of calibration curves (ANCOVA) ---
+
+def calibration_ancova(x: ArrayLike, y: ArrayLike, confidence_level: float = 0.95) -> dict:
+    """
+    ANCOVA de k retas de calibração (instrumentos, dias, matrizes): y com
+    forma (k, n_pontos) ou (..., k, n_pontos) para muitos estudos de uma vez;
+    x com a mesma forma ou (n_pontos,). Pontos NaN são ignorados e curvas com
+    menos de 2 pontos ou x constante ficam de fora.
+
+    Com as somas centradas de cada curva (Sxx_j, Sxy_j, Syy_j):
+      SQR_sep = Σ(Syy_j − Sxy_j²/Sxx_j)              retas separadas, N − 2k gl
+      SQR_par = ΣSyy_j − (ΣSxy_j)²/ΣSxx_j            inclinação comum, N − k − 1 gl
+      SQR_única: uma só reta para todos os pontos,     N − 2 gl
+    H₀ (inclinações iguais): F = [(SQR_par − SQR_sep)/(k − 1)] / [SQR_sep/(N − 2k)]
+    H₀ (interceptos iguais, dada a inclinação comum):
+      F = [(SQR_única − SQR_par)/(k − 1)] / [SQR_par/(N − k − 1)]
+    O segundo teste só é interpretável quando as inclinações não diferem.
+    """
+    if not 0 < confidence_level < 1:
+        raise ValueError("Nível de confiança deve estar entre 0 e 1")
+    y = np.asarray(y, dtype=float)
+    if y.ndim < 2:
+        raise ValueError("y deve ter forma (n_curvas, n_pontos) ou (..., n_curvas, n_pontos)")
+    try:
+        x = np.broadcast_to(np.asarray(x, dtype=float), y.shape)
+    except ValueError:
+        raise ValueError("x deve ter a forma de y ou (n_pontos,)") from None
+
+    fits = linear_fit_batch(x.reshape(-1, y.shape[-1]), y.reshape(-1, y.shape[-1])).reshape(y.shape[:-1])
+    valid = np.isfinite(x) & np.isfinite(y)
+    n = valid.sum(axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        x_mean = np.where(valid, x, 0.0).sum(axis=-1) / n
+        y_mean = np.where(valid, y, 0.0).sum(axis=-1) / n
+        dx = np.where(valid, x - x_mean[..., None], 0.0)
+        dy = np.where(valid, y - y_mean[..., None], 0.0)
+        ss_xx = np.einsum("...ij,...ij->...i", dx, dx)
+        ss_xy = np.einsum("...ij,...ij->...i", dx, dy)
+        ss_yy = np.einsum("...ij,...ij->...i", dy, dy)
+        used = (n >= 2) & (ss_xx > 0)
+        n = np.where(used, n, 0)
+        x_mean, y_mean = np.where(used, x_mean, 0.0), np.where(used, y_mean, 0.0)
+        ss_xx, ss_xy, ss_yy = (np.where(used, s, 0.0) for s in (ss_xx, ss_xy, ss_yy))
+
+        k = used.sum(axis=-1)
+        total = n.sum(axis=-1)
+        sse_separate = np.where(used, ss_yy - ss_xy ** 2 / ss_xx, 0.0).sum(axis=-1)
+        within_xx, within_xy, within_yy = ss_xx.sum(axis=-1), ss_xy.sum(axis=-1), ss_yy.sum(axis=-1)
+        common_slope = within_xy / within_xx
+        sse_common = within_yy - within_xy ** 2 / within_xx
+        # somas totais = dentro das curvas + entre as médias das curvas
+        grand_x = (n * x_mean).sum(axis=-1) / total
+        grand_y = (n * y_mean).sum(axis=-1) / total
+        between_x, between_y = x_mean - grand_x[..., None], y_mean - grand_y[..., None]
+        total_xx = within_xx + (n * between_x ** 2).sum(axis=-1)
+        total_xy = within_xy + (n * between_x * between_y).sum(axis=-1)
+        total_yy = within_yy + (n * between_y ** 2).sum(axis=-1)
+        sse_single = total_yy - total_xy ** 2 / total_xx
+
+        df1 = k - 1
+        slope_df2, intercept_df2 = total - 2 * k, total - k - 1
+        slope_ok = (k >= 2) & (slope_df2 > 0)
+        intercept_ok = (k >= 2) & (intercept_df2 > 0)
+        slope_f = np.where(slope_ok, (np.maximum(sse_common - sse_separate, 0.0) / df1)
+                           / (sse_separate / slope_df2), np.nan)
+        intercept_f = np.where(intercept_ok, (np.maximum(sse_single - sse_common, 0.0) / df1)
+                               / (sse_common / intercept_df2), np.nan)
+        safe_df1 = np.maximum(df1, 1)
+        slope_p = np.where(slope_ok, stats.f.sf(slope_f, safe_df1, np.maximum(slope_df2, 1)), np.nan)
+        intercept_p = np.where(intercept_ok, stats.f.sf(intercept_f, safe_df1, np.maximum(intercept_df2, 1)),
+                               np.nan)
+        alpha = 1 - confidence_level
+        slope_critical = np.where(slope_ok, stats.f.ppf(1 - alpha, safe_df1, np.maximum(slope_df2, 1)), np.nan)
+        intercept_critical = np.where(intercept_ok,
+                                      stats.f.ppf(1 - alpha, safe_df1, np.maximum(intercept_df2, 1)), np.nan)
+        common_intercepts = np.where(used, y_mean - common_slope[..., None] * x_mean, np.nan)
+
+    return {
+        "fits": fits,
+        "curves": k if k.ndim else int(k),
+        "n": total if total.ndim else int(total),
+        "common_slope": _scalar_or_array(common_slope),
+        "common_intercepts": common_intercepts,
+        "sse_separate": _scalar_or_array(sse_separate),
+        "sse_common": _scalar_or_array(sse_common),
+        "sse_single": _scalar_or_array(sse_single),
+        "slope_f_statistic": _scalar_or_array(slope_f),
+        "slope_p_value": _scalar_or_array(slope_p),
+        "slope_f_critical": _scalar_or_array(slope_critical),
+        "slope_df": (df1, slope_df2) if k.ndim else (int(df1), int(slope_df2)),
+        "slopes_differ": slope_f > slope_critical if k.ndim else bool(slope_f > slope_critical),
+        "intercept_f_statistic": _scalar_or_array(intercept_f),
+        "intercept_p_value": _scalar_or_array(intercept_p),
+        "intercept_f_critical": _scalar_or_array(intercept_critical),
+        "intercept_df": (df1, intercept_df2) if k.ndim else (int(df1), int(intercept_df2)),
+        "intercepts_differ": (intercept_f > intercept_critical if k.ndim
+                              else bool(intercept_f > intercept_critical)),
+        "confidence_level": confidence_level,
+    }
@@ -0,0 +1,391 @@
+"""
+Solubilidade a partir do Ksp: efeito do íon comum, dependência do pH
+(hidróxidos e sais de ânions básicos), limiares de precipitação e curvas de
+titulação de precipitação (Mohr, Volhard).
+
+A estequiometria de dissolução MₐXᵦ → a M + b X vem de
+parse_chemical_formula; concentrações de entrada e saída aceitam qualquer
+unidade de UNIT_REGISTRY (molar ou mássica). Todas as funções avaliam
+arrays de condições de uma vez.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .calculations import (
+    UNIT_REGISTRY,
+    _scalar_or_array,
+    calculate_molar_mass,
+    convert_units,
+    kw_at_temperature,
+    parse_chemical_formula,
+    parse_formula_charge,
+    pka_at_temperature,
+)
+from .speciation import log_alpha_fractions
+
+# Indicador de Volhard: Fe³⁺ + SCN⁻ ⇌ FeSCN²⁺, cor visível a partir de 6,4 µM
+FESCN_FORMATION_CONSTANT = 1.05e3
+FESCN_DETECTION_LIMIT = 6.4e-6
+
+
+@dataclass(frozen=True)
+class SparinglySolubleSalt:
+    """
+    Sal pouco solúvel MₐXᵦ com Ksp a 25 °C.
+
+    anion_pkas: pKa dos ácidos conjugados do ânion (HₙX), em ordem de
+        desprotonação; acid_system usa ACID_THERMODYNAMICS (com temperatura).
+        Ânion OH⁻ é tratado diretamente por Kw.
+    """
+    formula: str
+    cation: str
+    anion: str
+    ksp: float
+    cation_count: int
+    anion_count: int
+    anion_pkas: Tuple[float, ...] | None = None
+    acid_system: str | None = None
+
+    @property
+    def hydroxide(self) -> bool:
+        return parse_chemical_formula(self.anion) == {"O": 1, "H": 1}
+
+    def pkas_at(self, temperature: float) -> np.ndarray:
+        if self.acid_system is not None:
+            return np.atleast_1d(pka_at_temperature(self.acid_system, temperature))
+        return np.asarray(self.anion_pkas or (), dtype=float)
+
+
+SALT_CATALOGUE: Dict[str, SparinglySolubleSalt] = {}
+
+
+def dissolution_stoichiometry(formula: str, cation: str, anion: str) -> Tuple[int, int]:
+    """Coeficientes (a, b) de MₐXᵦ → a M + b X, conferidos pela composição e pelas cargas."""
+    salt = parse_chemical_formula(formula)
+    z_cation = parse_formula_charge(cation)
+    z_anion = parse_formula_charge(anion)
+    if parse_formula_charge(formula) != 0:
+        raise ValueError("O sal deve ser neutro")
+    if z_cation <= 0 or z_anion >= 0:
+        raise ValueError("Informe um cátion (carga +) e um ânion (carga −)")
+    g = math.gcd(z_cation, -z_anion)
+    a, b = -z_anion // g, z_cation // g
+    cation_atoms = parse_chemical_formula(cation)
+    anion_atoms = parse_chemical_formula(anion)
+    element = next(iter(cation_atoms))
+    k = salt.get(element, 0) // (a * cation_atoms[element])
+    expected: Dict[str, int] = {}
+    for atoms, count in ((cation_atoms, k * a), (anion_atoms, k * b)):
+        for el, n in atoms.items():
+            expected[el] = expected.get(el, 0) + n * count
+    if k == 0 or expected != salt:
+        raise ValueError(f"{formula} não corresponde a {cation} + {anion}")
+    return k * a, k * b
+
+
+def register_salt(formula: str, cation: str, anion: str, ksp: float | None = None,
+                  pksp: float | None = None, anion_pkas=None,
+                  acid_system: str | None = None) -> SparinglySolubleSalt:
+    """Adiciona um sal ao catálogo (informe ksp ou pksp)."""
+    if (ksp is None) == (pksp is None):
+        raise ValueError("Informe Ksp OU pKsp")
+    ksp = 10.0 ** -pksp if ksp is None else ksp
+    if ksp <= 0:
+        raise ValueError("Ksp deve ser positivo")
+    a, b = dissolution_stoichiometry(formula, cation, anion)
+    salt = SparinglySolubleSalt(formula, cation, anion, float(ksp), a, b,
+                                tuple(float(p) for p in anion_pkas) if anion_pkas is not None else None,
+                                acid_system)
+    SALT_CATALOGUE[formula] = salt
+    return salt
+
+
+# Ksp a 25 °C (CRC Handbook)
+register_salt("AgCl", "Ag^+", "Cl^-", 1.77e-10)
+register_salt("AgBr", "Ag^+", "Br^-", 5.35e-13)
+register_salt("AgI", "Ag^+", "I^-", 8.52e-17)
+register_salt("AgSCN", "Ag^+", "SCN^-", 1.03e-12)
+register_salt("Ag2CrO4", "Ag^+", "CrO4^2-", 1.12e-12, anion_pkas=(-0.8, 6.51))
+register_salt("Ag2CO3", "Ag^+", "CO3^2-", 8.46e-12, acid_system="carbonato")
+register_salt("PbCl2", "Pb^2+", "Cl^-", 1.70e-5)
+register_salt("PbI2", "Pb^2+", "I^-", 9.8e-9)
+register_salt("CaF2", "Ca^2+", "F^-", 3.45e-11, anion_pkas=(3.17,))
+register_salt("BaSO4", "Ba^2+", "SO4^2-", 1.08e-10, anion_pkas=(-3.0, 1.99))
+register_salt("CaSO4", "Ca^2+", "SO4^2-", 4.93e-5, anion_pkas=(-3.0, 1.99))
+register_salt("PbSO4", "Pb^2+", "SO4^2-", 2.53e-8, anion_pkas=(-3.0, 1.99))
+register_salt("CaCO3", "Ca^2+", "CO3^2-", 3.36e-9, acid_system="carbonato")
+register_salt("BaCO3", "Ba^2+", "CO3^2-", 2.58e-9, acid_system="carbonato")
+register_salt("SrCO3", "Sr^2+", "CO3^2-", 5.60e-10, acid_system="carbonato")
+register_salt("MgCO3", "Mg^2+", "CO3^2-", 6.82e-6, acid_system="carbonato")
+register_salt("Ca3(PO4)2", "Ca^2+", "PO4^3-", 2.07e-33, acid_system="fosfato")
+register_salt("Mg(OH)2", "Mg^2+", "OH^-", 5.61e-12)
+register_salt("Ca(OH)2", "Ca^2+", "OH^-", 5.02e-6)
+register_salt("Fe(OH)2", "Fe^2+", "OH^-", 4.87e-17)
+register_salt("Fe(OH)3", "Fe^3+", "OH^-", 2.79e-39)
+register_salt("Zn(OH)2", "Zn^2+", "OH^-", 3.0e-17)
+register_salt("Cu(OH)2", "Cu^2+", "OH^-", 2.2e-20)
+register_salt("Al(OH)3", "Al^3+", "OH^-", 3.0e-34)
+
+
+def _get_salt(salt) -> SparinglySolubleSalt:
+    if isinstance(salt, SparinglySolubleSalt):
+        return salt
+    if salt not in SALT_CATALOGUE:
+        raise ValueError(f"Sal desconhecido: {salt}")
+    return SALT_CATALOGUE[salt]
+
+
+def _to_molar(value: ArrayLike, unit: str, formula: str) -> np.ndarray:
+    """Concentração em mol/L a partir de uma unidade molar ou mássica."""
+    dimension = UNIT_REGISTRY.get(unit, (None,))[0]
+    if dimension == "concentration":
+        return np.asarray(convert_units(np.asarray(value, dtype=float), unit, "M"))
+    if dimension == "mass_concentration":
+        return np.asarray(convert_units(np.asarray(value, dtype=float), unit, "g/L")) / calculate_molar_mass(formula)
+    raise ValueError(f"Unidade de concentração não suportada: {unit}")
+
+
+def _from_molar(value: np.ndarray, unit: str, formula: str) -> np.ndarray:
+    if UNIT_REGISTRY[unit][0] == "mass_concentration":
+        return convert_units(value * calculate_molar_mass(formula), "g/L", unit)
+    return convert_units(value, "M", unit)
+
+
+def _anion_log_alpha(salt: SparinglySolubleSalt, ph, temperature: float) -> np.ndarray:
+    """log₁₀ da fração do ânion livre (totalmente desprotonado) no pH dado."""
+    pkas = salt.pkas_at(temperature)
+    if ph is None or pkas.size == 0:
+        return np.zeros(np.shape(ph) if ph is not None else ())
+    return log_alpha_fractions(ph, pkas)[..., -1]
+
+
+def molar_solubility(salt, ph: ArrayLike | None = None, cation_concentration: ArrayLike = 0.0,
+                     anion_concentration: ArrayLike = 0.0, ksp: ArrayLike | None = None,
+                     temperature: float = 25.0, unit: str = "M") -> dict:
+    """
+    Solubilidade s de MₐXᵦ: Ksp = [M]ᵃ·[X]ᵇ com [M] = a·s + C_M e
+    [X] = α_X(pH)·(b·s + C_X).
+
+    salt: fórmula de SALT_CATALOGUE ou SparinglySolubleSalt.
+    ph: pH tamponado (None = água pura, sem protonação do ânion; para
+        hidróxidos o OH⁻ do sal e da água é somado).
+    cation_concentration / anion_concentration: íons comuns já presentes.
+    ksp: substitui o Ksp do catálogo.
+    unit: unidade das concentrações de entrada e da solubilidade retornada
+        (molar ou mássica, de UNIT_REGISTRY).
+
+    Todos os argumentos numéricos são combinados por broadcasting; s é
+    obtido por bissecção em log s (f é monótona). Retorna solubilidade na
+    unidade pedida, em mol/L e em g/L, íons livres, máscara de soluções já
+    supersaturadas pelo íon comum (s = 0) e máscara de erro.
+    """
+    salt = _get_salt(salt)
+    a, b = salt.cation_count, salt.anion_count
+    c_cation = _to_molar(cation_concentration, unit, salt.cation)
+    c_anion = _to_molar(anion_concentration, unit, salt.anion)
+    if np.any(c_cation < 0) or np.any(c_anion < 0):
+        raise ValueError("Concentrações devem ser não negativas")
+    log_ksp = np.log10(np.asarray(salt.ksp if ksp is None else ksp, dtype=float))
+    kw = kw_at_temperature(temperature)
+    log_alpha = _anion_log_alpha(salt, ph, temperature)
+    shape = np.broadcast_shapes(np.shape(c_cation), np.shape(c_anion), np.shape(log_ksp),
+                                np.shape(ph) if ph is not None else ())
+
+    def free_ions(s):
+        cation = a * s + c_cation
+        if salt.hydroxide:
+            if ph is not None:
+                anion = np.broadcast_to(kw * 10.0 ** np.asarray(ph, dtype=float), s.shape)
+            else:
+                excess = b * s + c_anion
+                anion = 0.5 * (excess + np.sqrt(excess ** 2 + 4 * kw))
+        else:
+            anion = 10.0 ** log_alpha * (b * s + c_anion)
+        return cation, anion
+
+    def excess(log_s):
+        cation, anion = free_ions(10.0 ** log_s)
+        with np.errstate(divide="ignore"):
+            return a * np.log10(cation) + b * np.log10(anion) - log_ksp
+
+    low = np.full(shape, -40.0)
+    high = np.full(shape, 3.0)
+    supersaturated = excess(low) > 0
+    error = excess(high) < 0
+    for _ in range(50):
+        middle = 0.5 * (low + high)
+        above = excess(middle) > 0
+        high = np.where(above, middle, high)
+        low = np.where(above, low, middle)
+    s = np.where(supersaturated, 0.0, 10.0 ** (0.5 * (low + high)))
+    s = np.where(error, np.nan, s)
+    cation, anion = free_ions(s)
+
+    return {
+        "salt": salt.formula,
+        "solubility": _scalar_or_array(np.asarray(_from_molar(s, unit, salt.formula))),
+        "molar_solubility": _scalar_or_array(s),
+        "mass_solubility": _scalar_or_array(s * calculate_molar_mass(salt.formula)),
+        "cation": _scalar_or_array(cation),
+        "anion": _scalar_or_array(anion),
+        "supersaturated": supersaturated,
+        "error": error,
+        "unit": unit,
+    }
+
+
+def precipitation_threshold(salt, cation_concentration: ArrayLike | None = None,
+                            anion_concentration: ArrayLike | None = None,
+                            ph: ArrayLike | None = None, ksp: ArrayLike | None = None,
+                            temperature: float = 25.0, unit: str = "M") -> dict:
+    """
+    Concentração do contra-íon em que MₐXᵦ começa a precipitar.
+
+    Informe cation_concentration (retorna o ânion limiar, livre e total
+    corrigido por α_X(pH)) OU anion_concentration (total; retorna o cátion
+    limiar). Para hidróxidos com cation_concentration, também retorna o pH
+    de início da precipitação; com ph, o OH⁻ vem de Kw.
+    """
+    salt = _get_salt(salt)
+    anion_given = anion_concentration is not None or (salt.hydroxide and ph is not None)
+    if (cation_concentration is not None) == anion_given:
+        raise ValueError("Informe a concentração do cátion OU a do ânion")
+    a, b = salt.cation_count, salt.anion_count
+    log_ksp = np.log10(np.asarray(salt.ksp if ksp is None else ksp, dtype=float))
+    kw = kw_at_temperature(temperature)
+
+    if cation_concentration is not None:
+        cation = _to_molar(cation_concentration, unit, salt.cation)
+        if np.any(cation <= 0):
+            raise ValueError("Concentração deve ser positiva")
+        free = 10.0 ** ((log_ksp - a * np.log10(cation)) / b)
+        result = {"salt": salt.formula, "anion_free": _scalar_or_array(free)}
+        if salt.hydroxide:
+            result["ph"] = _scalar_or_array(np.log10(free / kw))
+            total = free
+        else:
+            total = free / 10.0 ** _anion_log_alpha(salt, ph, temperature)
+        result["anion"] = _scalar_or_array(np.asarray(_from_molar(total, unit, salt.anion)))
+        return result
+
+    if anion_concentration is None:
+        anion = kw * 10.0 ** np.asarray(ph, dtype=float)
+    else:
+        anion = _to_molar(anion_concentration, unit, salt.anion) * 10.0 ** _anion_log_alpha(salt, ph, temperature)
+    if np.any(anion <= 0):
+        raise ValueError("Concentração deve ser positiva")
+    cation = 10.0 ** ((log_ksp - b * np.log10(anion)) / a)
+    return {
+        "salt": salt.formula,
+        "anion_free": _scalar_or_array(anion),
+        "cation": _scalar_or_array(np.asarray(_from_molar(cation, unit, salt.cation))),
+    }
+
+
+def _ion_label(formula: str) -> str:
+    return "p" + "".join(ch for ch in formula if ch.isalpha())
+
+
+def simulate_precipitation_titration(analyte_concentration: float, analyte_volume: float,
+                                     titrant_concentration: float, method: str | None = "mohr",
+                                     salt=None, analyte: str | None = None,
+                                     indicator_concentration: float | None = None,
+                                     max_volume: float | None = None, points: int = 20000,
+                                     unit: str = "M") -> dict:
+    """
+    Curva pM/pX × volume de titulante para um precipitado 1:1 (MX).
+
+    method: "mohr" (Cl⁻ titulado com Ag⁺, indicador CrO₄²⁻; padrão 5 mM),
+        "volhard" (Ag⁺ titulado com SCN⁻, indicador Fe³⁺; padrão 15 mM) ou
+        None (só a curva; informe salt e analyte).
+    analyte: "anion" ou "cation" (íon titulado).
+    Concentrações na unidade unit; volumes na mesma unidade entre si.
+
+    Em cada ponto: C_M − C_X = [M] − [X] e [M]·[X] = Ksp (se saturado).
+    O ponto final do indicador vem da concentração livre do íon titulante
+    que torna o indicador visível, com o erro de titulação em %.
+    """
+    defaults = {"mohr": ("AgCl", "anion", 5e-3), "volhard": ("AgSCN", "cation", 0.015)}
+    if method is not None:
+        if method not in defaults:
+            raise ValueError("Método deve ser 'mohr', 'volhard' ou None")
+        salt = salt or defaults[method][0]
+        analyte = analyte or defaults[method][1]
+        if indicator_concentration is None:
+            indicator_concentration = defaults[method][2]
+    if salt is None or analyte not in ("anion", "cation"):
+        raise ValueError("Informe o sal e o íon titulado ('anion' ou 'cation')")
+    salt = _get_salt(salt)
+    if (salt.cation_count, salt.anion_count) != (1, 1):
+        raise ValueError("Titulação de precipitação suportada apenas para sais 1:1")
+    if points < 10:
+        raise ValueError("Use pelo menos 10 pontos")
+    analyte_ion, titrant_ion = ((salt.anion, salt.cation) if analyte == "anion"
+                                else (salt.cation, salt.anion))
+    c0 = float(_to_molar(analyte_concentration, unit, analyte_ion))
+    ct = float(_to_molar(titrant_concentration, unit, titrant_ion))
+    if min(c0, ct, analyte_volume) <= 0:
+        raise ValueError("Concentrações e volume devem ser positivos")
+    ksp = salt.ksp
+
+    eq_volume = c0 * analyte_volume / ct
+    if max_volume is None:
+        max_volume = 2.0 * eq_volume
+    volume = np.linspace(0.0, max_volume, points)
+    total = analyte_volume + volume
+    c_titrant = ct * volume / total
+    c_analyte = c0 * analyte_volume / total
+
+    # Íon titulante livre: raiz estável de t² − D·t − Ksp = 0, D = C_t − C_a
+    d = c_titrant - c_analyte
+    root = np.sqrt(d ** 2 + 4 * ksp)
+    saturated = c_titrant * c_analyte > ksp
+    titrant_free = np.where(saturated, np.where(d >= 0, 0.5 * (d + root), 2 * ksp / (root - d)), c_titrant)
+    analyte_free = np.where(saturated, ksp / np.where(titrant_free > 0, titrant_free, 1.0), c_analyte)
+    with np.errstate(divide="ignore"):
+        p_titrant = np.where(titrant_free > 0, -np.log10(titrant_free), np.nan)
+        p_analyte = -np.log10(analyte_free)
+    p_cation, p_anion = (p_titrant, p_analyte) if analyte == "anion" else (p_analyte, p_titrant)
+
+    end_point = None
+    if method is not None:
+        if indicator_concentration <= 0:
+            raise ValueError("Concentração do indicador deve ser positiva")
+        if method == "mohr":
+            # Ag2CrO4 vermelho: [Ag⁺]²·[CrO₄²⁻] = Ksp
+            t_end = math.sqrt(SALT_CATALOGUE["Ag2CrO4"].ksp / indicator_concentration)
+        else:
+            t_end = FESCN_DETECTION_LIMIT / (FESCN_FORMATION_CONSTANT * indicator_concentration)
+        d_end = t_end - ksp / t_end
+        v_end = analyte_volume * (c0 + d_end) / (ct - d_end)
+        end_point = {
+            "volume": float(v_end),
+            "p_titrant": float(-math.log10(t_end)),
+            "error_percent": float(100.0 * (v_end - eq_volume) / eq_volume),
+        }
+
+    # pTitulante é indefinido em v = 0; a derivada usa os pontos finitos e
+    # repete o valor vizinho nas bordas
+    finite = np.isfinite(p_titrant)
+    dp_dv = np.interp(volume, volume[finite], np.gradient(p_titrant[finite], volume[finite]))
+
+    eq_free = math.sqrt(ksp)
+    return {
+        "volume": volume,
+        "p_cation": p_cation,
+        "p_anion": p_anion,
+        "dp_dv": dp_dv,
+        "cation_label": _ion_label(salt.cation),
+        "anion_label": _ion_label(salt.anion),
+        "equivalence_point": {"volume": float(eq_volume), "p": float(-math.log10(eq_free))},
+        "end_point": end_point,
+        "salt": salt.formula,
+        "analyte": analyte,
+        "method": method,
+    }
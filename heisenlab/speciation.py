@@ -0,0 +1,153 @@
+"""
+Diagramas de distribuição (frações α) para sistemas polipróticos.
+Toda a grade de pH é avaliada em uma única operação vetorizada, em espaço
+logarítmico, para continuar estável com pKa muito afastados.
+"""
+from __future__ import annotations
+
+from typing import List, Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from .calculations import ka_kb_relationship
+
+_SUPERSCRIPTS = str.maketrans("0123456789+-", "⁰¹²³⁴⁵⁶⁷⁸⁹⁺⁻")
+_SUBSCRIPTS = str.maketrans("0123456789", "₀₁₂₃₄₅₆₇₈₉")
+
+
+def conjugate_acid_pkas(pkbs: Sequence[float], temperature: float = 25.0) -> List[float]:
+    """pKa do ácido conjugado de uma base (ordem de desprotonação)."""
+    # pKb1 corresponde à última desprotonação do ácido conjugado totalmente protonado
+    pkas = ka_kb_relationship(kb=10.0 ** -np.asarray(pkbs, dtype=float)[::-1], temperature=temperature)["pka"]
+    return [float(pka) for pka in pkas]
+
+
+def _validate_pkas(pkas: Sequence[float]) -> np.ndarray:
+    pkas = np.asarray(pkas, dtype=float).ravel()
+    if pkas.size == 0:
+        raise ValueError("Informe ao menos um pKa")
+    if not np.all(np.isfinite(pkas)):
+        raise ValueError("pKa deve ser um número finito")
+    return pkas
+
+
+def log_alpha_fractions(ph: ArrayLike, pkas: Sequence[float]) -> np.ndarray:
+    """
+    log₁₀ αⱼ de cada forma Hₙ₋ⱼA (j = 0 … n) para cada pH.
+
+    log₁₀([Hₙ₋ⱼA]/[HₙA]) = j·pH − Σᵢ≤ⱼ pKaᵢ, normalizado com log-sum-exp.
+    Retorna um array com a forma de ph mais um eixo final de n + 1 espécies.
+    """
+    pkas = _validate_pkas(pkas)
+    ph = np.asarray(ph, dtype=float)
+    steps = np.arange(pkas.size + 1)
+    log_ratio = steps * ph[..., None] - np.concatenate(([0.0], np.cumsum(pkas)))
+    log_ratio -= log_ratio.max(axis=-1, keepdims=True)
+    return log_ratio - np.log10(np.sum(10.0 ** log_ratio, axis=-1, keepdims=True))
+
+
+def alpha_fractions(ph: ArrayLike, pkas: Sequence[float]) -> np.ndarray:
+    """Frações α de cada espécie (soma 1 ao longo do último eixo)."""
+    return 10.0 ** log_alpha_fractions(ph, pkas)
+
+
+def mean_deprotonation(ph: ArrayLike, pkas: Sequence[float]) -> np.ndarray:
+    """Número médio de prótons perdidos por HₙA em cada pH (Σ j·αⱼ)."""
+    alpha = alpha_fractions(ph, pkas)
+    return alpha @ np.arange(alpha.shape[-1])
+
+
+def species_labels(n_protons: int, kind: str = "acid", name: str | None = None) -> List[str]:
+    """
+    Rótulos das espécies, da mais protonada à menos protonada:
+    ácido H₃A, H₂A⁻, HA²⁻, A³⁻; base H₂B²⁺, HB⁺, B.
+    """
+    if kind not in ("acid", "base"):
+        raise ValueError("Tipo deve ser 'acid' ou 'base'")
+    name = name or ("A" if kind == "acid" else "B")
+    top_charge = 0 if kind == "acid" else n_protons
+    labels = []
+    for j in range(n_protons + 1):
+        h = n_protons - j
+        prefix = "" if h == 0 else ("H" if h == 1 else "H" + str(h).translate(_SUBSCRIPTS))
+        charge = top_charge - j
+        suffix = ""
+        if charge:
+            magnitude = "" if abs(charge) == 1 else str(abs(charge))
+            suffix = (magnitude + ("+" if charge > 0 else "-")).translate(_SUPERSCRIPTS)
+        labels.append(prefix + name + suffix)
+    return labels
+
+
+def distribution_diagram(pk: Sequence[float], kind: str = "acid", ph_min: float = 0.0,
+                         ph_max: float = 14.0, points: int = 100000,
+                         name: str | None = None, temperature: float = 25.0) -> dict:
+    """
+    Diagrama de distribuição α × pH para um sistema poliprótico.
+
+    pk: pKa de cada etapa (kind="acid") ou pKb (kind="base", convertidos
+        para os pKa do ácido conjugado via Ka·Kb = Kw na temperatura dada, °C).
+
+    Retorna a grade de pH, α e log₁₀ α (pontos × espécies), rótulos, pKa
+    usados e, para cada espécie, α máximo, pH do máximo e faixa de pH em
+    que predomina.
+    """
+    if kind not in ("acid", "base"):
+        raise ValueError("Tipo deve ser 'acid' ou 'base'")
+    if points < 2:
+        raise ValueError("Use pelo menos 2 pontos")
+    if ph_max <= ph_min:
+        raise ValueError("pH máximo deve ser maior que o mínimo")
+    pk = _validate_pkas(pk)
+    pkas = list(pk) if kind == "acid" else conjugate_acid_pkas(pk, temperature)
+
+    ph = np.linspace(ph_min, ph_max, points)
+    log_alpha = log_alpha_fractions(ph, pkas)
+    alpha = 10.0 ** log_alpha
+    labels = species_labels(len(pkas), kind, name)
+
+    peak = np.argmax(alpha, axis=0)
+    dominant = np.argmax(alpha, axis=1)
+    species = []
+    for j, label in enumerate(labels):
+        mask = dominant == j
+        species.append({
+            "species": label,
+            "max_alpha": float(alpha[peak[j], j]),
+            "ph_at_max": float(ph[peak[j]]),
+            "dominant_from": float(ph[mask][0]) if mask.any() else float("nan"),
+            "dominant_to": float(ph[mask][-1]) if mask.any() else float("nan"),
+        })
+
+    return {
+        "ph": ph,
+        "alpha": alpha,
+        "log_alpha": log_alpha,
+        "labels": labels,
+        "pkas": [float(p) for p in pkas],
+        "species": species,
+        "kind": kind,
+    }
+
+
+def speciation_table(result: dict, ph_step: float | None = None, log: bool = False):
+    """
+    Tabela (pandas DataFrame) com pH e α de cada espécie para exportação.
+    ph_step reamostra a grade (ex.: 0.1) para tabelas de tamanho legível;
+    log=True exporta log₁₀ α.
+    """
+    import pandas as pd
+
+    ph = result["ph"]
+    values = result["log_alpha"] if log else result["alpha"]
+    if ph_step is not None:
+        if ph_step <= 0:
+            raise ValueError("Passo de pH deve ser positivo")
+        grid = np.arange(ph[0], ph[-1] + 0.5 * ph_step, ph_step)
+        values = np.column_stack([np.interp(grid, ph, values[:, j]) for j in range(values.shape[1])])
+        ph = grid
+    prefix = "log α " if log else "α "
+    data = {"pH": ph}
+    data.update({prefix + label: values[:, j] for j, label in enumerate(result["labels"])})
+    return pd.DataFrame(data)
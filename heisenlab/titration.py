@@ -0,0 +1,155 @@
+"""
+Simulação de curvas de titulação ácido-base (fortes/fracos, mono/polipróticos).
+O equilíbrio é resolvido de uma vez para toda a grade de volumes pelo
+solver geral de equilibrium.py.
+"""
+from __future__ import annotations
+
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from .calculations import kw_at_temperature
+from .equilibrium import acid_base_system, solve_equilibrium
+from .speciation import conjugate_acid_pkas
+
+
+class _Component:
+    """Espécie titulada/titulante descrita para o solver de equilíbrio."""
+
+    def __init__(self, kind: str, pk: Sequence[float], temperature: float = 25.0):
+        if kind not in ("acid", "base"):
+            raise ValueError("Tipo deve ser 'acid' ou 'base'")
+        self.kind = kind
+        self.strong = len(pk) == 0
+        self.protons = 1 if self.strong else len(pk)
+        self.pkas = [] if self.strong else (list(pk) if kind == "acid" else conjugate_acid_pkas(pk, temperature))
+
+    def proton_total(self, concentration: np.ndarray) -> np.ndarray:
+        """Contribuição ao balanço de prótons (referência: forma desprotonada e H2O)."""
+        if self.kind == "acid":
+            return self.protons * concentration
+        # Base fraca entra como B (0 prótons); base forte libera OH- (−1 próton)
+        return -concentration if self.strong else np.zeros_like(concentration)
+
+
+def simulate_titration(analyte_concentration: float, analyte_volume: float,
+                       titrant_concentration: float, analyte_pk: Sequence[float] = (),
+                       titrant_pk: Sequence[float] = (), analyte: str = "acid",
+                       max_volume: float | None = None, points: int = 20000,
+                       kw: float | None = None, temperature: float = 25.0,
+                       activity_model: str = "ideal", background_ionic_strength: float = 0.0) -> dict:
+    """
+    Curva pH × volume de titulante para pares ácido/base fortes ou fracos.
+
+    analyte: "acid" (titulado com base) ou "base" (titulado com ácido).
+    analyte_pk / titrant_pk: pKa (para ácidos) ou pKb (para bases) de cada
+        etapa; lista vazia = eletrólito forte monoprótico.
+    max_volume: volume final de titulante (padrão: 1,5 × último ponto de
+        equivalência). Volumes na mesma unidade de analyte_volume.
+    temperature: °C; define Kw (se kw não for informado) e a conversão pKb → pKa.
+    activity_model / background_ionic_strength: correção de atividade (pH =
+        −log a(H+)), com a força iônica recalculada em cada ponto da curva.
+
+    Retorna volumes, pH, 1ª e 2ª derivadas, pontos de equivalência
+    (estequiométricos e pelos máximos de dpH/dV) e regiões tampão. Pontos em
+    que o solver não convergiu ficam com pH NaN (máscara "converged").
+    """
+    if min(analyte_concentration, analyte_volume, titrant_concentration) <= 0:
+        raise ValueError("Concentrações e volume devem ser positivos")
+    if points < 10:
+        raise ValueError("Use pelo menos 10 pontos")
+    titrant = "base" if analyte == "acid" else "acid"
+    analyte_comp = _Component(analyte, analyte_pk, temperature)
+    titrant_comp = _Component(titrant, titrant_pk, temperature)
+    if kw is None:
+        kw = kw_at_temperature(temperature)
+
+    moles = analyte_concentration * analyte_volume
+    eq_volumes = np.arange(1, analyte_comp.protons + 1) * moles / titrant_concentration
+    if max_volume is None:
+        max_volume = 1.5 * eq_volumes[-1]
+
+    weak = {name: comp for name, comp in (("analito", analyte_comp), ("titulante", titrant_comp))
+            if not comp.strong}
+    system = acid_base_system({name: comp.pkas for name, comp in weak.items()}, kw,
+                              {name: 0 for name, comp in weak.items() if comp.kind == "base"})
+
+    def solve(volumes: np.ndarray) -> np.ndarray:
+        total = analyte_volume + volumes
+        c_analyte = moles / total
+        c_titrant = titrant_concentration * volumes / total
+        totals = {"H+": analyte_comp.proton_total(c_analyte) + titrant_comp.proton_total(c_titrant)}
+        if not analyte_comp.strong:
+            totals["analito"] = c_analyte
+        if not titrant_comp.strong:
+            totals["titulante"] = c_titrant
+        # Contraíons de eletrólitos fortes (Na⁺, Cl⁻) só contam na força iônica
+        spectators = sum(0.5 * c for comp, c in ((analyte_comp, c_analyte), (titrant_comp, c_titrant))
+                         if comp.strong)
+        result = solve_equilibrium(system, totals, activity_model=activity_model,
+                                   background_ionic_strength=spectators + background_ionic_strength,
+                                   temperature=temperature)
+        # pontos sem convergência não são pH válidos
+        return np.where(result["converged"], result["ph"], np.nan)
+
+    volume = np.linspace(0.0, max_volume, points)
+    ph = solve(volume)
+    # pH exato nos pontos notáveis (a interpolação falha no salto da curva)
+    eq_ph = solve(eq_volumes)
+
+    d1 = np.gradient(ph, volume)
+    d2 = np.gradient(d1, volume)
+
+    # Máximo de |dpH/dV| na vizinhança de cada equivalência estequiométrica
+    half_window = 0.25 * eq_volumes[0]
+    detected = []
+    for v_eq in eq_volumes:
+        window = (volume > v_eq - half_window) & (volume < min(v_eq + half_window, max_volume))
+        if window.any():
+            idx = np.flatnonzero(window)[np.argmax(np.nan_to_num(np.abs(d1[window]), nan=-1.0))]
+            detected.append(float(volume[idx]))
+        else:
+            detected.append(float("nan"))
+
+    equivalence_points: List[Dict[str, float]] = [
+        {
+            "volume": float(v_eq),
+            "ph": float(ph_eq),
+            "detected_volume": v_det,
+        }
+        for v_eq, ph_eq, v_det in zip(eq_volumes, eq_ph, detected)
+    ]
+
+    # Regiões tampão: |pH − pKa| ≤ 1 em torno de cada meia-equivalência
+    buffer_regions = []
+    if not analyte_comp.strong:
+        starts = np.concatenate(([0.0], eq_volumes[:-1]))
+        half_volumes = 0.5 * (starts + eq_volumes)
+        half_ph = solve(half_volumes)
+        # uma base recebe o primeiro próton no pKa mais alto: etapas em ordem inversa
+        pkas = analyte_comp.pkas if analyte == "acid" else analyte_comp.pkas[::-1]
+        for k, pka in enumerate(pkas):
+            v_half = half_volumes[k]
+            segment = (volume >= starts[k]) & (volume <= eq_volumes[k])
+            in_buffer = segment & (np.abs(ph - pka) <= 1.0)
+            if in_buffer.any():
+                buffer_regions.append({
+                    "pka": float(pka),
+                    "half_equivalence_volume": float(v_half),
+                    "ph_at_half_equivalence": float(half_ph[k]),
+                    "start_volume": float(volume[in_buffer][0]),
+                    "end_volume": float(volume[in_buffer][-1]),
+                })
+
+    return {
+        "volume": volume,
+        "ph": ph,
+        "dph_dv": d1,
+        "d2ph_dv2": d2,
+        "equivalence_points": equivalence_points,
+        "buffer_regions": buffer_regions,
+        "converged": np.isfinite(ph),
+        "analyte": analyte,
+        "analyte_pkas": analyte_comp.pkas,
+    }
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QWidget,
@@ -29,6 +31,8 @@ from ..calculations import (
     calculate_pkb_from_kb,
     calculate_kb_from_pkb,
     ka_kb_relationship,
+    ph_weak_acid,
+    ph_weak_base,
 )
 
 
@@ -49,13 +53,14 @@ class CalculationsTab(QWidget):
         tipo = self.ka_kb_type.currentText()
         try:
             num = float(valor)
-            kw = 1e-14
+            temperature = self._temperature(self.ka_kb_temperature_input)
             if tipo == "Ka":
-                kb = kw / num
-                resultado = f"Kb = Kw / Ka = {kw} / {num} = {kb:.3e}"
+                rel = ka_kb_relationship(ka=num, temperature=temperature)
+                resultado = f"Kb = Kw / Ka = {rel['kw']:.3e} / {num} = {rel['kb']:.3e}"
             else:
-                ka = kw / num
-                resultado = f"Ka = Kw / Kb = {kw} / {num} = {ka:.3e}"
+                rel = ka_kb_relationship(kb=num, temperature=temperature)
+                resultado = f"Ka = Kw / Kb = {rel['kw']:.3e} / {num} = {rel['ka']:.3e}"
+            resultado += f"\n(T = {temperature:g} °C, pKw = {-math.log10(rel['kw']):.3f})"
             self.ka_kb_relation_result.setText(resultado)
         except Exception as e:
             self.ka_kb_relation_result.setText(f"Erro: {e}")
@@ -79,6 +84,7 @@ class CalculationsTab(QWidget):
         layout.addWidget(self.create_dilution_section())
         layout.addWidget(self.create_ph_section())
         layout.addWidget(self.create_acid_base_section())
+        layout.addWidget(self.create_weak_electrolyte_section())
         layout.addWidget(self.create_spectrophotometry_section())
         layout.addStretch()
         
@@ -145,6 +151,12 @@ class CalculationsTab(QWidget):
         group = QGroupBox("Cálculos de pH/pOH")
         layout = QVBoxLayout(group)
         
+        form_t = QFormLayout()
+        self.ph_temperature_input = QLineEdit()
+        self.ph_temperature_input.setPlaceholderText("°C (padrão 25)")
+        form_t.addRow("Temperatura:", self.ph_temperature_input)
+        layout.addLayout(form_t)
+        
         # pH ácido forte
         form1 = QFormLayout()
         self.acid_conc_input = QLineEdit()
@@ -250,6 +262,10 @@ class CalculationsTab(QWidget):
         self.ka_kb_type.addItems(["Ka", "Kb"])
         form3.addRow("Tipo:", self.ka_kb_type)
         
+        self.ka_kb_temperature_input = QLineEdit()
+        self.ka_kb_temperature_input.setPlaceholderText("°C (padrão 25)")
+        form3.addRow("Temperatura:", self.ka_kb_temperature_input)
+        
         btn_ka_kb = QPushButton("Calcular relação Ka×Kb=Kw")
         form3.addRow(btn_ka_kb)
         btn_ka_kb.clicked.connect(self.calculate_ka_kb_relation)
@@ -268,6 +284,47 @@ class CalculationsTab(QWidget):
         
         return group
 
+    def create_weak_electrolyte_section(self):
+        """Seção de pH exato de ácidos e bases fracos (balanço de carga com Kw)."""
+        group = QGroupBox("pH de Ácido/Base Fraco (solução exata)")
+        layout = QVBoxLayout(group)
+        
+        form = QFormLayout()
+        self.weak_conc_input = QLineEdit()
+        self.weak_conc_input.setPlaceholderText("mol/L")
+        self.weak_conc_input.setStyleSheet("font-weight: bold;")
+        form.addRow("Concentração analítica:", self.weak_conc_input)
+        
+        self.weak_k_input = QLineEdit()
+        self.weak_k_input.setPlaceholderText("Ex: 1.8e-5 ou 4.74")
+        self.weak_k_input.setStyleSheet("font-weight: bold;")
+        form.addRow("Constante:", self.weak_k_input)
+        
+        self.weak_k_type = QComboBox()
+        self.weak_k_type.addItems(["Ka", "pKa", "Kb", "pKb"])
+        form.addRow("Tipo:", self.weak_k_type)
+        
+        self.weak_temperature_input = QLineEdit()
+        self.weak_temperature_input.setPlaceholderText("°C (padrão 25)")
+        form.addRow("Temperatura:", self.weak_temperature_input)
+        
+        btn_weak = QPushButton("Calcular pH")
+        form.addRow(btn_weak)
+        btn_weak.clicked.connect(self.calculate_weak_electrolyte_ph)
+        
+        self.weak_result = QLineEdit()
+        self.weak_result.setReadOnly(True)
+        self.weak_result.setStyleSheet("font-weight: bold;")
+        form.addRow("pH, pOH e α:", self.weak_result)
+        
+        layout.addLayout(form)
+        
+        note = QLabel("Resolve [H+] = [A-] + [OH-] sem aproximações (válido também para soluções muito diluídas)")
+        note.setStyleSheet("color: #666; font-style: italic; margin: 5px;")
+        layout.addWidget(note)
+        
+        return group
+
     def create_spectrophotometry_section(self):
         """Seção de espectrofotometria."""
         group = QGroupBox("Lei de Beer-Lambert")
@@ -332,7 +389,7 @@ class CalculationsTab(QWidget):
     def calculate_ph_acid(self):
         try:
             conc = float(self.acid_conc_input.text())
-            ph = ph_strong_acid(conc)
+            ph = ph_strong_acid(conc, self._temperature(self.ph_temperature_input))
             self.ph_acid_result.setText(f"{ph:.3f}")
         except Exception as e:
             self.ph_acid_result.setText(f"Erro: {str(e)}")
@@ -340,8 +397,9 @@ class CalculationsTab(QWidget):
     def calculate_ph_base(self):
         try:
             conc = float(self.base_conc_input.text())
-            poh = poh_strong_base(conc)
-            ph = ph_from_poh(poh)
+            temperature = self._temperature(self.ph_temperature_input)
+            poh = poh_strong_base(conc, temperature)
+            ph = ph_from_poh(poh, temperature)
             self.ph_base_result.setText(f"pOH = {poh:.3f}, pH = {ph:.3f}")
         except Exception as e:
             self.ph_base_result.setText(f"Erro: {str(e)}")
@@ -356,6 +414,34 @@ class CalculationsTab(QWidget):
         except Exception as e:
             self.ka_result.setText(f"Erro: {str(e)}")
 
+    def calculate_weak_electrolyte_ph(self):
+        try:
+            conc = float(self.weak_conc_input.text())
+            value = float(self.weak_k_input.text())
+            k_type = self.weak_k_type.currentText()
+            temperature = self._temperature(self.weak_temperature_input)
+            if k_type == "pKa":
+                result = ph_weak_acid(conc, calculate_ka_from_pka(value), temperature=temperature)
+            elif k_type == "Ka":
+                result = ph_weak_acid(conc, value, temperature=temperature)
+            elif k_type == "pKb":
+                result = ph_weak_base(conc, calculate_kb_from_pkb(value), temperature=temperature)
+            else:
+                result = ph_weak_base(conc, value, temperature=temperature)
+            if result["error"]:
+                raise ValueError("Concentração deve ser ≥ 0 e constante > 0")
+            self.weak_result.setText(
+                f"pH = {float(result['ph']):.3f}, pOH = {float(result['poh']):.3f}, "
+                f"α = {float(result['degree_of_dissociation']) * 100:.3g}%"
+            )
+        except Exception as e:
+            self.weak_result.setText(f"Erro: {str(e)}")
+
+    def _temperature(self, widget: QLineEdit) -> float:
+        """Temperatura em °C de um campo opcional (vazio = 25 °C)."""
+        text = widget.text().strip().replace(",", ".")
+        return float(text) if text else 25.0
+
     def calculate_kb(self):
         try:
             poh = float(self.kb_poh_input.text())
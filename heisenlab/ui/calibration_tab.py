@@ -28,7 +28,8 @@ from PySide6.QtWidgets import (
     QListWidget,
 )
 
-from ..plotting import MplCanvas, FullScreenPlotDialog
+from ..electrochemistry import POURBAIX_SYSTEMS, nernst_potential, pourbaix_diagram
+from ..plotting import MplCanvas, FullScreenPlotDialog, plot_pourbaix_diagram
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT
 import matplotlib.pyplot as plt
 
@@ -108,6 +109,10 @@ class VoltammogramTab(QWidget):
             self.stats_tab = self._create_statistical_analysis_tab()
             self.tabs.addTab(self.stats_tab, "Análise Estatística")
 
+        # Aba 5: Nernst e Pourbaix (somente numpy)
+        self.pourbaix_tab = self._create_pourbaix_tab()
+        self.tabs.addTab(self.pourbaix_tab, "Nernst / Pourbaix")
+
         # Layout principal
         layout.addWidget(file_group)
         layout.addWidget(self.tabs)
@@ -319,6 +324,94 @@ class VoltammogramTab(QWidget):
 
         return tab
 
+    def _create_pourbaix_tab(self):
+        """Cria aba de potencial de Nernst e diagrama de Pourbaix"""
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+
+        # Equação de Nernst
+        nernst_group = QGroupBox("Equação de Nernst (Ox + m H⁺ + n e⁻ → Red)")
+        nernst_layout = QGridLayout(nernst_group)
+
+        nernst_layout.addWidget(QLabel("E° (V):"), 0, 0)
+        self.nernst_e0_spin = QDoubleSpinBox()
+        self.nernst_e0_spin.setRange(-5.0, 5.0)
+        self.nernst_e0_spin.setDecimals(4)
+        self.nernst_e0_spin.setValue(0.771)
+        nernst_layout.addWidget(self.nernst_e0_spin, 0, 1)
+
+        nernst_layout.addWidget(QLabel("Elétrons (n):"), 0, 2)
+        self.nernst_n_spin = QSpinBox()
+        self.nernst_n_spin.setRange(1, 10)
+        nernst_layout.addWidget(self.nernst_n_spin, 0, 3)
+
+        nernst_layout.addWidget(QLabel("[Ox] (mol/L):"), 1, 0)
+        self.nernst_ox_spin = QDoubleSpinBox()
+        # decimais antes do intervalo: com menos casas o mínimo 1e-10 seria arredondado para 0
+        self.nernst_ox_spin.setDecimals(10)
+        self.nernst_ox_spin.setRange(1e-10, 100.0)
+        self.nernst_ox_spin.setValue(1.0)
+        nernst_layout.addWidget(self.nernst_ox_spin, 1, 1)
+
+        nernst_layout.addWidget(QLabel("[Red] (mol/L):"), 1, 2)
+        self.nernst_red_spin = QDoubleSpinBox()
+        self.nernst_red_spin.setDecimals(10)
+        self.nernst_red_spin.setRange(1e-10, 100.0)
+        self.nernst_red_spin.setValue(1.0)
+        nernst_layout.addWidget(self.nernst_red_spin, 1, 3)
+
+        nernst_layout.addWidget(QLabel("H⁺ (m):"), 2, 0)
+        self.nernst_protons_spin = QSpinBox()
+        self.nernst_protons_spin.setRange(0, 20)
+        nernst_layout.addWidget(self.nernst_protons_spin, 2, 1)
+
+        nernst_layout.addWidget(QLabel("pH:"), 2, 2)
+        self.nernst_ph_spin = QDoubleSpinBox()
+        self.nernst_ph_spin.setRange(-2.0, 16.0)
+        self.nernst_ph_spin.setValue(7.0)
+        nernst_layout.addWidget(self.nernst_ph_spin, 2, 3)
+
+        self.nernst_btn = QPushButton("Calcular Potencial")
+        self.nernst_btn.clicked.connect(self._calculate_nernst)
+        nernst_layout.addWidget(self.nernst_btn, 3, 0, 1, 4)
+
+        # Diagrama de Pourbaix
+        pourbaix_group = QGroupBox("Diagrama de Pourbaix (E × pH)")
+        pourbaix_layout = QGridLayout(pourbaix_group)
+
+        pourbaix_layout.addWidget(QLabel("Elemento:"), 0, 0)
+        self.pourbaix_element_combo = QComboBox()
+        self.pourbaix_element_combo.addItems(sorted(POURBAIX_SYSTEMS))
+        pourbaix_layout.addWidget(self.pourbaix_element_combo, 0, 1)
+
+        pourbaix_layout.addWidget(QLabel("log [M] dissolvido:"), 0, 2)
+        self.pourbaix_log_c_spin = QDoubleSpinBox()
+        self.pourbaix_log_c_spin.setRange(-12.0, 1.0)
+        self.pourbaix_log_c_spin.setValue(-6.0)
+        pourbaix_layout.addWidget(self.pourbaix_log_c_spin, 0, 3)
+
+        pourbaix_layout.addWidget(QLabel("Temperatura (°C):"), 1, 0)
+        self.pourbaix_temperature_spin = QDoubleSpinBox()
+        self.pourbaix_temperature_spin.setRange(0.0, 100.0)
+        self.pourbaix_temperature_spin.setValue(25.0)
+        pourbaix_layout.addWidget(self.pourbaix_temperature_spin, 1, 1)
+
+        pourbaix_layout.addWidget(QLabel("Resolução:"), 1, 2)
+        self.pourbaix_resolution_spin = QSpinBox()
+        self.pourbaix_resolution_spin.setRange(50, 2000)
+        self.pourbaix_resolution_spin.setValue(1000)
+        pourbaix_layout.addWidget(self.pourbaix_resolution_spin, 1, 3)
+
+        self.pourbaix_btn = QPushButton("Gerar Diagrama")
+        self.pourbaix_btn.clicked.connect(self._plot_pourbaix)
+        pourbaix_layout.addWidget(self.pourbaix_btn, 2, 0, 1, 4)
+
+        layout.addWidget(nernst_group)
+        layout.addWidget(pourbaix_group)
+        layout.addStretch()
+
+        return tab
+
     # === MÉTODOS DA ABA ANÁLISE BÁSICA ===
 
     def _load_file(self):
@@ -604,6 +697,35 @@ class VoltammogramTab(QWidget):
         """Análise cinética Randles-Sevcik"""
         QMessageBox.information(self, "Info", "Análise cinética em desenvolvimento")
 
+    def _calculate_nernst(self):
+        """Potencial de Nernst da semirreação informada"""
+        try:
+            potential = nernst_potential(
+                self.nernst_e0_spin.value(), self.nernst_n_spin.value(),
+                self.nernst_ox_spin.value(), self.nernst_red_spin.value(),
+                self.nernst_protons_spin.value(), self.nernst_ph_spin.value(),
+            )
+        except ValueError as e:
+            QMessageBox.warning(self, "Erro", str(e))
+            return
+        self.info_label.setText(f"✅ E = {potential:.4f} V vs. EPH (25 °C)")
+
+    def _plot_pourbaix(self):
+        """Gera e desenha o diagrama de Pourbaix do elemento selecionado"""
+        try:
+            result = pourbaix_diagram(
+                self.pourbaix_element_combo.currentText(),
+                concentration=10.0 ** self.pourbaix_log_c_spin.value(),
+                resolution=self.pourbaix_resolution_spin.value(),
+                temperature=self.pourbaix_temperature_spin.value(),
+            )
+        except ValueError as e:
+            QMessageBox.warning(self, "Erro", str(e))
+            return
+        plot_pourbaix_diagram(self.canvas, result)
+        stable = ", ".join(domain["species"] for domain in result["domains"])
+        self.info_label.setText(f"✅ Domínios estáveis: {stable}")
+
     def _apply_filter(self):
         """Aplica filtro nos dados"""
         if not HAS_SCIPY:
@@ -0,0 +1,381 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QBrush, QColor
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QFormLayout,
+    QGroupBox,
+    QPushButton,
+    QComboBox,
+    QDoubleSpinBox,
+    QSpinBox,
+    QTableWidget,
+    QTableWidgetItem,
+    QTextEdit,
+    QFileDialog,
+    QMessageBox,
+    QSplitter,
+)
+from matplotlib.backends.backend_qtagg import NavigationToolbar2QT
+
+from ..calculations import OnlineLinearFit
+from ..plotting import MplCanvas, plot_calibration_curve
+from ..regression import regression_diagnostics
+
+# Rótulos da interface para as ponderações de OnlineLinearFit
+WEIGHTING_LABELS = {
+    "Nenhuma": "none",
+    "1/x": "1/x",
+    "1/x²": "1/x2",
+    "1/σ²": "1/sigma2",
+}
+
+USE_COLUMN, X_COLUMN, Y_COLUMN, SIGMA_COLUMN = range(4)
+
+
+class CalibrationWorkbenchTab(QWidget):
+    """
+    Bancada de calibração linear: padrões editáveis, exclusão interativa de
+    pontos (atualização O(1) via OnlineLinearFit), incertezas, LOD/LOQ,
+    bandas, diagnósticos com destaque dos pontos suspeitos e predição inversa
+    de amostras desconhecidas.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.accumulator: Optional[OnlineLinearFit] = None
+        self.points: Dict[int, Tuple[float, float, Optional[float]]] = {}
+        self.unknowns: Optional[dict] = None
+        self.canvas = MplCanvas()
+        self.toolbar = NavigationToolbar2QT(self.canvas, self)
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Configura a interface: controles à esquerda, gráfico à direita."""
+        controls = QWidget()
+        controls_layout = QVBoxLayout(controls)
+
+        # Padrões
+        standards_group = QGroupBox("Padrões de Calibração")
+        standards_layout = QVBoxLayout(standards_group)
+
+        self.table = QTableWidget(6, 4)
+        self.table.setHorizontalHeaderLabels(["Usar", "Concentração", "Sinal", "σ (opcional)"])
+        for row in range(self.table.rowCount()):
+            self._init_row(row)
+        self.table.itemChanged.connect(self._on_item_changed)
+        standards_layout.addWidget(self.table)
+
+        rows_layout = QHBoxLayout()
+        add_btn = QPushButton("Adicionar linha")
+        add_btn.clicked.connect(self._add_row)
+        remove_btn = QPushButton("Remover linha")
+        remove_btn.clicked.connect(self._remove_row)
+        import_btn = QPushButton("Importar arquivo")
+        import_btn.clicked.connect(self._import_file)
+        rows_layout.addWidget(add_btn)
+        rows_layout.addWidget(remove_btn)
+        rows_layout.addWidget(import_btn)
+        standards_layout.addLayout(rows_layout)
+
+        # Opções do ajuste
+        fit_group = QGroupBox("Ajuste")
+        fit_layout = QFormLayout(fit_group)
+
+        self.weighting_combo = QComboBox()
+        self.weighting_combo.addItems(list(WEIGHTING_LABELS))
+        fit_layout.addRow("Ponderação:", self.weighting_combo)
+
+        self.confidence_spin = QDoubleSpinBox()
+        self.confidence_spin.setRange(0.50, 0.999)
+        self.confidence_spin.setDecimals(3)
+        self.confidence_spin.setSingleStep(0.01)
+        self.confidence_spin.setValue(0.95)
+        fit_layout.addRow("Nível de confiança:", self.confidence_spin)
+
+        fit_btn = QPushButton("Ajustar Curva")
+        fit_btn.clicked.connect(self._fit)
+        fit_layout.addRow(fit_btn)
+
+        # Amostras desconhecidas
+        unknown_group = QGroupBox("Amostras Desconhecidas")
+        unknown_layout = QFormLayout(unknown_group)
+
+        self.unknown_input = QTextEdit()
+        self.unknown_input.setPlaceholderText("Sinais separados por vírgula ou quebra de linha")
+        self.unknown_input.setMaximumHeight(80)
+        unknown_layout.addRow("Sinais:", self.unknown_input)
+
+        self.replicates_spin = QSpinBox()
+        self.replicates_spin.setRange(1, 100)
+        unknown_layout.addRow("Replicatas por sinal:", self.replicates_spin)
+
+        predict_btn = QPushButton("Calcular Concentrações")
+        predict_btn.clicked.connect(self._predict)
+        unknown_layout.addRow(predict_btn)
+
+        # Resultados
+        self.result_text = QTextEdit()
+        self.result_text.setReadOnly(True)
+        self.result_text.setStyleSheet("font-family: monospace; font-size: 11px;")
+        self.result_text.setPlaceholderText("Os resultados do ajuste aparecerão aqui...")
+
+        controls_layout.addWidget(standards_group)
+        controls_layout.addWidget(fit_group)
+        controls_layout.addWidget(unknown_group)
+        controls_layout.addWidget(self.result_text)
+
+        plot_widget = QWidget()
+        plot_layout = QVBoxLayout(plot_widget)
+        plot_layout.addWidget(self.toolbar)
+        plot_layout.addWidget(self.canvas)
+
+        splitter = QSplitter(Qt.Horizontal)
+        splitter.addWidget(controls)
+        splitter.addWidget(plot_widget)
+        splitter.setStretchFactor(1, 2)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(splitter)
+
+    # === Tabela de padrões ===
+
+    def _init_row(self, row: int):
+        use_item = QTableWidgetItem()
+        use_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
+        use_item.setCheckState(Qt.Checked)
+        self.table.setItem(row, USE_COLUMN, use_item)
+        for column in (X_COLUMN, Y_COLUMN, SIGMA_COLUMN):
+            self.table.setItem(row, column, QTableWidgetItem(""))
+
+    def _add_row(self):
+        self.table.blockSignals(True)
+        self.table.insertRow(self.table.rowCount())
+        self._init_row(self.table.rowCount() - 1)
+        self.table.blockSignals(False)
+
+    def _remove_row(self):
+        row = self.table.currentRow()
+        if row < 0:
+            row = self.table.rowCount() - 1
+        if row >= 0:
+            self.table.removeRow(row)
+            if self.accumulator is not None:
+                self._fit()
+
+    def _import_file(self):
+        """Importa padrões (colunas: concentração, sinal[, σ]) de CSV ou Excel."""
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "Importar padrões", "", "Planilhas (*.csv *.xlsx *.xls);;All files (*.*)"
+        )
+        if not filename:
+            return
+        try:
+            df = pd.read_csv(filename) if filename.lower().endswith(".csv") else pd.read_excel(filename)
+        except Exception as e:
+            QMessageBox.warning(self, "Erro", f"Não foi possível ler o arquivo:\n{e}")
+            return
+        try:
+            if df.shape[1] < 2:
+                raise ValueError("são necessárias ao menos 2 colunas (concentração, sinal[, σ])")
+            columns = [pd.to_numeric(df.iloc[:, k]).to_numpy(dtype=float) for k in range(min(df.shape[1], 3))]
+        except ValueError as e:
+            QMessageBox.warning(self, "Erro", f"Colunas inválidas no arquivo:\n{e}")
+            return
+        self.set_standards(*columns)
+        self._fit()
+
+    def set_standards(self, x, y, sigma=None):
+        """Preenche a tabela com os padrões informados (NaN deixa a célula vazia)."""
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        sigma = np.broadcast_to(np.nan if sigma is None else np.asarray(sigma, dtype=float), x.shape)
+        self.table.blockSignals(True)
+        self.table.setRowCount(0)
+        for i, values in enumerate(zip(x, y, sigma)):
+            self.table.insertRow(i)
+            self._init_row(i)
+            for column, value in zip((X_COLUMN, Y_COLUMN, SIGMA_COLUMN), values):
+                if not math.isnan(value):
+                    self.table.item(i, column).setText(f"{value:g}")
+        self.table.blockSignals(False)
+
+    @staticmethod
+    def _cell_value(item: Optional[QTableWidgetItem]) -> Optional[float]:
+        text = item.text().strip().replace(",", ".") if item is not None else ""
+        return float(text) if text else None
+
+    def _read_point(self, row: int) -> Optional[Tuple[float, float, Optional[float]]]:
+        x = self._cell_value(self.table.item(row, X_COLUMN))
+        y = self._cell_value(self.table.item(row, Y_COLUMN))
+        if x is None or y is None:
+            return None
+        return x, y, self._cell_value(self.table.item(row, SIGMA_COLUMN))
+
+    def _is_used(self, row: int) -> bool:
+        item = self.table.item(row, USE_COLUMN)
+        return item is not None and item.checkState() == Qt.Checked
+
+    # === Ajuste ===
+
+    def _fit(self):
+        """Reconstrói o acumulador a partir da tabela e atualiza resultados."""
+        try:
+            self.accumulator = OnlineLinearFit(WEIGHTING_LABELS[self.weighting_combo.currentText()])
+            self.points = {}
+            for row in range(self.table.rowCount()):
+                point = self._read_point(row)
+                if point is None:
+                    continue
+                self.points[row] = point
+                if self._is_used(row):
+                    self.accumulator.add(*point)
+        except ValueError as e:
+            self.accumulator = None
+            QMessageBox.warning(self, "Erro", str(e))
+            return
+        self.unknowns = None
+        self._refresh()
+
+    def _on_item_changed(self, item: QTableWidgetItem):
+        """Marcar/desmarcar um padrão só adiciona/remove o ponto do acumulador."""
+        if self.accumulator is None:
+            return
+        row = item.row()
+        if item.column() != USE_COLUMN:
+            self._fit()
+            return
+        if row not in self.points:
+            return
+        try:
+            if self._is_used(row):
+                self.accumulator.add(*self.points[row])
+            else:
+                self.accumulator.remove(*self.points[row])
+        except ValueError as e:
+            QMessageBox.warning(self, "Erro", str(e))
+            return
+        if self.unknowns is not None:
+            self._predict()
+        else:
+            self._refresh()
+
+    def _refresh(self):
+        if self.accumulator is None or not self.points:
+            return
+        rows = sorted(self.points)
+        x = np.array([self.points[r][0] for r in rows])
+        y = np.array([self.points[r][1] for r in rows])
+        used = np.array([self._is_used(r) for r in rows])
+        try:
+            fit = self.accumulator.result()
+        except ValueError as e:
+            self.result_text.setText(f"Erro: {e}")
+            return
+        level = self.confidence_spin.value()
+        flagged = np.zeros(x.size, dtype=bool)
+        self.result_text.setText(self._format_fit(fit))
+        if used.sum() >= 3:
+            weights = np.array([self.accumulator.weight(self.points[r][0], self.points[r][2])
+                                for r, u in zip(rows, used) if u])
+            diagnostics = regression_diagnostics(x[used], y[used], weights, 1 - level)
+            flagged[used] = diagnostics["flagged"]
+            self.result_text.append(self._format_diagnostics(diagnostics, x[used]))
+        if self.unknowns is not None:
+            self.result_text.append(self._format_unknowns(self.unknowns))
+        self._highlight_rows([r for r, f in zip(rows, flagged) if f])
+        plot_calibration_curve(self.canvas, fit, x, y, used, self.unknowns, level, flagged)
+
+    def _highlight_rows(self, flagged_rows):
+        """Fundo laranja nas linhas sinalizadas pelos diagnósticos."""
+        self.table.blockSignals(True)
+        for row in range(self.table.rowCount()):
+            brush = QBrush(QColor(255, 215, 170)) if row in flagged_rows else QBrush()
+            for column in range(self.table.columnCount()):
+                item = self.table.item(row, column)
+                if item is not None:
+                    item.setBackground(brush)
+        self.table.blockSignals(False)
+
+    def _format_fit(self, fit) -> str:
+        text = "CURVA DE CALIBRAÇÃO\n"
+        text += f"{'=' * 50}\n"
+        text += f"Ponderação: {self.weighting_combo.currentText()}\n"
+        text += f"n (pontos usados): {fit.n}\n"
+        text += f"Inclinação (b): {fit.slope:.6g}"
+        text += f" ± {fit.slope_std_error:.3g}\n" if math.isfinite(fit.slope_std_error) else "\n"
+        text += f"Intercepto (a): {fit.intercept:.6g}"
+        text += f" ± {fit.intercept_std_error:.3g}\n" if math.isfinite(fit.intercept_std_error) else "\n"
+        text += f"r: {fit.r_value:.6f}    R²: {fit.r_squared:.6f}\n"
+        if math.isfinite(fit.residual_std_error):
+            text += f"Erro-padrão residual (s_y/x): {fit.residual_std_error:.4g}\n"
+            if fit.weighting != "none":
+                text += f"s no padrão mais baixo (s₀): {fit.low_end_std_error:.4g}\n"
+            text += f"LOD (3,3·s₀/b): {fit.lod:.4g}\n"
+            text += f"LOQ (10·s₀/b): {fit.loq:.4g}\n"
+        return text
+
+    @staticmethod
+    def _format_diagnostics(diagnostics: dict, x) -> str:
+        text = f"\nDIAGNÓSTICOS (α = {diagnostics['alpha']:.3g})\n"
+        text += f"{'=' * 50}\n"
+        text += (f"Durbin-Watson: {diagnostics['durbin_watson']:.3f}"
+                 f" (p ≈ {diagnostics['durbin_watson_p_value']:.3g})\n")
+        if math.isfinite(diagnostics["lack_of_fit_f"]):
+            text += (f"Falta de ajuste: F = {diagnostics['lack_of_fit_f']:.3g},"
+                     f" p = {diagnostics['lack_of_fit_p_value']:.3g}"
+                     f"{' — linearidade rejeitada' if diagnostics['lack_of_fit'] else ''}\n")
+        else:
+            text += "Falta de ajuste: requer replicatas e ao menos 3 níveis\n"
+        flagged = np.flatnonzero(diagnostics["flagged"])
+        if flagged.size == 0:
+            text += "Nenhum ponto sinalizado\n"
+            return text
+        text += f"{'Conc.':>12} {'h':>8} {'t_i':>8} {'Cook D':>8}\n"
+        for i in flagged:
+            text += (f"{x[i]:12.5g} {diagnostics['leverage'][i]:8.3f}"
+                     f" {diagnostics['studentized_residuals'][i]:8.3f} {diagnostics['cooks_distance'][i]:8.3f}\n")
+        return text
+
+    def _format_unknowns(self, result: dict) -> str:
+        level = result["confidence_level"]
+        text = f"\nAMOSTRAS (IC {level:.1%}, t = {result['t_critical']:.4g})\n"
+        text += f"{'=' * 50}\n"
+        text += f"{'Sinal':>12} {'Conc.':>12} {'s(x₀)':>10} {'Inferior':>12} {'Superior':>12}\n"
+        rows = zip(*(np.atleast_1d(result[k]) for k in ("signal", "concentration", "std_error", "lower", "upper")))
+        for signal, conc, se, low, high in rows:
+            text += f"{signal:12.5g} {conc:12.5g} {se:10.3g} {low:12.5g} {high:12.5g}\n"
+        return text
+
+    def _predict(self):
+        """Predição inversa de todos os sinais informados (uma operação vetorizada)."""
+        if self.accumulator is None:
+            self._fit()
+            if self.accumulator is None:
+                return
+        raw = self.unknown_input.toPlainText().replace("\n", ",").replace(";", ",").split(",")
+        try:
+            signals = np.array([float(v) for v in raw if v.strip()])
+        except ValueError:
+            QMessageBox.warning(self, "Erro", "Sinais inválidos")
+            return
+        if signals.size == 0:
+            QMessageBox.warning(self, "Erro", "Informe ao menos um sinal")
+            return
+        try:
+            result = self.accumulator.result().inverse_predict(
+                signals, self.replicates_spin.value(), self.confidence_spin.value())
+        except ValueError as e:
+            QMessageBox.warning(self, "Erro", str(e))
+            return
+        result["signal"] = signals
+        self.unknowns = result
+        self._refresh()
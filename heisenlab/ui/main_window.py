@@ -5,6 +5,7 @@ from PySide6.QtWidgets import QApplication, QMainWindow, QTabWidget
 
 from .calculations_tab import CalculationsTab
 from .calibration_tab import VoltammogramTab
+from .calibration_workbench_tab import CalibrationWorkbenchTab
 from .properties_tab import PropertiesTab
 from .statistics_tab import StatisticsTab
 from .chemical_draw_tab import ChemicalDrawTab
@@ -19,6 +20,7 @@ class MainWindow(QMainWindow):
         tabs = QTabWidget()
         tabs.addTab(CalculationsTab(), "Cálculos")
         tabs.addTab(VoltammogramTab(), "Voltamograma")
+        tabs.addTab(CalibrationWorkbenchTab(), "Curva de Calibração")
         tabs.addTab(PropertiesTab(), "Propriedades e Conversões")
         tabs.addTab(StatisticsTab(), "Estatística")
         tabs.addTab(ChemicalDrawTab(), "Desenho Químico")
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import re
+
+import numpy as np
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QGroupBox,
     QLineEdit, QLabel, QPushButton, QComboBox, QTextEdit, QFormLayout,
@@ -8,9 +11,9 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 
 from ..calculations import (
-    calculate_molar_mass, parse_chemical_formula, PERIODIC_TABLE,
+    calculate_molar_mass, parse_chemical_formula, batch_molar_mass, PERIODIC_TABLE,
     convert_mass, convert_volume, convert_concentration, convert_pressure,
-    celsius_to_kelvin, kelvin_to_celsius, celsius_to_fahrenheit, fahrenheit_to_celsius,
+    convert_temperature,
     calculate_density, calculate_molarity, calculate_moles, 
     calculate_mass_concentration, calculate_ppm, calculate_ppb,
     MASS_CONVERSIONS, VOLUME_CONVERSIONS, CONCENTRATION_CONVERSIONS, PRESSURE_CONVERSIONS
@@ -67,7 +70,7 @@ class PropertiesTab(QWidget):
         
         # Formula input
         self.formula_input = QLineEdit()
-        self.formula_input.setPlaceholderText("Ex: H2SO4, Ca(OH)2, K3[Fe(CN)6]")
+        self.formula_input.setPlaceholderText("Ex: H2SO4 — ou cole uma lista (uma por linha ou separadas por ;)")
         self.formula_input.setMinimumHeight(30)
         layout.addRow("Fórmula:", self.formula_input)
         
@@ -259,7 +262,7 @@ class PropertiesTab(QWidget):
         
         mass_layout.addWidget(QLabel("Valor:"), 0, 0)
         self.mass_value = QLineEdit()
-        self.mass_value.setPlaceholderText("Ex: 1000")
+        self.mass_value.setPlaceholderText("Ex: 1000 — ou cole uma coluna de valores")
         self.mass_value.setMinimumHeight(28)
         mass_layout.addWidget(self.mass_value, 0, 1)
         
@@ -301,7 +304,7 @@ class PropertiesTab(QWidget):
         
         volume_layout.addWidget(QLabel("Valor:"), 0, 0)
         self.volume_value = QLineEdit()
-        self.volume_value.setPlaceholderText("Ex: 1000")
+        self.volume_value.setPlaceholderText("Ex: 1000 — ou cole uma coluna de valores")
         self.volume_value.setMinimumHeight(28)
         volume_layout.addWidget(self.volume_value, 0, 1)
         
@@ -343,7 +346,7 @@ class PropertiesTab(QWidget):
         
         temp_layout.addWidget(QLabel("Valor:"), 0, 0)
         self.temp_value = QLineEdit()
-        self.temp_value.setPlaceholderText("Ex: 25")
+        self.temp_value.setPlaceholderText("Ex: 25 — ou cole uma coluna de valores")
         self.temp_value.setMinimumHeight(28)
         temp_layout.addWidget(self.temp_value, 0, 1)
         
@@ -377,6 +380,28 @@ class PropertiesTab(QWidget):
         temp_group.setLayout(temp_layout)
         main_layout.addWidget(temp_group)
         
+        # === CONVERSÃO EM LOTE ===
+        batch_group = QGroupBox("Conversão em Lote (coluna colada)")
+        batch_layout = QVBoxLayout()
+        
+        self.conversion_batch_result = QTextEdit()
+        self.conversion_batch_result.setReadOnly(True)
+        self.conversion_batch_result.setMinimumHeight(120)
+        self.conversion_batch_result.setStyleSheet("font-family: monospace; font-size: 11px;")
+        self.conversion_batch_result.setPlaceholderText(
+            "Cole vários valores (um por linha ou separados por ;) em qualquer campo acima"
+        )
+        batch_layout.addWidget(self.conversion_batch_result)
+        
+        btn_batch_fullscreen = QPushButton("Ver Conversão em Lote em Tela Cheia")
+        btn_batch_fullscreen.clicked.connect(
+            lambda: self.show_fullscreen_result(self.conversion_batch_result, "Conversão em Lote")
+        )
+        batch_layout.addWidget(btn_batch_fullscreen)
+        
+        batch_group.setLayout(batch_layout)
+        main_layout.addWidget(batch_group)
+        
         group.setLayout(main_layout)
         group.setMinimumHeight(350)
         return group
@@ -390,6 +415,11 @@ class PropertiesTab(QWidget):
                 self.composition_result.setText("")
                 return
             
+            formulas = [f.strip() for f in re.split(r'[;,\t\r\n]+', formula) if f.strip()]
+            if len(formulas) > 1:
+                self.show_batch_molar_mass(formulas)
+                return
+            
             molar_mass = calculate_molar_mass(formula)
             self.molar_mass_result.setText(f"{molar_mass:.3f}")
             
@@ -421,6 +451,29 @@ class PropertiesTab(QWidget):
             self.molar_mass_result.setText("Erro")
             self.composition_result.setText(f"Erro: {str(e)}")
     
+    def show_batch_molar_mass(self, formulas: list[str]):
+        """Mostra massa molar e composição percentual de uma lista colada."""
+        result = batch_molar_mass(formulas)
+        molar_mass = result["molar_mass"]
+        percent = result["percent_composition"]
+        elements = result["elements"]
+        errors = result["errors"]
+        
+        valid = len(formulas) - len(errors)
+        self.molar_mass_result.setText(f"{valid} de {len(formulas)} fórmulas calculadas")
+        
+        width = max(len(f) for f in formulas) + 2
+        lines = [f"{'Fórmula':<{width}}{'M (g/mol)':>12}   Composição Percentual", ""]
+        for i, formula in enumerate(formulas):
+            if i in errors:
+                lines.append(f"{formula:<{width}}{'Erro':>12}   {errors[i]}")
+                continue
+            row = percent.getrow(i)
+            comp = ", ".join(f"{elements[j]} {p:.2f}%" for j, p in zip(row.indices, row.data))
+            lines.append(f"{formula:<{width}}{molar_mass[i]:>12.3f}   {comp}")
+        
+        self.composition_result.setText("\n".join(lines))
+    
     def calculate_density(self):
         """Calculate density."""
         try:
@@ -467,14 +520,34 @@ class PropertiesTab(QWidget):
         except Exception:
             self.moles_result.setText("Erro: Valores inválidos")
     
+    def parse_values(self, text: str) -> list[float]:
+        """Lê um ou vários valores (linhas, ';' ou tabulação; vírgula decimal aceita)."""
+        parts = [p.strip() for p in re.split(r'[;\t\r\n]+', text) if p.strip()]
+        if len(parts) == 1:
+            parts = parts[0].split()
+        return [float(p.replace(',', '.')) for p in parts]
+    
+    def show_batch_conversion(self, values: list[float], results, from_unit: str, to_unit: str,
+                              result_widget: QLineEdit):
+        """Mostra uma coluna convertida de uma vez na área de conversão em lote."""
+        result_widget.setText(f"{len(values)} valores convertidos (ver lote abaixo)")
+        lines = [f"{from_unit:>18}   {to_unit:>18}", ""]
+        lines += [f"{v:>18.9g}   {r:>18.9g}" for v, r in zip(values, results)]
+        self.conversion_batch_result.setText("\n".join(lines))
+    
     def convert_mass(self):
         """Convert mass units."""
         try:
-            value = float(self.mass_value.text())
+            values = self.parse_values(self.mass_value.text())
             from_unit = self.mass_from.currentText()
             to_unit = self.mass_to.currentText()
             
-            result = convert_mass(value, from_unit, to_unit)
+            if len(values) > 1:
+                results = convert_mass(np.asarray(values), from_unit, to_unit)
+                self.show_batch_conversion(values, results, from_unit, to_unit, self.mass_result)
+                return
+            
+            result = convert_mass(values[0], from_unit, to_unit)
             self.mass_result.setText(f"{result:.9f}")
             
         except ValueError as e:
@@ -485,11 +558,16 @@ class PropertiesTab(QWidget):
     def convert_volume(self):
         """Convert volume units."""
         try:
-            value = float(self.volume_value.text())
+            values = self.parse_values(self.volume_value.text())
             from_unit = self.volume_from.currentText()
             to_unit = self.volume_to.currentText()
             
-            result = convert_volume(value, from_unit, to_unit)
+            if len(values) > 1:
+                results = convert_volume(np.asarray(values), from_unit, to_unit)
+                self.show_batch_conversion(values, results, from_unit, to_unit, self.volume_result)
+                return
+            
+            result = convert_volume(values[0], from_unit, to_unit)
             self.volume_result.setText(f"{result:.9f}")
             
         except ValueError as e:
@@ -500,30 +578,16 @@ class PropertiesTab(QWidget):
     def convert_temperature(self):
         """Convert temperature units."""
         try:
-            value = float(self.temp_value.text())
+            values = self.parse_values(self.temp_value.text())
             from_unit = self.temp_from.currentText()
             to_unit = self.temp_to.currentText()
             
-            if from_unit == to_unit:
-                result = value
-            elif from_unit == "°C":
-                if to_unit == "K":
-                    result = celsius_to_kelvin(value)
-                elif to_unit == "°F":
-                    result = celsius_to_fahrenheit(value)
-            elif from_unit == "K":
-                if to_unit == "°C":
-                    result = kelvin_to_celsius(value)
-                elif to_unit == "°F":
-                    celsius = kelvin_to_celsius(value)
-                    result = celsius_to_fahrenheit(celsius)
-            elif from_unit == "°F":
-                if to_unit == "°C":
-                    result = fahrenheit_to_celsius(value)
-                elif to_unit == "K":
-                    celsius = fahrenheit_to_celsius(value)
-                    result = celsius_to_kelvin(celsius)
+            if len(values) > 1:
+                results = convert_temperature(np.asarray(values), from_unit, to_unit)
+                self.show_batch_conversion(values, results, from_unit, to_unit, self.temp_result)
+                return
             
+            result = convert_temperature(values[0], from_unit, to_unit)
             self.temp_result.setText(f"{result:.3f}")
             
         except Exception: